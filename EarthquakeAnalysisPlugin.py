@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import os.path
+import time
 from PyQt5 import sip
 
 from qgis.core import (
@@ -8,7 +9,10 @@ from qgis.core import (
     QgsPointXY, QgsField, QgsPalLayerSettings,
     QgsTextFormat, QgsVectorLayerSimpleLabeling, QgsCoordinateReferenceSystem,
     QgsCoordinateTransform, QgsSymbol, QgsRendererRange, QgsGraduatedSymbolRenderer,
-    QgsMarkerSymbol, QgsTextBufferSettings
+    QgsMarkerSymbol, QgsTextBufferSettings, QgsRasterLayer, QgsColorRampShader,
+    QgsRasterShader, QgsSingleBandPseudoColorRenderer, QgsRuleBasedLabeling,
+    QgsProperty, QgsSymbolLayer, QgsMessageLog, QgsDistanceArea, QgsUnitTypes, QgsRectangle,
+    QgsWkbTypes, QgsApplication, QgsTask
 )
 from qgis.PyQt import QtCore, QtWidgets
 from qgis.PyQt.QtGui import QColor, QIcon
@@ -16,8 +20,55 @@ from qgis.PyQt.QtCore import QVariant
 from qgis.utils import iface
 from qgis.gui import QgsProjectionSelectionDialog
 
-# Import the code for the dialog
-from .widgets.EarthquakeAnalysisDialog import EarthquakeAnalysisDialog
+# Hafif modüller; diyalog ve pandas/numpy kullanan analiz modülleri ilgili yöntemlerde yüklenir
+from .widgets.ProfileMapTool import ProfileMapTool
+from .widgets.RegionMapTool import RegionMapTool
+from .processing_provider.provider import EarthquakeProcessingProvider
+from .util.profiling import monitor
+
+# Bu ölçek paydasından daha uzaktan bakıldığında noktalar yerine kümeler gösterilir
+LOD_SCALE_THRESHOLD = 500000
+# Bu ölçek paydasından daha yakından bakıldığında tüm noktalar etiketlenir
+LABEL_SCALE_THRESHOLD = 100000
+# Her ölçekte etiketlenecek en büyük deprem sayısı
+LABEL_TOP_N = 200
+
+# Magnitüd aralıkları ve renkleri (nokta ve küme katmanları ortak kullanır)
+MAGNITUDE_RANGES = [
+    (0, 2, QColor(255, 255, 0, 180)),    # Sarı (düşük risk)
+    (2, 3, QColor(255, 165, 0, 180)),    # Turuncu (orta-düşük risk)
+    (3, 4, QColor(255, 69, 0, 180)),     # Kırmızı-turuncu (orta risk)
+    (4, 5, QColor(255, 0, 0, 180)),      # Kırmızı (yüksek risk)
+    (5, 10, QColor(139, 0, 0, 180))      # Bordo (çok yüksek risk)
+]
+
+
+def run_pga_task(task, cell_x, cell_y, ex, ey, magnitudes, model, cutoff_km, percentile, workers,
+                 region_wkt, geotransform, crs_wkt):
+    """PGA yüzeyini arka planda hesapla ve GeoTIFF'e yaz; iptalde None döner"""
+    import numpy as np
+    from .util.ground_motion import pga_grid
+    from .util.raster import temporary_raster_path, write_geotiff, geometry_mask
+
+    def progress(fraction):
+        task.setProgress(fraction * 100)
+        return not task.isCanceled()
+
+    pga = pga_grid(
+        cell_x, cell_y, ex, ey, magnitudes, model, cutoff_km,
+        percentile=percentile, workers=workers, progress=progress
+    )
+    if pga is None or task.isCanceled():
+        return None
+
+    if region_wkt is not None:
+        inside = geometry_mask(region_wkt, geotransform, pga.shape)
+        pga[~inside] = np.nan
+
+    path = write_geotiff(temporary_raster_path('deprem_pga_'), pga, geotransform, crs_wkt)
+    max_value = float(np.nanmax(pga)) if np.any(np.isfinite(pga)) else 0.0
+    return {'path': path, 'max_value': max_value}
+
 
 # Ana eklenti sınıfı - QGIS ile entegrasyonu sağlar
 class EarthquakeAnalysisPlugin(QtCore.QObject):
@@ -29,6 +80,27 @@ class EarthquakeAnalysisPlugin(QtCore.QObject):
         self.first_start = True
         self.dialog = None
         self._earthquake_layer = None  # Özel değişken olarak tanımla
+        self.density_layer = None
+        self.pga_layer = None
+        self.pga_key = None
+        # Çalışan PGA görevi ve hesapladığı yüzeyin anahtarı
+        self.pga_task = None
+        self.pga_task_key = None
+        # Katmanlardaki Mw değerlerini üreten dönüşüm katsayılarının anahtarı
+        self.magnitude_key = None
+        self.cluster_layer = None
+        self.catalogue_layer = None
+        # Katalog katmanının açıldığı/yenilendiği depo anahtarı
+        self.catalogue_layer_key = None
+        self.profile_tool = None
+        self.profile_action = None
+        self.region_tools = {}  # Mod -> (harita aracı, eylem)
+        self.provider = None
+        # Katmandaki olay kimlikleri (sıralı) ve bunlara karşılık gelen nesne kimlikleri
+        # (None: katmanda henüz nesne yok)
+        self.layer_event_ids = None
+        self.layer_feature_ids = None
+        self._render_start = None
         self.actions = []
         # Layer kaldırıldığında tetiklenecek sinyal bağlantısı
         QgsProject.instance().layerRemoved.connect(self.on_layer_removed)
@@ -59,6 +131,24 @@ class EarthquakeAnalysisPlugin(QtCore.QObject):
             current_layer = self.earthquake_layer
             if current_layer is not None and layer_id == current_layer.id():
                 self.earthquake_layer = None
+                self.reset_layer_features()
+                
+            if self.density_layer is not None and not sip.isdeleted(self.density_layer):
+                if layer_id == self.density_layer.id():
+                    self.density_layer = None
+                    
+            if self.pga_layer is not None and not sip.isdeleted(self.pga_layer):
+                if layer_id == self.pga_layer.id():
+                    self.pga_layer = None
+                    self.pga_key = None
+                    
+            if self.cluster_layer is not None and not sip.isdeleted(self.cluster_layer):
+                if layer_id == self.cluster_layer.id():
+                    self.cluster_layer = None
+
+            if self.catalogue_layer is not None and not sip.isdeleted(self.catalogue_layer):
+                if layer_id == self.catalogue_layer.id():
+                    self.catalogue_layer = None
         except:
             # Herhangi bir hata durumunda referansları temizle
             if hasattr(self.dialog, 'vector_layer'):
@@ -101,8 +191,14 @@ class EarthquakeAnalysisPlugin(QtCore.QObject):
         self.actions.append(action)
         return action
 
+    def initProcessing(self):
+        """Analizleri Processing araç kutusuna kaydet"""
+        self.provider = EarthquakeProcessingProvider()
+        QgsApplication.processingRegistry().addProvider(self.provider)
+
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
+        self.initProcessing()
         icon_path = os.path.join(os.path.dirname(__file__), "resources", "icon", "Pamukkale_University_logo.svg")
         self.add_action(
             icon_path,
@@ -110,94 +206,301 @@ class EarthquakeAnalysisPlugin(QtCore.QObject):
             callback=self.showDialog,
             parent=self.iface.mainWindow())
         
-        # Dialog'u oluştur
-        self.dialog = EarthquakeAnalysisDialog()
-        # Deprem verisi sinyalini bağla
-        self.dialog.earthquakeDataFiltered.connect(self.update_earthquake_points)
+        # Derinlik kesiti aracı - diyalog modal olduğu için araç çubuğundan çalışır
+        self.profile_action = self.add_action(
+            icon_path,
+            text=self.tr("Deprem Kesiti"),
+            callback=self.activate_profile_tool,
+            add_to_toolbar=False,
+            status_tip=self.tr("Haritada iki tıklamayla kesit hattı çizin"),
+            parent=self.iface.mainWindow())
+        self.profile_action.setCheckable(True)
+        self.toolbar.addAction(self.profile_action)
+        
+        # Bölge kaynakları - çizilen çokgen/dikdörtgen/daire ve seçili nesneler
+        region_actions = [
+            (RegionMapTool.POLYGON, self.tr("Bölge: Çokgen Çiz")),
+            (RegionMapTool.RECTANGLE, self.tr("Bölge: Dikdörtgen Çiz")),
+            (RegionMapTool.CIRCLE, self.tr("Bölge: Daire Çiz")),
+        ]
+        for mode, text in region_actions:
+            action = self.add_action(
+                icon_path,
+                text=text,
+                callback=lambda *args, mode=mode: self.activate_region_tool(mode),
+                add_to_toolbar=False,
+                parent=self.iface.mainWindow())
+            action.setCheckable(True)
+            self.toolbar.addAction(action)
+            self.region_tools[mode] = (None, action)
+        selection_action = self.add_action(
+            icon_path,
+            text=self.tr("Bölge: Seçili Nesneler"),
+            callback=self.use_selected_features_as_region,
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow())
+        self.toolbar.addAction(selection_action)
+        
+        # Diyalog (ve pandas/numpy ile analiz modülleri) ilk kullanımda oluşturulur: bkz. dialog_instance
+        
+        # Tuval çizim süresini ölçmek için sinyaller
+        canvas = self.iface.mapCanvas()
+        if canvas:
+            canvas.renderStarting.connect(self.on_render_starting)
+            canvas.mapCanvasRefreshed.connect(self.on_render_finished)
+            
+            self.profile_tool = ProfileMapTool(canvas)
+            self.profile_tool.setAction(self.profile_action)
+            self.profile_tool.profileDrawn.connect(self.on_profile_drawn)
+            
+            for mode, (_, action) in list(self.region_tools.items()):
+                tool = RegionMapTool(canvas, mode)
+                tool.setAction(action)
+                tool.regionDrawn.connect(self.on_region_drawn)
+                self.region_tools[mode] = (tool, action)
         
         # Earthquake layer referansı
         self.earthquake_layer = None
 
+    def on_render_starting(self):
+        """Tuval çizimi başladığında zamanı kaydet"""
+        if monitor.enabled:
+            self._render_start = time.perf_counter()
+
+    def on_render_finished(self):
+        """Tuval çizimi bittiğinde süreyi günlüğe ve panele yaz"""
+        if self._render_start is None:
+            return
+        elapsed = time.perf_counter() - self._render_start
+        self._render_start = None
+        if monitor.enabled:
+            message = f"{'tuval.cizim':28s} {elapsed * 1000:10.1f} ms"
+            QgsMessageLog.logMessage(message, "Deprem Analizi", Qgis.Info)
+            if self.dialog:
+                self.dialog.performanceTextEdit.appendPlainText(message)
+
+    def activate_profile_tool(self, *args):
+        """Derinlik kesiti çizim aracını etkinleştir"""
+        if not self.dialog or self.dialog.earthquake_index is None:
+            self.profile_action.setChecked(False)
+            QtWidgets.QMessageBox.warning(
+                self.iface.mainWindow(),
+                "Uyarı",
+                "Derinlik kesiti için önce deprem verilerini yükleyiniz.",
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+        self.iface.mapCanvas().setMapTool(self.profile_tool)
+
+    def on_profile_drawn(self, start, end):
+        """Çizilen hat boyunca şerit içindeki depremlerin kesit verisini oluştur"""
+        import numpy as np
+        from .util.spatial_index import local_km_coordinates
+        from .util.cross_section import swath_query
+        try:
+            canvas = self.iface.mapCanvas()
+            to_wgs84 = QgsCoordinateTransform(
+                canvas.mapSettings().destinationCrs(),
+                QgsCoordinateReferenceSystem('EPSG:4326'),
+                QgsProject.instance()
+            )
+            start = to_wgs84.transform(start)
+            end = to_wgs84.transform(end)
+            x_km, y_km = local_km_coordinates(
+                np.array([start.x(), end.x()]), np.array([start.y(), end.y()]),
+                self.dialog.projection_origin
+            )
+            half_width = self.dialog.swathWidthSpinBox.value() / 2.0
+
+            # Şerit sorgusu katalog indeksinde, izdüşüm numpy ile yapılır
+            with monitor.stage('kesit.sorgu'):
+                positions, along, offset = swath_query(
+                    self.dialog.earthquake_index, (x_km[0], y_km[0]), (x_km[1], y_km[1]), half_width
+                )
+
+            # Geçerli filtre varsa sadece filtredeki depremler kesite girer
+            catalogue = self.dialog.earthquake_data
+            filtered = self.dialog.get_filtered_earthquake_data()
+            if filtered is not None:
+                keep = np.isin(catalogue.index.values[positions], filtered.index.values)
+                positions, along, offset = positions[keep], along[keep], offset[keep]
+
+            section = catalogue.iloc[positions]
+            self.update_profile_layer(section, along, offset)
+            self.plot_profile(section, along)
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(
+                self.iface.mainWindow(),
+                "Hata",
+                f"Derinlik kesiti oluşturulurken hata oluştu: {str(e)}",
+                QtWidgets.QMessageBox.Ok
+            )
+
+    def update_profile_layer(self, section, along, offset):
+        """Kesit verisini (hat boyunca uzaklık - derinlik) geometrisiz tablo katmanı olarak yaz"""
+        for layer in QgsProject.instance().mapLayersByName("Deprem Kesiti"):
+            QgsProject.instance().removeMapLayer(layer.id())
+
+        uri = ("None?field=eventId:string&field=distance_km:double&field=offset_km:double"
+               "&field=depth:double&field=magnitude:double")
+        layer = QgsVectorLayer(uri, "Deprem Kesiti", "memory")
+        fields = layer.fields()
+        columns = zip(
+            section['eventId'].astype(str).values,
+            along, offset,
+            section['depth'].values.astype(float),
+            section['magnitude'].values.astype(float),
+        )
+        features = []
+        for event_id, distance, side, depth, magnitude in columns:
+            feature = QgsFeature(fields)
+            feature.setAttributes([event_id, float(distance), float(side), float(depth), float(magnitude)])
+            features.append(feature)
+        layer.dataProvider().addFeatures(features)
+        QgsProject.instance().addMapLayer(layer)
+        return layer
+
+    def plot_profile(self, section, along):
+        """matplotlib varsa kesiti çiz; yoksa tablo katmanı ile yetin"""
+        import numpy as np
+        try:
+            import matplotlib.pyplot as plt
+        except ImportError:
+            self.iface.messageBar().pushMessage(
+                "Deprem Analizi",
+                f"Kesit verisi 'Deprem Kesiti' tablosuna yazıldı ({len(section)} deprem).",
+                level=Qgis.Info
+            )
+            return
+
+        magnitudes = section['magnitude'].values
+        figure, axis = plt.subplots(figsize=(9, 4))
+        axis.scatter(along, section['depth'].values, s=4 * np.clip(magnitudes, 0.5, None) ** 2,
+                     c=magnitudes, cmap='YlOrRd', edgecolors='k', linewidths=0.3)
+        axis.invert_yaxis()
+        axis.set_xlabel("Hat boyunca uzaklık (km)")
+        axis.set_ylabel("Derinlik (km)")
+        axis.set_title(f"Derinlik Kesiti ({len(section)} deprem)")
+        figure.tight_layout()
+        plt.show(block=False)
+
+    def activate_region_tool(self, mode):
+        """Bölge çizim aracını etkinleştir"""
+        tool, action = self.region_tools[mode]
+        if tool is not None:
+            self.iface.mapCanvas().setMapTool(tool)
+
+    def on_region_drawn(self, mode, points):
+        """Çizilen bölgeyi diyaloğun bölge kaynağı olarak ayarla"""
+        from .util.region_source import DrawnRegionSource, CircleRegionSource
+        try:
+            crs = self.iface.mapCanvas().mapSettings().destinationCrs()
+            if mode == RegionMapTool.CIRCLE:
+                # Yarıçap elipsoid üzerinde ölçülür
+                distance = QgsDistanceArea()
+                distance.setSourceCrs(crs, QgsProject.instance().transformContext())
+                distance.setEllipsoid(QgsProject.instance().ellipsoid() or 'WGS84')
+                radius_km = distance.convertLengthMeasurement(
+                    distance.measureLine(points[0], points[1]), QgsUnitTypes.DistanceKilometers
+                )
+                source = CircleRegionSource(points[0], crs, radius_km)
+            elif mode == RegionMapTool.RECTANGLE:
+                geometry = QgsGeometry.fromRect(QgsRectangle(points[0], points[1]))
+                source = DrawnRegionSource(geometry, crs, "Çizilen dikdörtgen")
+            else:
+                geometry = QgsGeometry.fromPolygonXY([points])
+                source = DrawnRegionSource(geometry.makeValid(), crs, "Çizilen çokgen")
+            self.dialog_instance().set_region_source(source)
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(
+                self.iface.mainWindow(),
+                "Hata",
+                f"Bölge oluşturulurken hata oluştu: {str(e)}",
+                QtWidgets.QMessageBox.Ok
+            )
+
+    def use_selected_features_as_region(self, *args):
+        """Etkin poligon katmanının seçili nesnelerini bölge olarak kullan"""
+        from .util.region_source import LayerSelectionRegionSource
+        layer = self.iface.activeLayer()
+        if (not isinstance(layer, QgsVectorLayer)
+                or layer.geometryType() != QgsWkbTypes.PolygonGeometry or layer.selectedFeatureCount() == 0):
+            QtWidgets.QMessageBox.warning(
+                self.iface.mainWindow(),
+                "Uyarı",
+                "Lütfen bir poligon katmanında bölge olarak kullanılacak nesneleri seçiniz.",
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+        self.dialog_instance().set_region_source(LayerSelectionRegionSource(layer))
+
     def tr(self, message):
         """Metinleri çevirmek için yardımcı metod"""
         return QtCore.QCoreApplication.translate('EarthquakeAnalysisPlugin', message)
 
+    @monitor.timed('katman.depremler')
     def update_earthquake_points(self, earthquake_data):
-        """Deprem noktalarını güncelle"""
+        """Deprem noktalarını güncelle - kalıcı katmanda sadece değişen olaylar silinir/eklenir"""
         try:
-            # Eğer önceki deprem katmanı varsa kaldır
-            if self.earthquake_layer and not sip.isdeleted(self.earthquake_layer):
-                QgsProject.instance().removeMapLayer(self.earthquake_layer.id())
-                self.earthquake_layer = None
-            
-            # Aynı isimli diğer katmanları da temizle
-            for layer in QgsProject.instance().mapLayersByName("Depremler"):
-                if layer.id() in QgsProject.instance().mapLayers():
-                    QgsProject.instance().removeMapLayer(layer.id())
-            
-            if earthquake_data is not None and not earthquake_data.empty:
-                # Yeni deprem katmanı oluştur
-                uri = "Point?crs=epsg:4326&field=id:integer&field=date:string&field=magnitude:double&field=depth:double&field=area:string"
-                earthquake_layer = QgsVectorLayer(uri, "Depremler", "memory")
-                provider = earthquake_layer.dataProvider()
-                
-                # Özellikleri ekle
-                features = []
-                for idx, row in earthquake_data.iterrows():
-                    feature = QgsFeature()
-                    point = QgsGeometry.fromPointXY(QgsPointXY(float(row['longitude']), float(row['latitude'])))
-                    feature.setGeometry(point)
-                    feature.setAttributes([
-                        int(row['eventId']),
-                        row['eventDate'].strftime('%Y-%m-%d %H:%M:%S'),
-                        float(row['magnitude']),
-                        float(row['depth']),
-                        str(row['area'])
-                    ])
-                    features.append(feature)
-                
-                provider.addFeatures(features)
-                
-                # Stil ayarla
-                symbol = QgsMarkerSymbol.createSimple({
-                    'name': 'circle',
-                    'color': '#FF4136',  # Koyu kırmızı
-                    'size': '3',
-                    'outline_style': 'solid',
-                    'outline_width': '0.5',
-                    'outline_color': '#800000'  # Bordo kenar
-                })
-                earthquake_layer.renderer().setSymbol(symbol)
-                
-                # Etiketleme ayarları
-                label_settings = QgsPalLayerSettings()
-                text_format = QgsTextFormat()
-                text_format.setSize(8)
-                text_format.setColor(QColor(0, 0, 0))  # Siyah metin
-                
-                buffer_settings = QgsTextBufferSettings()
-                buffer_settings.setEnabled(True)
-                buffer_settings.setSize(1)
-                buffer_settings.setColor(QColor(255, 255, 255, 230))  # Yarı saydam beyaz arka plan
-                text_format.setBuffer(buffer_settings)
-                
-                label_settings.setFormat(text_format)
-                label_settings.fieldName = "magnitude"
-                label_settings.placement = QgsPalLayerSettings.OverPoint
-                
-                layer_settings = QgsVectorLayerSimpleLabeling(label_settings)
-                earthquake_layer.setLabeling(layer_settings)
-                earthquake_layer.setLabelsEnabled(True)
-                
-                # Katmanı haritaya ekle
-                QgsProject.instance().addMapLayer(earthquake_layer, False)  # False ile layer tree'ye otomatik eklemeyi engelle
-                
-                # Layer tree'yi al ve deprem katmanını fay hatlarının altına ekle
-                root = QgsProject.instance().layerTreeRoot()
-                root.insertLayer(1, earthquake_layer)  # 1 indeksi ile fay hatlarının altına ekle
-                
-                self.earthquake_layer = earthquake_layer
-                
+            has_data = earthquake_data is not None and not earthquake_data.empty
+
+            # Dönüşüm katsayıları değiştiyse katmanlardaki Mw değerleri eskidir: katmanlar yeniden kurulur
+            if self.dialog and self.magnitude_key != self.dialog.mw_conversion_key():
+                self.remove_earthquake_layer()
+                self.remove_catalogue_layer()
+                self.magnitude_key = self.dialog.mw_conversion_key()
+
+            # Yer hareketi yüzeyi nokta/yoğunluk görünümünden bağımsız ek bir katmandır
+            if self.dialog and self.dialog.pgaCheckBox.isChecked() and has_data:
+                self.update_pga_layer(earthquake_data)
+            else:
+                self.remove_pga_layer()
+
+            # Yoğunluk görünümü seçiliyse nokta yerine raster oluştur
+            if self.dialog and self.dialog.densityCheckBox.isChecked():
+                self.remove_earthquake_layer()
+                self.remove_catalogue_layer()
+                self.remove_cluster_layer()
+                self.remove_density_layer()
+                if has_data:
+                    self.update_density_layer(earthquake_data)
+                return
+
+            self.remove_density_layer()
+
+            # Tek katalog katmanı: sadece alt küme ifadesi değişir
+            # (sadece CSV kaynaklı kataloglarda; servis kataloğu bellekte tutulur)
+            if self.dialog and self.dialog.catalogueSubsetCheckBox.isChecked() and self.dialog.csv_file_path:
+                self.remove_earthquake_layer()
+                self.update_catalogue_subset(earthquake_data if has_data else None)
+                return
+
+            self.remove_catalogue_layer()
+
+            layer = self.earthquake_layer
+            # Koordinat sistemi değiştiyse katman bir kez yeniden kurulur
+            if layer is not None and self.dialog and layer.crs() != self.dialog.target_crs:
+                self.remove_earthquake_layer()
+                layer = None
+            if layer is None:
+                if not has_data:
+                    self.remove_cluster_layer()
+                    return
+                layer = self.add_earthquake_layer()
+
+            # Sonuç boşsa katman korunur, sadece nesneler silinir
+            with monitor.stage('katman.fark'):
+                self.sync_earthquake_features(layer, earthquake_data if has_data else None)
+
+            if has_data:
+                self.ensure_magnitude_style(layer)
+                self.sync_level_of_detail(layer, earthquake_data)
+            else:
+                self.remove_cluster_layer()
+
+            layer.updateExtents()
+            layer.triggerRepaint()
+
         except Exception as e:
             QtWidgets.QMessageBox.critical(
                 None,
@@ -206,8 +509,500 @@ class EarthquakeAnalysisPlugin(QtCore.QObject):
                 QtWidgets.QMessageBox.Ok
             )
 
+    def reset_layer_features(self):
+        """Katmandaki olay kimliklerinin kaydını sıfırla"""
+        self.layer_event_ids = None
+        self.layer_feature_ids = None
+
+    def remove_earthquake_layer(self):
+        """Mevcut deprem katmanını ve aynı isimli katmanları kaldır"""
+        for layer in QgsProject.instance().mapLayersByName("Depremler"):
+            QgsProject.instance().removeMapLayer(layer.id())
+        self.earthquake_layer = None
+        self.reset_layer_features()
+
+    def add_earthquake_layer(self):
+        """Boş ve stillendirilmiş kalıcı deprem katmanını oluşturup projeye ekle"""
+        # Önceki oturumlardan kalan aynı isimli katmanları temizle
+        self.remove_earthquake_layer()
+
+        layer = self.new_earthquake_layer(self.dialog.target_crs)
+        self.style_earthquake_layer(layer)
+
+        # Katmanı haritaya ekle
+        QgsProject.instance().addMapLayer(layer, False)  # False ile layer tree'ye otomatik eklemeyi engelle
+
+        # Layer tree'yi al ve deprem katmanını fay hatlarının altına ekle
+        root = QgsProject.instance().layerTreeRoot()
+        root.insertLayer(1, layer)  # 1 indeksi ile fay hatlarının altına ekle
+
+        self.earthquake_layer = layer
+        return layer
+
+    def sync_earthquake_features(self, layer, earthquake_data):
+        """Eski ve yeni olay kimlik kümelerini karşılaştırıp sadece farkı katmana uygula"""
+        import numpy as np
+        if earthquake_data is None:
+            new_ids = np.empty(0, dtype=np.int64)
+        else:
+            new_ids = earthquake_data['eventId'].values.astype(np.int64)
+
+        if self.layer_event_ids is None:
+            self.layer_event_ids = np.empty(0, dtype=np.int64)
+            self.layer_feature_ids = np.empty(0, dtype=np.int64)
+        old_ids = self.layer_event_ids
+        old_fids = self.layer_feature_ids
+        keep = np.isin(old_ids, new_ids)
+        added = ~np.isin(new_ids, old_ids)
+
+        provider = layer.dataProvider()
+        removed_fids = old_fids[~keep]
+        if len(removed_fids):
+            provider.deleteFeatures([int(fid) for fid in removed_fids])
+
+        added_fids = np.empty(0, dtype=np.int64)
+        if added.any():
+            with monitor.stage('katman.nesneler'):
+                features = self.build_earthquake_features(layer, earthquake_data[added])
+                success, features = provider.addFeatures(features)
+            if not success:
+                raise RuntimeError("Deprem nesneleri katmana eklenemedi")
+            added_fids = np.array([feature.id() for feature in features], dtype=np.int64)
+
+        event_ids = np.concatenate((old_ids[keep], new_ids[added]))
+        feature_ids = np.concatenate((old_fids[keep], added_fids))
+        order = np.argsort(event_ids, kind='stable')
+        self.layer_event_ids = event_ids[order]
+        self.layer_feature_ids = feature_ids[order]
+
+        monitor.count('katman.silinen', len(removed_fids))
+        monitor.count('katman.eklenen', len(added_fids))
+
+    def build_earthquake_features(self, layer, earthquake_data):
+        """Deprem satırlarından katman alanlarına uygun nesneler oluştur"""
+        from .util.magnitude import HARMONIZED_COLUMN
+        fields = layer.fields()
+        target_crs = layer.crs()
+        transform = None
+        if target_crs.authid() != 'EPSG:4326':
+            transform = QgsCoordinateTransform(
+                QgsCoordinateReferenceSystem('EPSG:4326'), target_crs, QgsProject.instance()
+            )
+
+        # Sütunlar satır satır yerine bir kerede dizilere alınır
+        columns = zip(
+            earthquake_data['eventId'].astype(str).values,
+            earthquake_data['eventDate'].dt.strftime('%Y-%m-%d %H:%M:%S').values,
+            earthquake_data['depth'].values.astype(float),
+            earthquake_data['magnitudeType'].astype(str).values,
+            earthquake_data['magnitude'].values.astype(float),
+            earthquake_data['area'].astype(str).values,
+            earthquake_data[HARMONIZED_COLUMN].values.astype(float),
+            earthquake_data['longitude'].values.astype(float),
+            earthquake_data['latitude'].values.astype(float),
+        )
+
+        features = []
+        for event_id, date, depth, magnitude_type, magnitude, area, mw, lon, lat in columns:
+            feature = QgsFeature(fields)
+            # WGS84'ten seçili koordinat sistemine dönüşüm yap
+            point = QgsPointXY(lon, lat)
+            if transform is not None:
+                point = transform.transform(point)
+            feature.setGeometry(QgsGeometry.fromPointXY(point))
+            feature.setAttributes([event_id, date, float(depth), magnitude_type, float(magnitude), area, float(mw)])
+            features.append(feature)
+        return features
+
+    def sync_level_of_detail(self, layer, earthquake_data):
+        """Ölçeğe bağlı gösterimi mevcut etiketlemeyi koruyarak güncelle"""
+        from .util.lod import top_n_threshold
+        labeling = layer.labeling()
+        rule_based = isinstance(labeling, QgsRuleBasedLabeling)
+
+        if self.dialog and self.dialog.lodCheckBox.isChecked():
+            field = self.dialog.magnitude_column()
+            magnitude_threshold = top_n_threshold(earthquake_data[field].values, LABEL_TOP_N)
+            if rule_based:
+                # Sadece en büyük N deprem kuralının eşiği değişir
+                top_rule = labeling.rootRule().children()[0]
+                top_rule.setFilterExpression(f"\"{field}\" >= {magnitude_threshold}")
+            else:
+                self.apply_level_of_detail(layer, labeling.settings(), magnitude_threshold)
+            self.update_cluster_layer(earthquake_data)
+        else:
+            if rule_based:
+                # Basit etiketlemeye geri dön
+                label_settings = QgsPalLayerSettings(labeling.rootRule().children()[0].settings())
+                layer.setLabeling(QgsVectorLayerSimpleLabeling(label_settings))
+                layer.setLabelsEnabled(True)
+                layer.setScaleBasedVisibility(False)
+            self.remove_cluster_layer()
+
+    def ensure_magnitude_style(self, layer):
+        """Ham/Mw seçimi değiştiyse stil ve etiketler seçili sütunla yeniden kurulur (veri yeniden hesaplanmaz)"""
+        renderer = layer.renderer()
+        if isinstance(renderer, QgsGraduatedSymbolRenderer) and renderer.classAttribute() != self.dialog.magnitude_column():
+            self.style_earthquake_layer(layer)
+
+    def remove_catalogue_layer(self):
+        """Mevcut katalog katmanını kaldır"""
+        for layer in QgsProject.instance().mapLayersByName("Deprem Kataloğu"):
+            QgsProject.instance().removeMapLayer(layer.id())
+        self.catalogue_layer = None
+        self.catalogue_layer_key = None
+
+    @monitor.timed('katman.katalog')
+    def update_catalogue_subset(self, earthquake_data):
+        """Tüm kataloğu tutan GeoPackage katmanının alt küme ifadesini filtre sonucuna göre ayarla"""
+        from .util.catalogue_store import CATALOGUE_LAYER, catalogue_store_path, catalogue_subset_string
+        layer = self.catalogue_layer
+        # Farklı bir CSV yüklendiyse katman yeni katalogla açılır
+        if layer is not None and not layer.source().startswith(catalogue_store_path(self.dialog.csv_file_path)):
+            self.remove_catalogue_layer()
+            layer = None
+        # Katalog yeniden yüklendiyse (ör. dosya baştan yazıldı) depo ve katman yeniden kurulur
+        if layer is not None and self.dialog.stored_catalogue_key != self.dialog.catalogue_store_key():
+            self.remove_catalogue_layer()
+            layer = None
+        if layer is None:
+            if earthquake_data is None:
+                self.remove_cluster_layer()
+                return
+            path = self.dialog.ensure_catalogue_store()
+            layer = QgsVectorLayer(f"{path}|layername={CATALOGUE_LAYER}", "Deprem Kataloğu", "ogr")
+            if not layer.isValid():
+                raise Exception(f"Katalog katmanı açılamadı: {path}")
+            self.style_earthquake_layer(layer)
+            QgsProject.instance().addMapLayer(layer, False)
+            QgsProject.instance().layerTreeRoot().insertLayer(1, layer)
+            self.catalogue_layer = layer
+        elif self.catalogue_layer_key != self.dialog.stored_catalogue_key:
+            # Depoya yeni olaylar eklendi: sağlayıcı nesne sayısını ve kapsamı yeniden okur
+            layer.dataProvider().reloadData()
+            layer.updateExtents()
+        self.catalogue_layer_key = self.dialog.stored_catalogue_key
+
+        # Filtreleme sağlayıcıda indekslerle yapılır, Python nesne oluşturmaz
+        with monitor.stage('katman.ifade'):
+            layer.setSubsetString(catalogue_subset_string(catalogue_store_path(self.dialog.csv_file_path), earthquake_data))
+
+        if earthquake_data is not None:
+            self.ensure_magnitude_style(layer)
+            self.sync_level_of_detail(layer, earthquake_data)
+        else:
+            self.remove_cluster_layer()
+        layer.triggerRepaint()
+
+    def apply_level_of_detail(self, layer, label_settings, magnitude_threshold):
+        """Nokta katmanına ölçeğe bağlı görünürlük ve sınırlı etiketleme uygula"""
+        # Noktalar sadece eşik ölçeğinden daha yakında çizilir
+        layer.setScaleBasedVisibility(True)
+        layer.setMinimumScale(LOD_SCALE_THRESHOLD)
+        layer.setMaximumScale(0)
+
+        # Etiketler: en büyük N deprem her zaman, diğerleri sadece yakın ölçekte
+        root_rule = QgsRuleBasedLabeling.Rule(None)
+        root_rule.appendChild(QgsRuleBasedLabeling.Rule(
+            QgsPalLayerSettings(label_settings), 0, 0,
+            f"\"{self.dialog.magnitude_column()}\" >= {magnitude_threshold}", "En büyük depremler"
+        ))
+        root_rule.appendChild(QgsRuleBasedLabeling.Rule(
+            QgsPalLayerSettings(label_settings), 0, LABEL_SCALE_THRESHOLD,
+            "", "Yakın ölçek", True
+        ))
+        layer.setLabeling(QgsRuleBasedLabeling(root_rule))
+        layer.setLabelsEnabled(True)
+
+    def remove_cluster_layer(self):
+        """Mevcut küme katmanını kaldır"""
+        for layer in QgsProject.instance().mapLayersByName("Deprem Kümeleri"):
+            QgsProject.instance().removeMapLayer(layer.id())
+        self.cluster_layer = None
+
+    @monitor.timed('katman.kumeler')
+    def update_cluster_layer(self, earthquake_data):
+        """Küçük ölçekler için ızgarada toplanmış deprem kümelerini oluştur"""
+        from .util.lod import cluster_cell_size, grid_aggregate
+        self.remove_cluster_layer()
+
+        longitudes = earthquake_data['longitude'].values
+        latitudes = earthquake_data['latitude'].values
+        region = self.dialog.cached_region_geometry if self.dialog else None
+        if region is not None and not region.isEmpty():
+            bbox = region.boundingBox()
+            extent = (bbox.xMinimum(), bbox.yMinimum(), bbox.xMaximum(), bbox.yMaximum())
+        else:
+            extent = (longitudes.min(), latitudes.min(), longitudes.max(), latitudes.max())
+
+        # Küme sayısı ızgara boyutu ile sınırlıdır; olay sayısından bağımsızdır
+        center_lon, center_lat, counts, max_magnitude = grid_aggregate(
+            longitudes, latitudes, earthquake_data[self.dialog.magnitude_column()].values, cluster_cell_size(extent)
+        )
+
+        uri = "Point?crs=epsg:4326&field=count:integer&field=max_magnitude:double"
+        cluster_layer = QgsVectorLayer(uri, "Deprem Kümeleri", "memory")
+        features = []
+        for x, y, count, magnitude in zip(center_lon, center_lat, counts, max_magnitude):
+            feature = QgsFeature()
+            feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(float(x), float(y))))
+            feature.setAttributes([int(count), float(magnitude)])
+            features.append(feature)
+        cluster_layer.dataProvider().addFeatures(features)
+        cluster_layer.updateExtents()
+
+        # Renk en büyük magnitüde, boyut olay sayısına göre
+        ranges = []
+        for min_mag, max_mag, color in MAGNITUDE_RANGES:
+            symbol = QgsMarkerSymbol.createSimple({
+                'name': 'circle',
+                'outline_style': 'solid',
+                'outline_width': '0.4',
+                'outline_color': '64,64,64,255'
+            })
+            symbol.setColor(color)
+            symbol.symbolLayer(0).setDataDefinedProperty(
+                QgsSymbolLayer.PropertySize,
+                QgsProperty.fromExpression('2 + 1.5 * ln("count")')
+            )
+            ranges.append(QgsRendererRange(min_mag, max_mag, symbol, f"{min_mag}-{max_mag}"))
+        renderer = QgsGraduatedSymbolRenderer('max_magnitude', ranges)
+        renderer.setMode(QgsGraduatedSymbolRenderer.Custom)
+        cluster_layer.setRenderer(renderer)
+
+        # Küme etiketleri olay sayısını gösterir
+        label_settings = QgsPalLayerSettings()
+        text_format = QgsTextFormat()
+        text_format.setSize(7)
+        text_format.setColor(QColor(0, 0, 0))
+        label_settings.setFormat(text_format)
+        label_settings.fieldName = "count"
+        label_settings.placement = QgsPalLayerSettings.OverPoint
+        cluster_layer.setLabeling(QgsVectorLayerSimpleLabeling(label_settings))
+        cluster_layer.setLabelsEnabled(True)
+
+        # Kümeler sadece eşik ölçeğinden daha uzakta çizilir
+        cluster_layer.setScaleBasedVisibility(True)
+        cluster_layer.setMinimumScale(0)
+        cluster_layer.setMaximumScale(LOD_SCALE_THRESHOLD)
+
+        QgsProject.instance().addMapLayer(cluster_layer, False)
+        root = QgsProject.instance().layerTreeRoot()
+        root.insertLayer(1, cluster_layer)
+        self.cluster_layer = cluster_layer
+
+    def remove_density_layer(self):
+        """Mevcut yoğunluk katmanını kaldır"""
+        for layer in QgsProject.instance().mapLayersByName("Deprem Yoğunluğu"):
+            QgsProject.instance().removeMapLayer(layer.id())
+        self.density_layer = None
+
+    @monitor.timed('katman.yogunluk')
+    def update_density_layer(self, earthquake_data):
+        """Filtrelenmiş depremlerden çekirdek yoğunluk (KDE) rasterı oluştur"""
+        import numpy as np
+        from .util.density import kernel_density
+        from .util.raster import temporary_raster_path, write_geotiff, geometry_mask
+        region = self.dialog.cached_region_geometry
+        if region is not None and not region.isEmpty():
+            bbox = region.boundingBox()
+            extent = (bbox.xMinimum(), bbox.yMinimum(), bbox.xMaximum(), bbox.yMaximum())
+        else:
+            longitudes = earthquake_data['longitude'].values
+            latitudes = earthquake_data['latitude'].values
+            extent = (longitudes.min(), latitudes.min(), longitudes.max(), latitudes.max())
+
+        # Hücre boyutu bant genişliğine göre seçilir, ızgara boyutu sınırlıdır
+        bandwidth_km = self.dialog.densityBandwidthSpinBox.value()
+        cell_size_km = max(0.5, bandwidth_km / 4.0) if bandwidth_km > 0 else 1.0
+
+        density, geotransform = kernel_density(
+            earthquake_data['longitude'].values,
+            earthquake_data['latitude'].values,
+            extent,
+            cell_size_km=cell_size_km,
+            bandwidth_km=bandwidth_km
+        )
+
+        # Bölge dışındaki hücreleri boşalt
+        if region is not None and not region.isEmpty():
+            inside = geometry_mask(region.asWkt(), geotransform, density.shape)
+            density[~inside] = np.nan
+
+        wgs84 = QgsCoordinateReferenceSystem('EPSG:4326')
+        path = write_geotiff(temporary_raster_path('deprem_yogunluk_'), density, geotransform, wgs84.toWkt())
+
+        layer = QgsRasterLayer(path, "Deprem Yoğunluğu", "gdal")
+        if not layer.isValid():
+            raise Exception("Yoğunluk rasterı yüklenemedi")
+
+        max_value = float(np.nanmax(density)) if np.any(np.isfinite(density)) else 0.0
+        self.style_density_layer(layer, max_value)
+
+        QgsProject.instance().addMapLayer(layer, False)
+        root = QgsProject.instance().layerTreeRoot()
+        root.insertLayer(1, layer)  # Fay hatlarının altına ekle
+        self.density_layer = layer
+
+    def style_density_layer(self, layer, max_value):
+        """Yoğunluk rasterına sarıdan bordoya renk rampası uygula"""
+        ramp = QgsColorRampShader()
+        ramp.setColorRampType(QgsColorRampShader.Interpolated)
+        ramp.setColorRampItemList([
+            QgsColorRampShader.ColorRampItem(0, QColor(255, 255, 0, 0), "0"),
+            QgsColorRampShader.ColorRampItem(max_value * 0.25, QColor(255, 165, 0, 160), ""),
+            QgsColorRampShader.ColorRampItem(max_value * 0.5, QColor(255, 69, 0, 200), ""),
+            QgsColorRampShader.ColorRampItem(max_value, QColor(139, 0, 0, 230), f"{max_value:.3f} olay/km²")
+        ])
+
+        shader = QgsRasterShader()
+        shader.setRasterShaderFunction(ramp)
+        renderer = QgsSingleBandPseudoColorRenderer(layer.dataProvider(), 1, shader)
+        layer.setRenderer(renderer)
+        layer.triggerRepaint()
+
+    def remove_pga_layer(self):
+        """Mevcut yer hareketi katmanını kaldır ve çalışan PGA görevini iptal et"""
+        self.cancel_pga_task()
+        for layer in QgsProject.instance().mapLayersByName("Yer Hareketi (PGA)"):
+            QgsProject.instance().removeMapLayer(layer.id())
+        self.pga_layer = None
+        self.pga_key = None
+
+    def cancel_pga_task(self):
+        """Çalışan PGA görevini iptal et; sonucu artık katmana eklenmez"""
+        if self.pga_task is not None:
+            self.pga_task.cancel()
+        self.pga_task = None
+        self.pga_task_key = None
+
+    @monitor.timed('katman.pga')
+    def update_pga_layer(self, earthquake_data):
+        """Tamponlu bölgeyi kaplayan ızgarada azalım ilişkisiyle PGA yüzeyini arka planda oluştur"""
+        import numpy as np
+        from .util.density import grid_shape, cell_centers
+        from .util.magnitude import HARMONIZED_COLUMN
+        from .util.spatial_index import local_km_coordinates
+        dialog = self.dialog
+        if dialog.earthquake_xy_km is None:
+            return
+        parameters = dialog.pga_parameters()
+        model, cutoff_km, cell_size_km, percentile = parameters
+
+        # Filtre ve parametreler değişmediyse (ör. sadece görünüm değişti) yüzey yeniden hesaplanmaz
+        key = (getattr(dialog, 'cached_params', None), len(dialog.earthquake_data), parameters)
+        if self.pga_layer is not None and not sip.isdeleted(self.pga_layer) and self.pga_key == key:
+            monitor.cache_hit('pga.yuzey')
+            return
+        if self.pga_task is not None and self.pga_task_key == key:
+            # Aynı yüzey zaten hesaplanıyor
+            return
+        monitor.cache_miss('pga.yuzey')
+        self.remove_pga_layer()
+
+        region = dialog.cached_region_geometry
+        if region is not None and not region.isEmpty():
+            bbox = region.boundingBox()
+            extent = (bbox.xMinimum(), bbox.yMinimum(), bbox.xMaximum(), bbox.yMaximum())
+            region_wkt = region.asWkt()
+        else:
+            longitudes = earthquake_data['longitude'].values
+            latitudes = earthquake_data['latitude'].values
+            extent = (longitudes.min(), latitudes.min(), longitudes.max(), latitudes.max())
+            region_wkt = None
+
+        rows, cols, dx, dy = grid_shape(extent, cell_size_km)
+        geotransform = (extent[0], dx, 0.0, extent[1] + rows * dy, 0.0, -dy)
+        lon, lat = cell_centers(geotransform, rows, cols)
+        cell_x, cell_y = local_km_coordinates(lon, lat, dialog.projection_origin)
+
+        # Bölge dışındaki depremler de kesme uzaklığı içindeyse katkı verir: öznitelik filtresi tüm katalogda uygulanır
+        mask = dialog.current_attribute_mask(dialog.earthquake_data)
+        monitor.count('pga.hucre', rows * cols)
+        monitor.count('pga.deprem', int(np.count_nonzero(mask)))
+
+        # Görev maskelenmiş kopyalarla çalışır; diyalogdaki veriler hesap sürerken değişebilir
+        task = QgsTask.fromFunction(
+            "PGA yüzeyi hesaplanıyor",
+            run_pga_task,
+            cell_x, cell_y,
+            dialog.earthquake_xy_km[0][mask], dialog.earthquake_xy_km[1][mask],
+            # Azalım ilişkileri moment magnitüdüyle tanımlıdır; yüklemede dönüştürülmüş sütun kullanılır
+            dialog.earthquake_data[HARMONIZED_COLUMN].values[mask],
+            model, cutoff_km, percentile, dialog.pgaWorkersSpinBox.value(),
+            region_wkt, geotransform, QgsCoordinateReferenceSystem('EPSG:4326').toWkt(),
+            on_finished=lambda exception, result=None: self.on_pga_finished(task, key, exception, result)
+        )
+        self.pga_task = task
+        self.pga_task_key = key
+        QgsApplication.taskManager().addTask(task)
+
+    def on_pga_finished(self, task, key, exception, result=None):
+        """PGA görevi bittiğinde rasterı katman olarak ekle"""
+        if task is not self.pga_task:
+            # İptal edilmiş veya yerine yenisi başlatılmış görev
+            return
+        self.pga_task = None
+        self.pga_task_key = None
+        if exception is not None:
+            QtWidgets.QMessageBox.critical(
+                self.iface.mainWindow(),
+                "Hata",
+                f"PGA yüzeyi oluşturulurken hata oluştu: {str(exception)}",
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+        if result is None:
+            return
+
+        layer = QgsRasterLayer(result['path'], "Yer Hareketi (PGA)", "gdal")
+        if not layer.isValid():
+            QtWidgets.QMessageBox.critical(
+                self.iface.mainWindow(),
+                "Hata",
+                "PGA rasterı yüklenemedi",
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+        self.style_pga_layer(layer, result['max_value'])
+
+        QgsProject.instance().addMapLayer(layer, False)
+        root = QgsProject.instance().layerTreeRoot()
+        root.insertLayer(1, layer)
+        self.pga_layer = layer
+        self.pga_key = key
+
+    def style_pga_layer(self, layer, max_value):
+        """PGA rasterına yeşilden bordoya renk rampası uygula (g)"""
+        ramp = QgsColorRampShader()
+        ramp.setColorRampType(QgsColorRampShader.Interpolated)
+        ramp.setColorRampItemList([
+            QgsColorRampShader.ColorRampItem(0, QColor(26, 150, 65, 120), "0 g"),
+            QgsColorRampShader.ColorRampItem(max_value * 0.33, QColor(255, 255, 0, 170), ""),
+            QgsColorRampShader.ColorRampItem(max_value * 0.66, QColor(255, 69, 0, 200), ""),
+            QgsColorRampShader.ColorRampItem(max_value, QColor(128, 0, 38, 230), f"{max_value:.3f} g")
+        ])
+
+        shader = QgsRasterShader()
+        shader.setRasterShaderFunction(ramp)
+        renderer = QgsSingleBandPseudoColorRenderer(layer.dataProvider(), 1, shader)
+        layer.setRenderer(renderer)
+        layer.triggerRepaint()
+
     def unload(self):
         """Eklentiyi kaldır"""
+        canvas = self.iface.mapCanvas()
+        if canvas:
+            if self.profile_tool is not None and canvas.mapTool() == self.profile_tool:
+                canvas.unsetMapTool(self.profile_tool)
+            for tool, _ in self.region_tools.values():
+                if tool is not None and canvas.mapTool() == tool:
+                    canvas.unsetMapTool(tool)
+            try:
+                canvas.renderStarting.disconnect(self.on_render_starting)
+                canvas.mapCanvasRefreshed.disconnect(self.on_render_finished)
+            except TypeError:
+                pass
         for action in self.actions:
             self.iface.removePluginMenu(
                 'Deprem Analizi',
@@ -215,15 +1010,14 @@ class EarthquakeAnalysisPlugin(QtCore.QObject):
             self.iface.removeToolBarIcon(action)
         if hasattr(self, 'toolbar'):
             del self.toolbar
+        self.cancel_pga_task()
+        if self.provider is not None:
+            QgsApplication.processingRegistry().removeProvider(self.provider)
+            self.provider = None
 
-    def create_earthquake_layer(self, earthquake_data):
-        """Deprem verilerinden nokta katmanı oluştur"""
-        if earthquake_data is None or earthquake_data.empty:
-            return None
-
-        # Seçili koordinat sistemini al
-        target_crs = self.dialog.target_crs
-
+    def new_earthquake_layer(self, target_crs):
+        """Deprem alanlarıyla boş bir nokta katmanı oluştur"""
+        from .util.magnitude import HARMONIZED_COLUMN
         # Geçici memory layer oluştur
         layer_name = "Depremler"
         layer = QgsVectorLayer(f"Point?crs={target_crs.authid()}", layer_name, "memory")
@@ -236,44 +1030,36 @@ class EarthquakeAnalysisPlugin(QtCore.QObject):
             QgsField("depth", QVariant.Double),
             QgsField("magnitudeType", QVariant.String),
             QgsField("magnitude", QVariant.Double),
-            QgsField("area", QVariant.String)
+            QgsField("area", QVariant.String),
+            QgsField(HARMONIZED_COLUMN, QVariant.Double)
         ]
         provider.addAttributes(fields)
         layer.updateFields()
+        return layer
 
-        # Özellikleri ekle
-        features = []
-        source_crs = QgsCoordinateReferenceSystem('EPSG:4326')
-        transform = QgsCoordinateTransform(source_crs, target_crs, QgsProject.instance())
-        
-        for _, row in earthquake_data.iterrows():
-            feat = QgsFeature()
-            # WGS84'ten seçili koordinat sistemine dönüşüm yap
-            point = QgsPointXY(float(row['longitude']), float(row['latitude']))
-            if target_crs.authid() != 'EPSG:4326':
-                transformed_point = transform.transform(point)
-                feat.setGeometry(QgsGeometry.fromPointXY(transformed_point))
-            else:
-                feat.setGeometry(QgsGeometry.fromPointXY(point))
-            
-            feat.setAttributes([
-                str(row['eventId']),
-                str(row['eventDate']),
-                float(row['depth']),
-                str(row['magnitudeType']),
-                float(row['magnitude']),
-                str(row['area'])
-            ])
-            features.append(feat)
-
-        provider.addFeatures(features)
+    @monitor.timed('katman.olusturma')
+    def create_earthquake_layer(self, earthquake_data):
+        """Deprem verilerinden nokta katmanı oluştur"""
+        if earthquake_data is None or earthquake_data.empty:
+            return None
+
+        # Seçili koordinat sistemini al
+        layer = self.new_earthquake_layer(self.dialog.target_crs)
+        layer.dataProvider().addFeatures(self.build_earthquake_features(layer, earthquake_data))
         layer.updateExtents()
         return layer
 
-    def showDialog(self):
-        if not self.dialog:
+    def dialog_instance(self):
+        """Diyaloğu ilk ihtiyaçta oluştur; ağır modüller QGIS açılışında değil bu noktada yüklenir"""
+        if self.dialog is None:
+            from .widgets.EarthquakeAnalysisDialog import EarthquakeAnalysisDialog
             self.dialog = EarthquakeAnalysisDialog(self.iface.mainWindow())
-            
+            # Deprem verisi sinyalini bağla
+            self.dialog.earthquakeDataFiltered.connect(self.update_earthquake_points)
+        return self.dialog
+
+    def showDialog(self):
+        self.dialog_instance()
         self.dialog.show()
         result = self.dialog.exec_()
         
@@ -292,22 +1078,8 @@ class EarthquakeAnalysisPlugin(QtCore.QObject):
                     # Katmanı projeye ekle
                     QgsProject.instance().addMapLayer(self.dialog.vector_layer)
 
-                # Deprem verilerini işle (eğer varsa)
-                filtered_earthquake_data = self.dialog.apply_earthquake_filter()
-                if filtered_earthquake_data is not None:
-                    # Eğer önceki deprem katmanı varsa kaldır
-                    current_layer = self.earthquake_layer
-                    if current_layer is not None:
-                        QgsProject.instance().removeMapLayer(current_layer.id())
-                        self.earthquake_layer = None
-
-                    # Yeni deprem katmanını oluştur ve ekle
-                    new_layer = self.create_earthquake_layer(filtered_earthquake_data)
-                    if new_layer and new_layer.isValid():
-                        self.earthquake_layer = new_layer
-                        QgsProject.instance().addMapLayer(new_layer)
-                        # Stil ayarlarını yap
-                        self.style_earthquake_layer(new_layer)
+                # Deprem verilerini işle (eğer varsa) - katman filtre sinyaliyle yerinde güncellenir
+                self.dialog.apply_earthquake_filter()
             except Exception as e:
                 # Hata durumunda kullanıcıyı bilgilendir
                 QtWidgets.QMessageBox.critical(
@@ -317,24 +1089,15 @@ class EarthquakeAnalysisPlugin(QtCore.QObject):
                     QtWidgets.QMessageBox.Ok
                 )
 
+    @monitor.timed('katman.stil')
     def style_earthquake_layer(self, layer):
         """Deprem katmanına stil uygula"""
         if not layer or not self.dialog:
             return
 
-        # Özel stil ayarlarını uygula
-        # Sabit büyüklük aralıkları ve renkler tanımla
-        magnitude_ranges = [
-            (0, 2, QColor(255, 255, 0, 180)),    # Sarı (düşük risk)
-            (2, 3, QColor(255, 165, 0, 180)),    # Turuncu (orta-düşük risk)
-            (3, 4, QColor(255, 69, 0, 180)),     # Kırmızı-turuncu (orta risk)
-            (4, 5, QColor(255, 0, 0, 180)),      # Kırmızı (yüksek risk)
-            (5, 10, QColor(139, 0, 0, 180))      # Bordo (çok yüksek risk)
-        ]
-
-        # Graduated Symbol Renderer oluştur
+        # Graduated Symbol Renderer oluştur - sabit büyüklük aralıkları ve renkler
         ranges = []
-        for min_mag, max_mag, color in magnitude_ranges:
+        for min_mag, max_mag, color in MAGNITUDE_RANGES:
             symbol = QgsSymbol.defaultSymbol(layer.geometryType())
             # Sembol rengini ayarla
             symbol.setColor(color)
@@ -349,23 +1112,29 @@ class EarthquakeAnalysisPlugin(QtCore.QObject):
             magnitude_range = QgsRendererRange(min_mag, max_mag, symbol, range_label)
             ranges.append(magnitude_range)
 
-        renderer = QgsGraduatedSymbolRenderer('magnitude', ranges)
+        # Ham magnitüd veya dönüştürülmüş Mw sütunu
+        field = self.dialog.magnitude_column()
+        renderer = QgsGraduatedSymbolRenderer(field, ranges)
         renderer.setMode(QgsGraduatedSymbolRenderer.Custom)  # Custom mod kullan
         layer.setRenderer(renderer)
 
         # Etiket ayarları
         layer_settings = QgsPalLayerSettings()
-        layer_settings.fieldName = 'magnitude'
+        layer_settings.fieldName = field
         layer_settings.enabled = True
-        layer_settings.placement = QgsPalLayerSettings.AroundPoint
-        layer_settings.dist = 2
+        layer_settings.placement = QgsPalLayerSettings.OverPoint
 
         text_format = QgsTextFormat()
         text_format.setSize(8)
         text_format.setColor(QColor(0, 0, 0))  # Siyah metin rengi
+
+        buffer_settings = QgsTextBufferSettings()
+        buffer_settings.setEnabled(True)
+        buffer_settings.setSize(1)
+        buffer_settings.setColor(QColor(255, 255, 255, 230))  # Yarı saydam beyaz arka plan
+        text_format.setBuffer(buffer_settings)
         layer_settings.setFormat(text_format)
 
+        # Ölçeğe bağlı etiketleme veri geldiğinde sync_level_of_detail ile kurulur
         layer.setLabeling(QgsVectorLayerSimpleLabeling(layer_settings))
         layer.setLabelsEnabled(True)
-
-        layer.triggerRepaint()
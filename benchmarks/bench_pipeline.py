@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""Filtre hattı için başsız (headless) PyQGIS kıyaslama aracı.
+
+Kullanım:
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_pipeline --rows 10000 100000 1000000 --output sonuc.json
+    python -m benchmarks.bench_pipeline --compare eski.json yeni.json
+"""
+
+import argparse
+import importlib
+import importlib.util
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+if __package__:
+    from . import synthetic
+else:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import synthetic
+
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_NAME = 'pau_earthquake_analysis'
+
+DEFAULT_ROWS = [10000, 100000, 1000000]
+SETTLEMENT_COUNT = 20000
+FAULT_COUNT = 500
+
+
+def import_plugin_module(name):
+    """Eklenti paketini dizin adından bağımsız olarak içe aktar"""
+    if PACKAGE_NAME not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            PACKAGE_NAME,
+            os.path.join(PLUGIN_DIR, '__init__.py'),
+            submodule_search_locations=[PLUGIN_DIR]
+        )
+        package = importlib.util.module_from_spec(spec)
+        sys.modules[PACKAGE_NAME] = package
+        spec.loader.exec_module(package)
+    return importlib.import_module(f"{PACKAGE_NAME}.{name}")
+
+
+def plugin_version():
+    """metadata.txt içindeki sürümü oku"""
+    with open(os.path.join(PLUGIN_DIR, 'metadata.txt'), encoding='utf-8') as handle:
+        for line in handle:
+            if line.startswith('version='):
+                return line.split('=', 1)[1].strip()
+    return 'bilinmiyor'
+
+
+def silence_message_boxes():
+    """Başsız çalışmada modal mesaj kutularının akışı durdurmasını engelle"""
+    from qgis.PyQt import QtWidgets
+    for name in ('information', 'warning', 'critical', 'question'):
+        setattr(QtWidgets.QMessageBox, name, staticmethod(lambda *args, **kwargs: QtWidgets.QMessageBox.Ok))
+
+
+def measure(function, repeat):
+    """Fonksiyonu repeat kez çalıştırıp süreleri, son çalıştırmanın alt aşamalarını ve sonucu döndür"""
+    monitor = import_plugin_module('util.profiling').monitor
+    runs = []
+    result = None
+    for _ in range(repeat):
+        monitor.reset()
+        start = time.perf_counter()
+        result = function()
+        runs.append(time.perf_counter() - start)
+    ordered = sorted(runs)
+    return {
+        'min': ordered[0],
+        'median': ordered[len(ordered) // 2],
+        'runs': runs,
+        'substages': monitor.snapshot(),
+    }, result
+
+
+def select_region(dialog, il, ilce):
+    """Sinyalleri tetiklemeden il/ilçe seçimini yap"""
+    for combo, value in ((dialog.ilComboBox, il), (dialog.ilceComboBox, ilce)):
+        combo.blockSignals(True)
+        if combo.findText(value) < 0:
+            combo.addItem(value)
+        combo.setCurrentText(value)
+        combo.blockSignals(False)
+
+
+def run_size(rows, workdir, repeat):
+    """Verilen satır sayısı için tüm aşamaları ölç"""
+    dialog_module = import_plugin_module('widgets.EarthquakeAnalysisDialog')
+    plugin_module = import_plugin_module('EarthquakeAnalysisPlugin')
+    from qgis.core import QgsProject
+
+    csv_path = os.path.join(workdir, f"depremler_{rows}.csv")
+    if not os.path.exists(csv_path):
+        synthetic.write_earthquake_csv(csv_path, rows)
+
+    # Eklentinin kendi aşama ölçümlerini de topla
+    import_plugin_module('util.profiling').monitor.enabled = True
+
+    dialog = dialog_module.EarthquakeAnalysisDialog()
+    plugin = plugin_module.EarthquakeAnalysisPlugin(None)
+    plugin.dialog = dialog
+
+    stages = {}
+    counts = {'rows': rows}
+
+    # Veri yükleme
+    dialog.file_path = os.path.join(workdir, 'ilceler.shp')
+    dialog.original_layer_name = 'ilceler'
+    stages['load_layer'], _ = measure(lambda: dialog.load_layer(dialog.file_path), 1)
+
+    dialog.csv_file_path = csv_path
+    stages['load_earthquake_data'], _ = measure(lambda: dialog.load_earthquake_data(csv_path), repeat)
+    stages['build_catalogue_index'], _ = measure(dialog.build_catalogue_index, repeat)
+    counts['loaded_events'] = len(dialog.earthquake_data)
+
+    il = synthetic.province_name(0)
+    ilce = synthetic.district_name(0, 4)
+    select_region(dialog, il, ilce)
+
+    def filtered(settlement_distance):
+        def run():
+            dialog.settlementDistanceSpinBox.blockSignals(True)
+            dialog.settlementDistanceSpinBox.setValue(settlement_distance)
+            dialog.settlementDistanceSpinBox.blockSignals(False)
+            for name in ('cached_result', 'cached_params'):
+                if hasattr(dialog, name):
+                    delattr(dialog, name)
+            return dialog.get_filtered_earthquake_data()
+        return run
+
+    # Sadece ilçe + buffer
+    dialog.bufferSpinBox.blockSignals(True)
+    dialog.bufferSpinBox.setValue(20)
+    dialog.bufferSpinBox.blockSignals(False)
+    stages['get_filtered_earthquake_data'], result = measure(filtered(0), repeat)
+    counts['filtered_events'] = 0 if result is None else len(result)
+
+    # Fay hatları
+    dialog.fault_line_layer = dialog.load_fault_line_layer(os.path.join(workdir, 'faylar.shp'))
+    stages['update_fault_lines'], _ = measure(dialog.update_fault_lines, repeat)
+
+    # Yerleşim noktaları
+    stages['load_settlement_layer'], _ = measure(
+        lambda: dialog.load_settlement_layer(os.path.join(workdir, 'yerlesimler.shp')), 1
+    )
+    dialog.settlementDistanceSpinBox.blockSignals(True)
+    dialog.settlementDistanceSpinBox.setValue(5)
+    dialog.settlementDistanceSpinBox.blockSignals(False)
+    stages['update_settlement_filter'], _ = measure(dialog.update_settlement_filter, repeat)
+    stages['get_filtered_earthquake_data_settlement'], settlement_result = measure(filtered(5), repeat)
+    counts['filtered_events_settlement'] = 0 if settlement_result is None else len(settlement_result)
+
+    # Katman oluşturucular (buffer filtresinin sonucu üzerinde)
+    if result is not None:
+        stages['create_earthquake_layer'], _ = measure(lambda: plugin.create_earthquake_layer(result), repeat)
+        stages['update_earthquake_points'], _ = measure(lambda: plugin.update_earthquake_points(result), repeat)
+        stages['update_cluster_layer'], _ = measure(lambda: plugin.update_cluster_layer(result), repeat)
+        stages['update_density_layer'], _ = measure(lambda: plugin.update_density_layer(result), repeat)
+
+    QgsProject.instance().removeAllMapLayers()
+    dialog.deleteLater()
+    return {'rows': rows, 'stages': stages, 'counts': counts}
+
+
+def run(rows_list, output, repeat, workdir):
+    """Kıyaslamayı çalıştır ve sonucu JSON olarak yaz"""
+    from qgis.core import QgsApplication, Qgis
+
+    application = QgsApplication([], False)
+    application.initQgis()
+    silence_message_boxes()
+
+    os.makedirs(workdir, exist_ok=True)
+    synthetic.write_district_shapefile(os.path.join(workdir, 'ilceler.shp'))
+    synthetic.write_settlement_shapefile(os.path.join(workdir, 'yerlesimler.shp'), SETTLEMENT_COUNT)
+    synthetic.write_fault_shapefile(os.path.join(workdir, 'faylar.shp'), FAULT_COUNT)
+
+    report = {
+        'plugin_version': plugin_version(),
+        'qgis_version': Qgis.QGIS_VERSION,
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'repeat': repeat,
+        'results': [],
+    }
+    for rows in rows_list:
+        report['results'].append(run_size(rows, workdir, repeat))
+        print(f"{rows} satır tamamlandı", file=sys.stderr)
+
+    with open(output, 'w', encoding='utf-8') as handle:
+        json.dump(report, handle, indent=2, ensure_ascii=False)
+
+    application.exitQgis()
+    return report
+
+
+def compare(old_path, new_path):
+    """İki kıyaslama çıktısını aşama bazında karşılaştır (yeni / eski medyan oranı)"""
+    with open(old_path, encoding='utf-8') as handle:
+        old = {r['rows']: r for r in json.load(handle)['results']}
+    with open(new_path, encoding='utf-8') as handle:
+        new = {r['rows']: r for r in json.load(handle)['results']}
+
+    for rows in sorted(set(old) & set(new)):
+        print(f"== {rows} satır ==")
+        for stage, timing in new[rows]['stages'].items():
+            if stage not in old[rows]['stages']:
+                continue
+            before = old[rows]['stages'][stage]['median']
+            after = timing['median']
+            ratio = after / before if before > 0 else float('inf')
+            print(f"{stage:45s} {before:10.4f}s -> {after:10.4f}s  x{ratio:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deprem analizi filtre hattı kıyaslaması")
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS,
+                        help="Sentetik katalog boyutları (ör. 10000 100000 1000000 10000000)")
+    parser.add_argument('--repeat', type=int, default=3, help="Her aşamanın tekrar sayısı")
+    parser.add_argument('--output', default='bench_results.json', help="JSON çıktı dosyası")
+    parser.add_argument('--workdir', default=os.path.join(tempfile.gettempdir(), 'deprem_benchmark'),
+                        help="Sentetik verilerin yazılacağı dizin (tekrar kullanılır)")
+    parser.add_argument('--compare', nargs=2, metavar=('ESKI', 'YENI'),
+                        help="İki JSON çıktısını karşılaştır ve çık")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    run(args.rows, args.output, args.repeat, args.workdir)
+
+
+if __name__ == '__main__':
+    main()
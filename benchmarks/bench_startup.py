@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""Eklentinin QGIS açılışına eklediği yükü ölçen ve gerilemeye karşı koruyan araç.
+
+Her ölçüm temiz bir Python sürecinde yapılır: QGIS modülleri önceden yüklenir (açılışta zaten
+yüklüdürler), ardından eklenti paketi, eklenti modülü ve Processing sağlayıcısı içe aktarılıp
+eklenti nesnesi oluşturulur. Bu aşamada ağır modüller (pandas, numpy, diyalog, .ui derleyicisi)
+yüklenirse veya süre bütçeyi aşarsa çıkış kodu 1 olur. Derlenmiş arayüz modülünün .ui dosyasıyla
+uyumu da pyuic5 varsa denetlenir; arayüz modülü çalışma anında .ui'ye geri dönmez.
+
+Kullanım:
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_startup --repeat 5 --budget-ms 150
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_startup --output baslangic.json
+    python -m benchmarks.bench_startup --regenerate-ui
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_NAME = 'pau_earthquake_analysis'
+UI_PATH = os.path.join(PLUGIN_DIR, 'ui', 'ui_EarthquakeAnalysisDialog.ui')
+COMPILED_UI_PATH = os.path.join(PLUGIN_DIR, 'ui', 'ui_EarthquakeAnalysisDialog.py')
+
+# Açılışta yüklenmemesi gereken modüller (ilk diyalog açılışında veya algoritma çalışırken yüklenirler)
+DEFERRED_MODULES = [
+    'numpy',
+    'pandas',
+    'matplotlib',
+    'PyQt5.uic',
+    f'{PACKAGE_NAME}.widgets.EarthquakeAnalysisDialog',
+    f'{PACKAGE_NAME}.ui.ui_EarthquakeAnalysisDialog',
+]
+
+# Temiz süreçte çalışan ölçüm kodu; sonucu JSON olarak stdout'a yazar
+CHILD_SCRIPT = r'''
+import importlib, importlib.util, json, sys, time
+plugin_dir, package_name = sys.argv[1], sys.argv[2]
+import qgis.core, qgis.gui, qgis.PyQt.QtWidgets
+before = set(sys.modules)
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location(
+    package_name, plugin_dir + '/__init__.py', submodule_search_locations=[plugin_dir]
+)
+package = importlib.util.module_from_spec(spec)
+sys.modules[package_name] = package
+spec.loader.exec_module(package)
+module = importlib.import_module(package_name + '.EarthquakeAnalysisPlugin')
+importlib.import_module(package_name + '.processing_provider.provider')
+module.EarthquakeAnalysisPlugin(None)
+elapsed = time.perf_counter() - start
+print(json.dumps({'seconds': elapsed, 'modules': sorted(set(sys.modules) - before)}))
+'''
+
+
+def measure_once():
+    """Temiz bir süreçte açılış içe aktarmalarını ölç"""
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT, PLUGIN_DIR, PACKAGE_NAME],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def deferred_violations(modules):
+    """Açılışta yüklenmiş ertelenmesi gereken modüller"""
+    loaded = set(modules)
+    return [name for name in DEFERRED_MODULES if name in loaded]
+
+
+def generated_ui_source(pyuic):
+    """pyuic5 çıktısı; kullanılmayan Qt alt modülleri içe aktarmadan çıkarılır"""
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, 'ui.py')
+        # Göreli yol: üretilen başlıkta makineye özgü mutlak yol yer almaz
+        subprocess.run([pyuic, '-o', path, os.path.relpath(UI_PATH, PLUGIN_DIR)], check=True, cwd=PLUGIN_DIR)
+        with open(path, encoding='utf-8') as handle:
+            source = handle.read()
+    header = 'from PyQt5 import QtCore, QtGui, QtWidgets\n'
+    used = [name for name in ('QtCore', 'QtGui', 'QtWidgets') if f'{name}.' in source.replace(header, '')]
+    return source.replace(header, f"from PyQt5 import {', '.join(used)}\n", 1)
+
+
+def code_lines(source):
+    # Başlık yorumları (kaynak yolu, üretici sürümü) karşılaştırmaya katılmaz
+    return [line for line in source.splitlines() if not line.startswith('#')]
+
+
+def regenerate_ui():
+    """Derlenmiş arayüz modülünü .ui dosyasından yeniden üret"""
+    pyuic = shutil.which('pyuic5')
+    if pyuic is None:
+        sys.exit("pyuic5 bulunamadı")
+    with open(COMPILED_UI_PATH, 'w', encoding='utf-8') as handle:
+        handle.write(generated_ui_source(pyuic))
+    print(f"{COMPILED_UI_PATH} yeniden üretildi")
+
+
+def compiled_ui_status():
+    """Derlenmiş arayüz modülü .ui ile aynı mı: (durum, açıklama)"""
+    if not os.path.exists(COMPILED_UI_PATH):
+        return False, "derlenmiş arayüz modülü yok"
+    pyuic = shutil.which('pyuic5')
+    if pyuic is None:
+        return True, "pyuic5 bulunamadı, içerik denetimi atlandı"
+    with open(COMPILED_UI_PATH, encoding='utf-8') as handle:
+        compiled = handle.read()
+    if code_lines(generated_ui_source(pyuic)) != code_lines(compiled):
+        return False, "derlenmiş arayüz modülü .ui dosyasından eski; --regenerate-ui ile yeniden üretin"
+    return True, "derlenmiş arayüz modülü güncel"
+
+
+def run(repeat, budget_ms, output):
+    """Ölçümleri yap, raporu yaz ve denetim sonucunu döndür"""
+    runs = [measure_once() for _ in range(repeat)]
+    seconds = sorted(result['seconds'] for result in runs)
+    median_ms = seconds[len(seconds) // 2] * 1000
+    violations = deferred_violations(runs[-1]['modules'])
+    ui_ok, ui_message = compiled_ui_status()
+
+    report = {
+        'python_version': sys.version.split()[0],
+        'repeat': repeat,
+        'median_ms': median_ms,
+        'min_ms': seconds[0] * 1000,
+        'budget_ms': budget_ms,
+        'loaded_modules': runs[-1]['modules'],
+        'deferred_violations': violations,
+        'compiled_ui': ui_message,
+    }
+    if output:
+        with open(output, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2, ensure_ascii=False)
+
+    print(f"{'acilis.ice_aktarma':28s} {median_ms:10.1f} ms (en az {seconds[0] * 1000:.1f} ms, bütçe {budget_ms:.0f} ms)")
+    print(f"{'acilis.yeni_modul':28s} {len(runs[-1]['modules']):10d}")
+    print(f"{'arayuz':28s} {ui_message}")
+
+    passed = True
+    if violations:
+        print("HATA: açılışta yüklenmemesi gereken modüller: " + ", ".join(violations), file=sys.stderr)
+        passed = False
+    if median_ms > budget_ms:
+        print("HATA: açılış süresi bütçeyi aşıyor", file=sys.stderr)
+        passed = False
+    if not ui_ok:
+        print("HATA: " + ui_message, file=sys.stderr)
+        passed = False
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Eklenti açılış yükü ölçümü ve gerileme denetimi")
+    parser.add_argument('--repeat', type=int, default=5, help="Temiz süreçte tekrar sayısı")
+    parser.add_argument('--budget-ms', type=float, default=150.0, help="İzin verilen medyan açılış süresi (ms)")
+    parser.add_argument('--output', help="İsteğe bağlı JSON rapor dosyası")
+    parser.add_argument('--regenerate-ui', action='store_true',
+                        help="Derlenmiş arayüz modülünü .ui dosyasından yeniden üret ve çık")
+    args = parser.parse_args()
+
+    if args.regenerate_ui:
+        regenerate_ui()
+        return
+    sys.exit(0 if run(args.repeat, args.budget_ms, args.output) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Sentetik katalog sunan yerel FDSN event servisi taklidi.
+
+Kullanım:
+    python -m benchmarks.mock_fdsn_server --rows 100000 --port 8080 --latency 0.2
+
+Eklentide servis adresi olarak http://localhost:8080/fdsnws/event/1/query kullanılır.
+Desteklenen parametreler: starttime, endtime, format (text | xml), minmagnitude.
+"""
+
+import argparse
+import os
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+if __package__:
+    from . import synthetic
+else:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import synthetic
+
+QUERY_PATH = '/fdsnws/event/1/query'
+TEXT_HEADER = ("#EventID|Time|Latitude|Longitude|Depth/km|Author|Catalog|Contributor|ContributorID|"
+               "MagType|Magnitude|MagAuthor|EventLocationName\n")
+
+
+def build_catalogue(rows, seed=0):
+    """Zamana göre sıralı sentetik katalog üret"""
+    catalogue = synthetic.earthquake_chunk(np.random.default_rng(seed), 1, rows)
+    catalogue['time'] = catalogue['eventDate'].values.astype('datetime64[s]')
+    return catalogue.sort_values('time').reset_index(drop=True)
+
+
+def render_text(events):
+    lines = [TEXT_HEADER]
+    for row in events.itertuples(index=False):
+        lines.append(f"{row.eventId}|{row.eventDate}|{row.latitude}|{row.longitude}|{row.depth}|"
+                     f"MOCK|MOCK|MOCK|{row.eventId}|{row.magnitudeType}|{row.magnitude}|MOCK|{row.area}\n")
+    return "".join(lines).encode('utf-8')
+
+
+def render_quakeml(events):
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n'
+             '<q:quakeml xmlns:q="http://quakeml.org/xmlns/quakeml/1.2" xmlns="http://quakeml.org/xmlns/bed/1.2">'
+             '<eventParameters publicID="smi:local/mock">']
+    for row in events.itertuples(index=False):
+        parts.append(
+            f'<event publicID="smi:local/event/{row.eventId}">'
+            f'<preferredOriginID>smi:local/origin/{row.eventId}</preferredOriginID>'
+            f'<preferredMagnitudeID>smi:local/magnitude/{row.eventId}</preferredMagnitudeID>'
+            f'<description><text>{escape(str(row.area))}</text></description>'
+            f'<origin publicID="smi:local/origin/{row.eventId}">'
+            f'<time><value>{row.eventDate}.000000Z</value></time>'
+            f'<latitude><value>{row.latitude}</value></latitude>'
+            f'<longitude><value>{row.longitude}</value></longitude>'
+            f'<depth><value>{row.depth * 1000.0}</value></depth>'
+            f'</origin>'
+            f'<magnitude publicID="smi:local/magnitude/{row.eventId}">'
+            f'<mag><value>{row.magnitude}</value></mag><type>{row.magnitudeType}</type>'
+            f'</magnitude>'
+            f'</event>'
+        )
+    parts.append('</eventParameters></q:quakeml>')
+    return "".join(parts).encode('utf-8')
+
+
+def make_handler(catalogue, latency):
+    times = catalogue['time'].values
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != QUERY_PATH:
+                self.send_error(404)
+                return
+            params = {key: values[0] for key, values in parse_qs(url.query).items()}
+            try:
+                start = np.datetime64(params.get('starttime', '1900-01-01T00:00:00'), 's')
+                end = np.datetime64(params.get('endtime', '2100-01-01T00:00:00'), 's')
+                min_magnitude = float(params.get('minmagnitude', '-10'))
+            except ValueError as e:
+                self.send_error(400, str(e))
+                return
+
+            # Zaman sıralı katalogda pencere iki searchsorted ile bulunur
+            lo, hi = np.searchsorted(times, [start, end], side='left')
+            events = catalogue.iloc[lo:hi]
+            events = events[events['magnitude'].values >= min_magnitude]
+
+            if latency > 0:
+                time.sleep(latency)
+            if events.empty:
+                # FDSN: sonuç yoksa 204
+                self.send_response(204)
+                self.end_headers()
+                return
+
+            if params.get('format', 'xml') == 'text':
+                body, content_type = render_text(events), 'text/plain; charset=utf-8'
+            else:
+                body, content_type = render_quakeml(events), 'application/xml'
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel FDSN event servisi taklidi")
+    parser.add_argument('--rows', type=int, default=100000, help="Sentetik katalog boyutu")
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help="Her yanıta eklenen gecikme (s); eşzamanlı sayfalamayı göstermek için")
+    args = parser.parse_args()
+
+    catalogue = build_catalogue(args.rows)
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), make_handler(catalogue, args.latency))
+    print(f"http://127.0.0.1:{args.port}{QUERY_PATH} ({len(catalogue)} olay)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import numpy as np
+import pandas as pd
+from osgeo import ogr, osr
+
+# Sentetik verilerin kapsadığı alan (yaklaşık Türkiye sınırları)
+EXTENT = (26.0, 36.0, 45.0, 42.0)
+PROVINCE_GRID = (9, 4)     # Sütun x satır il sayısı
+DISTRICT_GRID = (3, 3)     # Her il içindeki ilçe ızgarası
+MAGNITUDE_TYPES = np.array(['ML', 'Mw', 'Md', 'mb'])
+CSV_CHUNK_SIZE = 1000000
+
+
+def province_name(i):
+    return f"İl {i:02d}"
+
+
+def district_name(i, j):
+    return f"İlçe {i:02d}-{j}"
+
+
+def district_cells():
+    """Her ilçe için (il adı, ilçe adı, xmin, ymin, xmax, ymax) üret"""
+    xmin, ymin, xmax, ymax = EXTENT
+    pcols, prows = PROVINCE_GRID
+    dcols, drows = DISTRICT_GRID
+    pw = (xmax - xmin) / pcols
+    ph = (ymax - ymin) / prows
+    dw = pw / dcols
+    dh = ph / drows
+
+    cells = []
+    for p in range(pcols * prows):
+        px = xmin + (p % pcols) * pw
+        py = ymin + (p // pcols) * ph
+        for d in range(dcols * drows):
+            x0 = px + (d % dcols) * dw
+            y0 = py + (d // dcols) * dh
+            cells.append((province_name(p), district_name(p, d), x0, y0, x0 + dw, y0 + dh))
+    return cells
+
+
+def _create_datasource(path, geometry_type, fields):
+    driver = ogr.GetDriverByName('ESRI Shapefile')
+    if os.path.exists(path):
+        driver.DeleteDataSource(path)
+    datasource = driver.CreateDataSource(path)
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(4326)
+    layer = datasource.CreateLayer(os.path.splitext(os.path.basename(path))[0], srs, geometry_type,
+                                   options=['ENCODING=UTF-8'])
+    for name in fields:
+        layer.CreateField(ogr.FieldDefn(name, ogr.OFTString))
+    return datasource, layer
+
+
+def write_district_shapefile(path):
+    """İl/ilçe ızgarasından ilçe poligonları yaz (adm1_tr / adm2_tr sütunları)"""
+    datasource, layer = _create_datasource(path, ogr.wkbPolygon, ['adm1_tr', 'adm2_tr'])
+    for il, ilce, x0, y0, x1, y1 in district_cells():
+        feature = ogr.Feature(layer.GetLayerDefn())
+        feature.SetField('adm1_tr', il)
+        feature.SetField('adm2_tr', ilce)
+        feature.SetGeometry(ogr.CreateGeometryFromWkt(
+            f"POLYGON(({x0} {y0},{x1} {y0},{x1} {y1},{x0} {y1},{x0} {y0}))"
+        ))
+        layer.CreateFeature(feature)
+    datasource = None
+    return path
+
+
+def write_settlement_shapefile(path, count, seed=0):
+    """İlçelerin içine rastgele yerleşim noktaları yaz (Il_Adi / Ilce_Adi sütunları)"""
+    rng = np.random.default_rng(seed)
+    cells = district_cells()
+    picks = rng.integers(0, len(cells), count)
+
+    datasource, layer = _create_datasource(path, ogr.wkbPoint, ['Il_Adi', 'Ilce_Adi'])
+    for k in picks:
+        il, ilce, x0, y0, x1, y1 = cells[k]
+        feature = ogr.Feature(layer.GetLayerDefn())
+        feature.SetField('Il_Adi', il)
+        feature.SetField('Ilce_Adi', ilce)
+        feature.SetGeometry(ogr.CreateGeometryFromWkt(
+            f"POINT({rng.uniform(x0, x1)} {rng.uniform(y0, y1)})"
+        ))
+        layer.CreateFeature(feature)
+    datasource = None
+    return path
+
+
+def write_fault_shapefile(path, count, vertices=20, seed=0):
+    """Rastgele yürüyüşle kırıklı fay hatları yaz"""
+    rng = np.random.default_rng(seed)
+    xmin, ymin, xmax, ymax = EXTENT
+
+    datasource, layer = _create_datasource(path, ogr.wkbLineString, ['fay_adi'])
+    for i in range(count):
+        start = np.array([rng.uniform(xmin, xmax), rng.uniform(ymin, ymax)])
+        heading = rng.uniform(0, 2 * np.pi)
+        steps = rng.normal(0, 0.2, vertices - 1).cumsum() + heading
+        coords = start + np.vstack([[0, 0], np.column_stack((np.cos(steps), np.sin(steps))).cumsum(axis=0) * 0.05])
+        feature = ogr.Feature(layer.GetLayerDefn())
+        feature.SetField('fay_adi', f"Fay {i}")
+        feature.SetGeometry(ogr.CreateGeometryFromWkt(
+            "LINESTRING(" + ",".join(f"{x} {y}" for x, y in coords) + ")"
+        ))
+        layer.CreateFeature(feature)
+    datasource = None
+    return path
+
+
+def earthquake_chunk(rng, start_id, count):
+    """AFAD CSV sütunlarıyla sentetik deprem kayıtları üret (kümelenmiş + arka plan)"""
+    xmin, ymin, xmax, ymax = EXTENT
+
+    # Olayların yarısı kümelerde, yarısı düzgün dağılımlı arka planda
+    clustered = count // 2
+    centers = np.column_stack((rng.uniform(xmin, xmax, 50), rng.uniform(ymin, ymax, 50)))
+    picks = rng.integers(0, len(centers), clustered)
+    longitudes = np.concatenate((centers[picks, 0] + rng.normal(0, 0.1, clustered),
+                                 rng.uniform(xmin, xmax, count - clustered)))
+    latitudes = np.concatenate((centers[picks, 1] + rng.normal(0, 0.1, clustered),
+                                rng.uniform(ymin, ymax, count - clustered)))
+
+    seconds = rng.integers(0, 30 * 365 * 86400, count)
+    dates = np.datetime64('1995-01-01T00:00:00') + seconds.astype('timedelta64[s]')
+
+    return pd.DataFrame({
+        'eventId': np.arange(start_id, start_id + count),
+        'eventDate': np.datetime_as_string(dates, unit='s'),
+        'longitude': np.round(longitudes, 4),
+        'latitude': np.round(latitudes, 4),
+        'depth': np.round(rng.gamma(2.0, 5.0, count), 2),
+        'magnitudeType': MAGNITUDE_TYPES[rng.integers(0, len(MAGNITUDE_TYPES), count)],
+        # Gutenberg-Richter (b ~ 1) dağılımı
+        'magnitude': np.round(1.0 + rng.exponential(1 / np.log(10), count), 1),
+        'area': 'Sentetik',
+    })
+
+
+def write_earthquake_csv(path, count, seed=0):
+    """Parça parça sentetik deprem CSV'si yaz (10M satır için de sabit bellek)"""
+    rng = np.random.default_rng(seed)
+    written = 0
+    while written < count:
+        size = min(CSV_CHUNK_SIZE, count - written)
+        chunk = earthquake_chunk(rng, written + 1, size)
+        chunk.to_csv(path, mode='w' if written == 0 else 'a', header=(written == 0), index=False)
+        written += size
+    return path
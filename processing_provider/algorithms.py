@@ -0,0 +1,487 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+from qgis.core import (
+    QgsProcessing, QgsProcessingAlgorithm, QgsProcessingException, QgsProcessingParameterFile,
+    QgsProcessingParameterFeatureSource, QgsProcessingParameterNumber, QgsProcessingParameterEnum,
+    QgsProcessingParameterFeatureSink, QgsFeature, QgsFeatureSink, QgsField, QgsFields, QgsGeometry,
+    QgsPointXY, QgsWkbTypes, QgsCoordinateReferenceSystem, QgsCoordinateTransform, QgsProject, QgsSettings
+)
+from qgis.PyQt.QtCore import QCoreApplication, QVariant
+# Hesaplama modülleri (pandas/numpy) sağlayıcı kaydında değil, algoritma çalışırken fonksiyon içinde yüklenir
+
+# Son ayrıştırılan katalog: toplu çalıştırmalarda aynı CSV her algoritmada yeniden okunmaz
+_catalogue_cache = {}
+
+
+def load_catalogue(path):
+    """CSV kataloğunu diyalogla aynı adımlarla (tarih, doğrulama, sıkıştırma, Mw) yükle.
+
+    Sonuç dosya imzası ve Mw katsayılarıyla anahtarlanıp bellekte tutulur.
+    Dönüş: {'data': DataFrame, 'origin': (lon, lat), 'xy_km': (x, y)}
+    """
+    import pandas as pd
+    from ..util.catalogue import CSV_COLUMNS, compact_catalogue, parse_event_dates, valid_coordinate_mask
+    from ..util.magnitude import MW_CONVERSION_SETTING, harmonize_catalogue, format_conversions, stored_conversions
+    from ..util.sidecar_cache import file_signature
+    from ..util.spatial_index import local_km_coordinates, catalogue_origin
+    conversions = stored_conversions(QgsSettings().value(MW_CONVERSION_SETTING, ""))
+    key = (os.path.abspath(path), file_signature(path), format_conversions(conversions))
+    cached = _catalogue_cache.get('katalog')
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    rows = parse_event_dates(pd.read_csv(path, usecols=CSV_COLUMNS))
+    data = harmonize_catalogue(compact_catalogue(rows[valid_coordinate_mask(rows)]), conversions)
+    longitudes = data['longitude'].values
+    latitudes = data['latitude'].values
+    origin = catalogue_origin(longitudes, latitudes)
+    catalogue = {'data': data, 'origin': origin, 'xy_km': local_km_coordinates(longitudes, latitudes, origin)}
+    _catalogue_cache['katalog'] = (key, catalogue)
+    return catalogue
+
+
+def progress_callback(feedback):
+    """Motor fonksiyonlarının ilerleme/iptal arayüzünü Processing geri bildirimine bağla"""
+    def progress(fraction):
+        feedback.setProgress(fraction * 100)
+        return not feedback.isCanceled()
+    return progress
+
+
+def event_fields():
+    """Deprem katmanıyla aynı alanlar"""
+    from ..util.magnitude import HARMONIZED_COLUMN
+    fields = QgsFields()
+    for name, field_type in (('eventId', QVariant.String), ('eventDate', QVariant.String),
+                             ('depth', QVariant.Double), ('magnitudeType', QVariant.String),
+                             ('magnitude', QVariant.Double), ('area', QVariant.String),
+                             (HARMONIZED_COLUMN, QVariant.Double)):
+        fields.append(QgsField(name, field_type))
+    return fields
+
+
+def extended_fields(fields, extra):
+    """Kaynak alanlarına (ad, tip) listesindeki yeni alanları ekle"""
+    result = QgsFields(fields)
+    for name, field_type in extra:
+        result.append(QgsField(name, field_type))
+    return result
+
+
+def wgs84_transform(source):
+    from ..util.region_source import WGS84
+    return QgsCoordinateTransform(source.sourceCrs(), QgsCoordinateReferenceSystem(WGS84), QgsProject.instance())
+
+
+class EarthquakeAlgorithm(QgsProcessingAlgorithm):
+    """Katalog girdisi ve öznitelik filtreleri ortak olan algoritmaların tabanı"""
+
+    INPUT = 'INPUT'
+    MIN_MAGNITUDE = 'MIN_MAGNITUDE'
+    MAX_MAGNITUDE = 'MAX_MAGNITUDE'
+    START_YEAR = 'START_YEAR'
+    END_YEAR = 'END_YEAR'
+    MAGNITUDE_SCALE = 'MAGNITUDE_SCALE'
+    OUTPUT = 'OUTPUT'
+
+    def tr(self, string):
+        return QCoreApplication.translate('Processing', string)
+
+    def createInstance(self):
+        return type(self)()
+
+    def group(self):
+        return self.tr('Deprem Analizi')
+
+    def groupId(self):
+        return 'deprem'
+
+    def add_catalogue_parameters(self):
+        self.addParameter(QgsProcessingParameterFile(
+            self.INPUT, self.tr('Deprem kataloğu (CSV)'), extension='csv'
+        ))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.MIN_MAGNITUDE, self.tr('En küçük magnitüd'), QgsProcessingParameterNumber.Double,
+            defaultValue=0.0, minValue=0.0, maxValue=10.0
+        ))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.MAX_MAGNITUDE, self.tr('En büyük magnitüd'), QgsProcessingParameterNumber.Double,
+            defaultValue=10.0, minValue=0.0, maxValue=10.0
+        ))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.START_YEAR, self.tr('Başlangıç yılı (0: tümü)'), QgsProcessingParameterNumber.Integer,
+            defaultValue=0, minValue=0
+        ))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.END_YEAR, self.tr('Bitiş yılı (0: tümü)'), QgsProcessingParameterNumber.Integer,
+            defaultValue=0, minValue=0
+        ))
+        self.addParameter(QgsProcessingParameterEnum(
+            self.MAGNITUDE_SCALE, self.tr('Magnitüd'),
+            options=[self.tr('Ham magnitüd'), self.tr('Mw (dönüştürülmüş)')], defaultValue=0
+        ))
+
+    def catalogue_and_mask(self, parameters, context, feedback):
+        """Kataloğu yükle ve öznitelik filtrelerinin maskesini üret.
+
+        Dönüş: (katalog, maske, filtrede kullanılan magnitüd sütunu)
+        """
+        import numpy as np
+        from ..util.magnitude import HARMONIZED_COLUMN
+        path = self.parameterAsFile(parameters, self.INPUT, context)
+        if not path or not os.path.exists(path):
+            raise QgsProcessingException(self.tr('Deprem kataloğu bulunamadı: {}').format(path))
+        catalogue = load_catalogue(path)
+        data = catalogue['data']
+
+        column = HARMONIZED_COLUMN if self.parameterAsEnum(parameters, self.MAGNITUDE_SCALE, context) == 1 else 'magnitude'
+        magnitudes = data[column].values
+        mask = (
+            (magnitudes >= self.parameterAsDouble(parameters, self.MIN_MAGNITUDE, context)) &
+            (magnitudes <= self.parameterAsDouble(parameters, self.MAX_MAGNITUDE, context))
+        )
+        start_year = self.parameterAsInt(parameters, self.START_YEAR, context)
+        end_year = self.parameterAsInt(parameters, self.END_YEAR, context)
+        dates = data['eventDate'].values
+        if start_year:
+            mask &= dates >= np.datetime64(f"{start_year:04d}-01-01")
+        if end_year:
+            mask &= dates < np.datetime64(f"{end_year + 1:04d}-01-01")
+        feedback.pushInfo(self.tr('{} depremden {} tanesi öznitelik filtrelerine uyuyor').format(
+            len(data), int(np.count_nonzero(mask))
+        ))
+        return catalogue, mask, column
+
+    def write_events(self, sink, data, positions, extra_columns, feedback):
+        """Konumlardaki depremleri (ve ek sütun dizilerini) nokta nesnesi olarak yaz"""
+        import numpy as np
+        from ..util.magnitude import HARMONIZED_COLUMN
+        # Dönüşümler sadece yazılacak satırlar üzerinde yapılır
+        rows = data.iloc[positions]
+        columns = zip(
+            rows['eventId'].astype(str).tolist(),
+            rows['eventDate'].dt.strftime('%Y-%m-%d %H:%M:%S').tolist(),
+            rows['depth'].values.astype(float).tolist(),
+            rows['magnitudeType'].astype(str).tolist(),
+            rows['magnitude'].values.astype(float).tolist(),
+            rows['area'].astype(str).tolist(),
+            rows[HARMONIZED_COLUMN].values.astype(float).tolist(),
+            rows['longitude'].values.astype(float).tolist(),
+            rows['latitude'].values.astype(float).tolist(),
+        )
+        extra = [np.asarray(values).tolist() for values in extra_columns]
+        total = max(len(positions), 1)
+        for row, (event_id, date, depth, magnitude_type, magnitude, area, mw, lon, lat) in enumerate(columns):
+            if feedback.isCanceled():
+                break
+            feature = QgsFeature()
+            feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(lon, lat)))
+            feature.setAttributes(
+                [event_id, date, depth, magnitude_type, magnitude, area, mw] + [values[row] for values in extra]
+            )
+            sink.addFeature(feature, QgsFeatureSink.FastInsert)
+            if row % 10000 == 0:
+                feedback.setProgress(100.0 * row / total)
+
+
+class FilterEarthquakesByRegionAlgorithm(EarthquakeAlgorithm):
+    """Depremleri çokgen katmanının (isteğe bağlı tamponlu) birleşimine göre filtrele"""
+
+    REGION = 'REGION'
+    BUFFER = 'BUFFER'
+
+    def name(self):
+        return 'filterbyregion'
+
+    def displayName(self):
+        return self.tr('Depremleri bölgeye göre filtrele')
+
+    def shortHelpString(self):
+        return self.tr('Katalogdaki depremlerden bölge katmanının tamponlu birleşimi içinde kalanları nokta katmanı olarak yazar.')
+
+    def initAlgorithm(self, config=None):
+        self.add_catalogue_parameters()
+        self.addParameter(QgsProcessingParameterFeatureSource(
+            self.REGION, self.tr('Bölge katmanı'), [QgsProcessing.TypeVectorPolygon]
+        ))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.BUFFER, self.tr('Tampon (km)'), QgsProcessingParameterNumber.Double, defaultValue=0.0, minValue=0.0
+        ))
+        self.addParameter(QgsProcessingParameterFeatureSink(self.OUTPUT, self.tr('Filtrelenmiş depremler')))
+
+    def processAlgorithm(self, parameters, context, feedback):
+        import numpy as np
+        from ..util.point_in_polygon import points_in_rings
+        from ..util.region_source import WGS84, METRIC_CRS, transform_geometry, geometry_rings
+        catalogue, mask, _ = self.catalogue_and_mask(parameters, context, feedback)
+        data = catalogue['data']
+        source = self.parameterAsSource(parameters, self.REGION, context)
+        if source is None:
+            raise QgsProcessingException(self.invalidSourceError(parameters, self.REGION))
+
+        geometries = [
+            transform_geometry(feature.geometry(), source.sourceCrs())
+            for feature in source.getFeatures() if feature.hasGeometry()
+        ]
+        if not geometries:
+            raise QgsProcessingException(self.tr('Bölge katmanında geometri yok'))
+        region = QgsGeometry.unaryUnion(geometries)
+        buffer_km = self.parameterAsDouble(parameters, self.BUFFER, context)
+        if buffer_km > 0:
+            # Tampon diyalogdaki gibi metrik sistemde uygulanır
+            region = transform_geometry(region, QgsCoordinateReferenceSystem(WGS84), METRIC_CRS)
+            region = region.buffer(buffer_km * 1000, 5)
+            region = transform_geometry(region, QgsCoordinateReferenceSystem(METRIC_CRS))
+
+        # Kapsam ön elemesi, ardından vektörize nokta-çokgen testi
+        bbox = region.boundingBox()
+        longitudes = data['longitude'].values
+        latitudes = data['latitude'].values
+        mask &= (
+            (longitudes >= bbox.xMinimum()) & (longitudes <= bbox.xMaximum()) &
+            (latitudes >= bbox.yMinimum()) & (latitudes <= bbox.yMaximum())
+        )
+        positions = np.flatnonzero(mask)
+        inside = points_in_rings(longitudes[positions], latitudes[positions], geometry_rings(region))
+        positions = positions[inside]
+        feedback.pushInfo(self.tr('Bölgedeki deprem sayısı: {}').format(len(positions)))
+
+        sink, dest_id = self.parameterAsSink(
+            parameters, self.OUTPUT, context, event_fields(), QgsWkbTypes.Point, QgsCoordinateReferenceSystem(WGS84)
+        )
+        if sink is None:
+            raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
+        self.write_events(sink, data, positions, [], feedback)
+        return {self.OUTPUT: dest_id}
+
+
+class DistrictStatisticsAlgorithm(EarthquakeAlgorithm):
+    """Her çokgen için deprem sayısı, en büyük magnitüd, enerji ve moment toplamı"""
+
+    DISTRICTS = 'DISTRICTS'
+
+    def name(self):
+        return 'districtstatistics'
+
+    def displayName(self):
+        return self.tr('İlçe başına deprem istatistikleri')
+
+    def shortHelpString(self):
+        return self.tr('Her çokgenin içindeki depremlerin sayısı, en büyük magnitüdü ve Mw üzerinden enerji/moment toplamı. '
+                       'Depremler tek geçişte çokgen etiketlerine atanır, toplamlar bincount ile alınır.')
+
+    def initAlgorithm(self, config=None):
+        self.add_catalogue_parameters()
+        self.addParameter(QgsProcessingParameterFeatureSource(
+            self.DISTRICTS, self.tr('İlçe (çokgen) katmanı'), [QgsProcessing.TypeVectorPolygon]
+        ))
+        self.addParameter(QgsProcessingParameterFeatureSink(
+            self.OUTPUT, self.tr('İlçe istatistikleri'), QgsProcessing.TypeVectorPolygon
+        ))
+
+    def processAlgorithm(self, parameters, context, feedback):
+        import numpy as np
+        from ..util.energy import radiated_energy, seismic_moment
+        from ..util.magnitude import HARMONIZED_COLUMN
+        from ..util.point_in_polygon import point_labels
+        from ..util.region_source import transform_geometry, geometry_rings
+        catalogue, mask, column = self.catalogue_and_mask(parameters, context, feedback)
+        data = catalogue['data']
+        source = self.parameterAsSource(parameters, self.DISTRICTS, context)
+        if source is None:
+            raise QgsProcessingException(self.invalidSourceError(parameters, self.DISTRICTS))
+
+        features = [feature for feature in source.getFeatures() if feature.hasGeometry()]
+        rings, ring_labels = [], []
+        for label, feature in enumerate(features):
+            part_rings = geometry_rings(transform_geometry(feature.geometry(), source.sourceCrs()))
+            rings.extend(part_rings)
+            ring_labels.extend([label] * len(part_rings))
+        ring_labels = np.array(ring_labels, dtype=np.int64)
+
+        labels = point_labels(data['longitude'].values[mask], data['latitude'].values[mask], rings, ring_labels)
+        inside = labels >= 0
+        labels = labels[inside]
+        magnitudes = data[column].values[mask][inside]
+        mw = data[HARMONIZED_COLUMN].values[mask][inside]
+        count = len(features)
+        counts = np.bincount(labels, minlength=count)
+        max_magnitude = np.full(count, np.nan)
+        np.fmax.at(max_magnitude, labels, magnitudes)
+        energy = np.bincount(labels, weights=radiated_energy(mw), minlength=count)
+        moment = np.bincount(labels, weights=seismic_moment(mw), minlength=count)
+
+        fields = extended_fields(source.fields(), (
+            ('deprem_sayisi', QVariant.Int), ('en_buyuk_m', QVariant.Double),
+            ('enerji_j', QVariant.Double), ('moment_nm', QVariant.Double)
+        ))
+        sink, dest_id = self.parameterAsSink(
+            parameters, self.OUTPUT, context, fields, source.wkbType(), source.sourceCrs()
+        )
+        if sink is None:
+            raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
+        for i, feature in enumerate(features):
+            if feedback.isCanceled():
+                break
+            output = QgsFeature(fields)
+            output.setGeometry(feature.geometry())
+            output.setAttributes(feature.attributes() + [
+                int(counts[i]),
+                None if np.isnan(max_magnitude[i]) else float(max_magnitude[i]),
+                float(energy[i]),
+                float(moment[i])
+            ])
+            sink.addFeature(output, QgsFeatureSink.FastInsert)
+        return {self.OUTPUT: dest_id}
+
+
+class SettlementExposureAlgorithm(EarthquakeAlgorithm):
+    """Her yerleşimin yarıçap içindeki deprem sayısı ve en büyük magnitüdü"""
+
+    SETTLEMENTS = 'SETTLEMENTS'
+    RADIUS = 'RADIUS'
+
+    def name(self):
+        return 'settlementexposure'
+
+    def displayName(self):
+        return self.tr('Yerleşim etkilenimi')
+
+    def shortHelpString(self):
+        return self.tr('Her yerleşim noktası için verilen yarıçap içindeki deprem sayısını ve en büyük magnitüdü yazar.')
+
+    def initAlgorithm(self, config=None):
+        self.add_catalogue_parameters()
+        self.addParameter(QgsProcessingParameterFeatureSource(
+            self.SETTLEMENTS, self.tr('Yerleşim (nokta) katmanı'), [QgsProcessing.TypeVectorPoint]
+        ))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.RADIUS, self.tr('Yarıçap (km)'), QgsProcessingParameterNumber.Double, defaultValue=10.0, minValue=0.1
+        ))
+        self.addParameter(QgsProcessingParameterFeatureSink(
+            self.OUTPUT, self.tr('Yerleşim etkilenimi'), QgsProcessing.TypeVectorPoint
+        ))
+
+    def processAlgorithm(self, parameters, context, feedback):
+        import numpy as np
+        from ..util.exposure import radius_event_stats
+        from ..util.spatial_index import local_km_coordinates
+        catalogue, mask, column = self.catalogue_and_mask(parameters, context, feedback)
+        source = self.parameterAsSource(parameters, self.SETTLEMENTS, context)
+        if source is None:
+            raise QgsProcessingException(self.invalidSourceError(parameters, self.SETTLEMENTS))
+
+        transform = wgs84_transform(source)
+        features, lonlat = [], []
+        for feature in source.getFeatures():
+            if not feature.hasGeometry():
+                continue
+            point = transform.transform(feature.geometry().centroid().asPoint())
+            features.append(feature)
+            lonlat.append((point.x(), point.y()))
+        lonlat = np.array(lonlat, dtype=np.float64).reshape(-1, 2)
+        qx, qy = local_km_coordinates(lonlat[:, 0], lonlat[:, 1], catalogue['origin'])
+
+        result = radius_event_stats(
+            qx, qy, catalogue['xy_km'][0][mask], catalogue['xy_km'][1][mask],
+            catalogue['data'][column].values[mask], self.parameterAsDouble(parameters, self.RADIUS, context),
+            progress=progress_callback(feedback)
+        )
+        if result is None:
+            return {}
+        counts, max_magnitude = result
+
+        fields = extended_fields(source.fields(), (('deprem_sayisi', QVariant.Int), ('en_buyuk_m', QVariant.Double)))
+        sink, dest_id = self.parameterAsSink(
+            parameters, self.OUTPUT, context, fields, source.wkbType(), source.sourceCrs()
+        )
+        if sink is None:
+            raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
+        for feature, count, magnitude in zip(features, counts, max_magnitude):
+            output = QgsFeature(fields)
+            output.setGeometry(feature.geometry())
+            output.setAttributes(feature.attributes() + [int(count), None if np.isnan(magnitude) else float(magnitude)])
+            sink.addFeature(output, QgsFeatureSink.FastInsert)
+        return {self.OUTPUT: dest_id}
+
+
+class FaultProximityAlgorithm(EarthquakeAlgorithm):
+    """Depremlerin en yakın faya uzaklığı; isteğe bağlı uzaklık eşiğiyle"""
+
+    FAULTS = 'FAULTS'
+    MAX_DISTANCE = 'MAX_DISTANCE'
+
+    def name(self):
+        return 'faultproximity'
+
+    def displayName(self):
+        return self.tr('Faya yakınlık')
+
+    def shortHelpString(self):
+        return self.tr('Her depremin en yakın fay hattına uzaklığını (km) ve fayın nesne kimliğini hesaplar. '
+                       'En büyük uzaklık 0 ise tüm depremler yazılır.')
+
+    def initAlgorithm(self, config=None):
+        self.add_catalogue_parameters()
+        self.addParameter(QgsProcessingParameterFeatureSource(
+            self.FAULTS, self.tr('Fay hatları katmanı'), [QgsProcessing.TypeVectorLine]
+        ))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.MAX_DISTANCE, self.tr('En büyük uzaklık (km, 0: sınırsız)'), QgsProcessingParameterNumber.Double,
+            defaultValue=10.0, minValue=0.0
+        ))
+        self.addParameter(QgsProcessingParameterFeatureSink(self.OUTPUT, self.tr('Faya yakın depremler')))
+
+    def processAlgorithm(self, parameters, context, feedback):
+        import numpy as np
+        from ..util.fault_distance import polyline_segments, nearest_fault
+        from ..util.region_source import WGS84
+        from ..util.spatial_index import local_km_coordinates
+        catalogue, mask, _ = self.catalogue_and_mask(parameters, context, feedback)
+        source = self.parameterAsSource(parameters, self.FAULTS, context)
+        if source is None:
+            raise QgsProcessingException(self.invalidSourceError(parameters, self.FAULTS))
+
+        # Fay hatları katalogla aynı yerel km koordinatlarında segmentlere çevrilir
+        transform = wgs84_transform(source)
+        polylines = []
+        for feature in source.getFeatures():
+            if not feature.hasGeometry():
+                continue
+            geometry = QgsGeometry(feature.geometry())
+            geometry.transform(transform)
+            parts = geometry.asMultiPolyline() if geometry.isMultipart() else [geometry.asPolyline()]
+            for part in parts:
+                if len(part) < 2:
+                    continue
+                lonlat = np.array([(p.x(), p.y()) for p in part])
+                x_km, y_km = local_km_coordinates(lonlat[:, 0], lonlat[:, 1], catalogue['origin'])
+                polylines.append((feature.id(), np.column_stack((x_km, y_km))))
+        segments = polyline_segments(polylines)
+        if len(segments[0]) == 0:
+            raise QgsProcessingException(self.tr('Fay katmanında çizgi geometrisi yok'))
+
+        positions = np.flatnonzero(mask)
+        result = nearest_fault(
+            catalogue['xy_km'][0][positions], catalogue['xy_km'][1][positions], segments,
+            progress=progress_callback(feedback)
+        )
+        if result is None:
+            return {}
+        distance, fault_id = result
+        max_distance = self.parameterAsDouble(parameters, self.MAX_DISTANCE, context)
+        if max_distance > 0:
+            near = distance <= max_distance
+            positions, distance, fault_id = positions[near], distance[near], fault_id[near]
+        feedback.pushInfo(self.tr('Yazılan deprem sayısı: {}').format(len(positions)))
+
+        fields = extended_fields(event_fields(), (('fault_distance_km', QVariant.Double), ('nearest_fault_id', QVariant.LongLong)))
+        sink, dest_id = self.parameterAsSink(
+            parameters, self.OUTPUT, context, fields, QgsWkbTypes.Point, QgsCoordinateReferenceSystem(WGS84)
+        )
+        if sink is None:
+            raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
+        self.write_events(sink, catalogue['data'], positions, [distance.astype(float), fault_id.astype(np.int64)], feedback)
+        return {self.OUTPUT: dest_id}
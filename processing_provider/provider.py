@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+from qgis.core import QgsProcessingProvider
+from qgis.PyQt.QtGui import QIcon
+
+from .algorithms import (
+    FilterEarthquakesByRegionAlgorithm, DistrictStatisticsAlgorithm,
+    SettlementExposureAlgorithm, FaultProximityAlgorithm
+)
+
+
+class EarthquakeProcessingProvider(QgsProcessingProvider):
+    """Deprem analizlerini Processing algoritmaları olarak sunar (araç kutusu, model tasarımcısı, qgis_process)"""
+
+    def loadAlgorithms(self):
+        for algorithm in (FilterEarthquakesByRegionAlgorithm(), DistrictStatisticsAlgorithm(),
+                          SettlementExposureAlgorithm(), FaultProximityAlgorithm()):
+            self.addAlgorithm(algorithm)
+
+    def id(self):
+        return 'pau_deprem'
+
+    def name(self):
+        return 'Deprem Analizi'
+
+    def icon(self):
+        return QIcon(os.path.join(
+            os.path.dirname(os.path.dirname(__file__)), "resources", "icon", "Pamukkale_University_logo.svg"
+        ))
+
+    def longName(self):
+        return self.name()
@@ -0,0 +1,829 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'ui/ui_EarthquakeAnalysisDialog.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtWidgets
+
+
+class Ui_IlceFilterDialog(object):
+    def setupUi(self, IlceFilterDialog):
+        IlceFilterDialog.setObjectName("IlceFilterDialog")
+        IlceFilterDialog.resize(800, 700)
+        IlceFilterDialog.setMinimumSize(QtCore.QSize(800, 700))
+        self.verticalLayout = QtWidgets.QVBoxLayout(IlceFilterDialog)
+        self.verticalLayout.setContentsMargins(12, 12, 12, 12)
+        self.verticalLayout.setSpacing(12)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.shapefileGroup = QtWidgets.QGroupBox(IlceFilterDialog)
+        self.shapefileGroup.setObjectName("shapefileGroup")
+        self.shapefileLayout = QtWidgets.QFormLayout(self.shapefileGroup)
+        self.shapefileLayout.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
+        self.shapefileLayout.setContentsMargins(12, 12, 12, 12)
+        self.shapefileLayout.setSpacing(12)
+        self.shapefileLayout.setObjectName("shapefileLayout")
+        self.filePathLayout = QtWidgets.QHBoxLayout()
+        self.filePathLayout.setSpacing(12)
+        self.filePathLayout.setObjectName("filePathLayout")
+        self.filePathEdit = QtWidgets.QLineEdit(self.shapefileGroup)
+        self.filePathEdit.setMinimumSize(QtCore.QSize(0, 25))
+        self.filePathEdit.setReadOnly(True)
+        self.filePathEdit.setObjectName("filePathEdit")
+        self.filePathLayout.addWidget(self.filePathEdit)
+        self.filePathButton = QtWidgets.QPushButton(self.shapefileGroup)
+        self.filePathButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.filePathButton.setObjectName("filePathButton")
+        self.filePathLayout.addWidget(self.filePathButton)
+        self.shapefileLayout.setLayout(0, QtWidgets.QFormLayout.SpanningRole, self.filePathLayout)
+        self.ilColumnLabel = QtWidgets.QLabel(self.shapefileGroup)
+        self.ilColumnLabel.setObjectName("ilColumnLabel")
+        self.shapefileLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.ilColumnLabel)
+        self.ilColumnComboBox = QtWidgets.QComboBox(self.shapefileGroup)
+        self.ilColumnComboBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.ilColumnComboBox.setObjectName("ilColumnComboBox")
+        self.shapefileLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.ilColumnComboBox)
+        self.ilceColumnLabel = QtWidgets.QLabel(self.shapefileGroup)
+        self.ilceColumnLabel.setObjectName("ilceColumnLabel")
+        self.shapefileLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.ilceColumnLabel)
+        self.ilceColumnComboBox = QtWidgets.QComboBox(self.shapefileGroup)
+        self.ilceColumnComboBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.ilceColumnComboBox.setObjectName("ilceColumnComboBox")
+        self.shapefileLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.ilceColumnComboBox)
+        self.projectStoreLabel = QtWidgets.QLabel(self.shapefileGroup)
+        self.projectStoreLabel.setObjectName("projectStoreLabel")
+        self.shapefileLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.projectStoreLabel)
+        self.projectStoreLayout = QtWidgets.QHBoxLayout()
+        self.projectStoreLayout.setSpacing(12)
+        self.projectStoreLayout.setObjectName("projectStoreLayout")
+        self.projectStoreEdit = QtWidgets.QLineEdit(self.shapefileGroup)
+        self.projectStoreEdit.setMinimumSize(QtCore.QSize(0, 25))
+        self.projectStoreEdit.setReadOnly(True)
+        self.projectStoreEdit.setObjectName("projectStoreEdit")
+        self.projectStoreLayout.addWidget(self.projectStoreEdit)
+        self.projectStoreOpenButton = QtWidgets.QPushButton(self.shapefileGroup)
+        self.projectStoreOpenButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.projectStoreOpenButton.setObjectName("projectStoreOpenButton")
+        self.projectStoreLayout.addWidget(self.projectStoreOpenButton)
+        self.projectStoreImportButton = QtWidgets.QPushButton(self.shapefileGroup)
+        self.projectStoreImportButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.projectStoreImportButton.setObjectName("projectStoreImportButton")
+        self.projectStoreLayout.addWidget(self.projectStoreImportButton)
+        self.shapefileLayout.setLayout(3, QtWidgets.QFormLayout.FieldRole, self.projectStoreLayout)
+        self.verticalLayout.addWidget(self.shapefileGroup)
+        self.earthquakeGroup = QtWidgets.QGroupBox(IlceFilterDialog)
+        self.earthquakeGroup.setObjectName("earthquakeGroup")
+        self.earthquakeLayout = QtWidgets.QFormLayout(self.earthquakeGroup)
+        self.earthquakeLayout.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
+        self.earthquakeLayout.setContentsMargins(12, 12, 12, 12)
+        self.earthquakeLayout.setSpacing(24)
+        self.earthquakeLayout.setObjectName("earthquakeLayout")
+        self.csvFileLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.csvFileLabel.setObjectName("csvFileLabel")
+        self.earthquakeLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.csvFileLabel)
+        self.csvFileLayout = QtWidgets.QHBoxLayout()
+        self.csvFileLayout.setSpacing(12)
+        self.csvFileLayout.setObjectName("csvFileLayout")
+        self.csvFileEdit = QtWidgets.QLineEdit(self.earthquakeGroup)
+        self.csvFileEdit.setMinimumSize(QtCore.QSize(0, 25))
+        self.csvFileEdit.setReadOnly(True)
+        self.csvFileEdit.setObjectName("csvFileEdit")
+        self.csvFileLayout.addWidget(self.csvFileEdit)
+        self.csvFileButton = QtWidgets.QPushButton(self.earthquakeGroup)
+        self.csvFileButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.csvFileButton.setObjectName("csvFileButton")
+        self.csvFileLayout.addWidget(self.csvFileButton)
+        self.watchCheckBox = QtWidgets.QCheckBox(self.earthquakeGroup)
+        self.watchCheckBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.watchCheckBox.setObjectName("watchCheckBox")
+        self.csvFileLayout.addWidget(self.watchCheckBox)
+        self.earthquakeLayout.setLayout(0, QtWidgets.QFormLayout.FieldRole, self.csvFileLayout)
+        self.yearRangeLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.yearRangeLabel.setObjectName("yearRangeLabel")
+        self.earthquakeLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.yearRangeLabel)
+        self.yearRangeLayout = QtWidgets.QHBoxLayout()
+        self.yearRangeLayout.setSpacing(12)
+        self.yearRangeLayout.setObjectName("yearRangeLayout")
+        self.yearComboBox = QtWidgets.QComboBox(self.earthquakeGroup)
+        self.yearComboBox.setMinimumSize(QtCore.QSize(120, 25))
+        self.yearComboBox.setObjectName("yearComboBox")
+        self.yearRangeLayout.addWidget(self.yearComboBox)
+        self.yearSeparatorLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.yearSeparatorLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.yearSeparatorLabel.setObjectName("yearSeparatorLabel")
+        self.yearRangeLayout.addWidget(self.yearSeparatorLabel)
+        self.endYearComboBox = QtWidgets.QComboBox(self.earthquakeGroup)
+        self.endYearComboBox.setMinimumSize(QtCore.QSize(120, 25))
+        self.endYearComboBox.setObjectName("endYearComboBox")
+        self.yearRangeLayout.addWidget(self.endYearComboBox)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.yearRangeLayout.addItem(spacerItem)
+        self.settlementDistanceLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.settlementDistanceLabel.setMinimumSize(QtCore.QSize(0, 25))
+        self.settlementDistanceLabel.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignVCenter)
+        self.settlementDistanceLabel.setObjectName("settlementDistanceLabel")
+        self.yearRangeLayout.addWidget(self.settlementDistanceLabel)
+        self.settlementDistanceSpinBox = QtWidgets.QSpinBox(self.earthquakeGroup)
+        self.settlementDistanceSpinBox.setMinimumSize(QtCore.QSize(120, 25))
+        self.settlementDistanceSpinBox.setMaximum(100)
+        self.settlementDistanceSpinBox.setSingleStep(1)
+        self.settlementDistanceSpinBox.setEnabled(False)
+        self.settlementDistanceSpinBox.setObjectName("settlementDistanceSpinBox")
+        self.yearRangeLayout.addWidget(self.settlementDistanceSpinBox)
+        self.earthquakeLayout.setLayout(1, QtWidgets.QFormLayout.FieldRole, self.yearRangeLayout)
+        self.magnitudeRangeLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.magnitudeRangeLabel.setObjectName("magnitudeRangeLabel")
+        self.earthquakeLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.magnitudeRangeLabel)
+        self.magnitudeRangeLayout = QtWidgets.QHBoxLayout()
+        self.magnitudeRangeLayout.setSpacing(12)
+        self.magnitudeRangeLayout.setObjectName("magnitudeRangeLayout")
+        self.minMagnitudeSpinBox = QtWidgets.QDoubleSpinBox(self.earthquakeGroup)
+        self.minMagnitudeSpinBox.setMinimumSize(QtCore.QSize(120, 25))
+        self.minMagnitudeSpinBox.setDecimals(1)
+        self.minMagnitudeSpinBox.setMinimum(0.0)
+        self.minMagnitudeSpinBox.setMaximum(10.0)
+        self.minMagnitudeSpinBox.setSingleStep(0.1)
+        self.minMagnitudeSpinBox.setObjectName("minMagnitudeSpinBox")
+        self.magnitudeRangeLayout.addWidget(self.minMagnitudeSpinBox)
+        self.magnitudeSeparatorLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.magnitudeSeparatorLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.magnitudeSeparatorLabel.setObjectName("magnitudeSeparatorLabel")
+        self.magnitudeRangeLayout.addWidget(self.magnitudeSeparatorLabel)
+        self.maxMagnitudeSpinBox = QtWidgets.QDoubleSpinBox(self.earthquakeGroup)
+        self.maxMagnitudeSpinBox.setMinimumSize(QtCore.QSize(120, 25))
+        self.maxMagnitudeSpinBox.setDecimals(1)
+        self.maxMagnitudeSpinBox.setMinimum(0.0)
+        self.maxMagnitudeSpinBox.setMaximum(10.0)
+        self.maxMagnitudeSpinBox.setSingleStep(0.1)
+        self.maxMagnitudeSpinBox.setProperty("value", 10.0)
+        self.maxMagnitudeSpinBox.setObjectName("maxMagnitudeSpinBox")
+        self.magnitudeRangeLayout.addWidget(self.maxMagnitudeSpinBox)
+        self.magnitudeScaleComboBox = QtWidgets.QComboBox(self.earthquakeGroup)
+        self.magnitudeScaleComboBox.setMinimumSize(QtCore.QSize(120, 25))
+        self.magnitudeScaleComboBox.setObjectName("magnitudeScaleComboBox")
+        self.magnitudeScaleComboBox.addItem("")
+        self.magnitudeScaleComboBox.addItem("")
+        self.magnitudeRangeLayout.addWidget(self.magnitudeScaleComboBox)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.magnitudeRangeLayout.addItem(spacerItem1)
+        self.earthquakeLayout.setLayout(2, QtWidgets.QFormLayout.FieldRole, self.magnitudeRangeLayout)
+        self.displayModeLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.displayModeLabel.setObjectName("displayModeLabel")
+        self.earthquakeLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.displayModeLabel)
+        self.displayModeLayout = QtWidgets.QHBoxLayout()
+        self.displayModeLayout.setSpacing(12)
+        self.displayModeLayout.setObjectName("displayModeLayout")
+        self.densityCheckBox = QtWidgets.QCheckBox(self.earthquakeGroup)
+        self.densityCheckBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.densityCheckBox.setObjectName("densityCheckBox")
+        self.displayModeLayout.addWidget(self.densityCheckBox)
+        self.lodCheckBox = QtWidgets.QCheckBox(self.earthquakeGroup)
+        self.lodCheckBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.lodCheckBox.setChecked(True)
+        self.lodCheckBox.setObjectName("lodCheckBox")
+        self.displayModeLayout.addWidget(self.lodCheckBox)
+        self.catalogueSubsetCheckBox = QtWidgets.QCheckBox(self.earthquakeGroup)
+        self.catalogueSubsetCheckBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.catalogueSubsetCheckBox.setObjectName("catalogueSubsetCheckBox")
+        self.displayModeLayout.addWidget(self.catalogueSubsetCheckBox)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.displayModeLayout.addItem(spacerItem2)
+        self.densityBandwidthLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.densityBandwidthLabel.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignVCenter)
+        self.densityBandwidthLabel.setObjectName("densityBandwidthLabel")
+        self.displayModeLayout.addWidget(self.densityBandwidthLabel)
+        self.densityBandwidthSpinBox = QtWidgets.QDoubleSpinBox(self.earthquakeGroup)
+        self.densityBandwidthSpinBox.setMinimumSize(QtCore.QSize(120, 25))
+        self.densityBandwidthSpinBox.setDecimals(1)
+        self.densityBandwidthSpinBox.setMinimum(0.0)
+        self.densityBandwidthSpinBox.setMaximum(100.0)
+        self.densityBandwidthSpinBox.setSingleStep(1.0)
+        self.densityBandwidthSpinBox.setProperty("value", 10.0)
+        self.densityBandwidthSpinBox.setObjectName("densityBandwidthSpinBox")
+        self.displayModeLayout.addWidget(self.densityBandwidthSpinBox)
+        self.earthquakeLayout.setLayout(3, QtWidgets.QFormLayout.FieldRole, self.displayModeLayout)
+        self.declusterLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.declusterLabel.setObjectName("declusterLabel")
+        self.earthquakeLayout.setWidget(4, QtWidgets.QFormLayout.LabelRole, self.declusterLabel)
+        self.declusterLayout = QtWidgets.QHBoxLayout()
+        self.declusterLayout.setSpacing(12)
+        self.declusterLayout.setObjectName("declusterLayout")
+        self.declusterMethodComboBox = QtWidgets.QComboBox(self.earthquakeGroup)
+        self.declusterMethodComboBox.setMinimumSize(QtCore.QSize(160, 25))
+        self.declusterMethodComboBox.setObjectName("declusterMethodComboBox")
+        self.declusterLayout.addWidget(self.declusterMethodComboBox)
+        self.declusterButton = QtWidgets.QPushButton(self.earthquakeGroup)
+        self.declusterButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.declusterButton.setObjectName("declusterButton")
+        self.declusterLayout.addWidget(self.declusterButton)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.declusterLayout.addItem(spacerItem3)
+        self.mainshockOnlyCheckBox = QtWidgets.QCheckBox(self.earthquakeGroup)
+        self.mainshockOnlyCheckBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.mainshockOnlyCheckBox.setObjectName("mainshockOnlyCheckBox")
+        self.declusterLayout.addWidget(self.mainshockOnlyCheckBox)
+        self.earthquakeLayout.setLayout(4, QtWidgets.QFormLayout.FieldRole, self.declusterLayout)
+        self.depthRangeLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.depthRangeLabel.setObjectName("depthRangeLabel")
+        self.earthquakeLayout.setWidget(5, QtWidgets.QFormLayout.LabelRole, self.depthRangeLabel)
+        self.depthRangeLayout = QtWidgets.QHBoxLayout()
+        self.depthRangeLayout.setSpacing(12)
+        self.depthRangeLayout.setObjectName("depthRangeLayout")
+        self.minDepthSpinBox = QtWidgets.QDoubleSpinBox(self.earthquakeGroup)
+        self.minDepthSpinBox.setMinimumSize(QtCore.QSize(120, 25))
+        self.minDepthSpinBox.setDecimals(1)
+        self.minDepthSpinBox.setMinimum(0.0)
+        self.minDepthSpinBox.setMaximum(700.0)
+        self.minDepthSpinBox.setSingleStep(1.0)
+        self.minDepthSpinBox.setObjectName("minDepthSpinBox")
+        self.depthRangeLayout.addWidget(self.minDepthSpinBox)
+        self.depthSeparatorLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.depthSeparatorLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.depthSeparatorLabel.setObjectName("depthSeparatorLabel")
+        self.depthRangeLayout.addWidget(self.depthSeparatorLabel)
+        self.maxDepthSpinBox = QtWidgets.QDoubleSpinBox(self.earthquakeGroup)
+        self.maxDepthSpinBox.setMinimumSize(QtCore.QSize(120, 25))
+        self.maxDepthSpinBox.setDecimals(1)
+        self.maxDepthSpinBox.setMinimum(0.0)
+        self.maxDepthSpinBox.setMaximum(700.0)
+        self.maxDepthSpinBox.setSingleStep(1.0)
+        self.maxDepthSpinBox.setProperty("value", 700.0)
+        self.maxDepthSpinBox.setObjectName("maxDepthSpinBox")
+        self.depthRangeLayout.addWidget(self.maxDepthSpinBox)
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.depthRangeLayout.addItem(spacerItem4)
+        self.earthquakeLayout.setLayout(5, QtWidgets.QFormLayout.FieldRole, self.depthRangeLayout)
+        self.swathWidthLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.swathWidthLabel.setObjectName("swathWidthLabel")
+        self.earthquakeLayout.setWidget(6, QtWidgets.QFormLayout.LabelRole, self.swathWidthLabel)
+        self.swathWidthLayout = QtWidgets.QHBoxLayout()
+        self.swathWidthLayout.setSpacing(12)
+        self.swathWidthLayout.setObjectName("swathWidthLayout")
+        self.swathWidthSpinBox = QtWidgets.QDoubleSpinBox(self.earthquakeGroup)
+        self.swathWidthSpinBox.setMinimumSize(QtCore.QSize(120, 25))
+        self.swathWidthSpinBox.setDecimals(1)
+        self.swathWidthSpinBox.setMinimum(0.0)
+        self.swathWidthSpinBox.setMaximum(500.0)
+        self.swathWidthSpinBox.setSingleStep(1.0)
+        self.swathWidthSpinBox.setProperty("value", 20.0)
+        self.swathWidthSpinBox.setObjectName("swathWidthSpinBox")
+        self.swathWidthLayout.addWidget(self.swathWidthSpinBox)
+        spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.swathWidthLayout.addItem(spacerItem5)
+        self.earthquakeLayout.setLayout(6, QtWidgets.QFormLayout.FieldRole, self.swathWidthLayout)
+        self.feedLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.feedLabel.setObjectName("feedLabel")
+        self.earthquakeLayout.setWidget(7, QtWidgets.QFormLayout.LabelRole, self.feedLabel)
+        self.feedLayout = QtWidgets.QHBoxLayout()
+        self.feedLayout.setSpacing(12)
+        self.feedLayout.setObjectName("feedLayout")
+        self.feedUrlEdit = QtWidgets.QLineEdit(self.earthquakeGroup)
+        self.feedUrlEdit.setMinimumSize(QtCore.QSize(0, 25))
+        self.feedUrlEdit.setObjectName("feedUrlEdit")
+        self.feedLayout.addWidget(self.feedUrlEdit)
+        self.feedFormatComboBox = QtWidgets.QComboBox(self.earthquakeGroup)
+        self.feedFormatComboBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.feedFormatComboBox.setObjectName("feedFormatComboBox")
+        self.feedFormatComboBox.addItem("")
+        self.feedFormatComboBox.addItem("")
+        self.feedLayout.addWidget(self.feedFormatComboBox)
+        self.feedStartDateEdit = QtWidgets.QDateEdit(self.earthquakeGroup)
+        self.feedStartDateEdit.setMinimumSize(QtCore.QSize(0, 25))
+        self.feedStartDateEdit.setCalendarPopup(True)
+        self.feedStartDateEdit.setDate(QtCore.QDate(2020, 1, 1))
+        self.feedStartDateEdit.setObjectName("feedStartDateEdit")
+        self.feedLayout.addWidget(self.feedStartDateEdit)
+        self.feedSeparatorLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.feedSeparatorLabel.setObjectName("feedSeparatorLabel")
+        self.feedLayout.addWidget(self.feedSeparatorLabel)
+        self.feedEndDateEdit = QtWidgets.QDateEdit(self.earthquakeGroup)
+        self.feedEndDateEdit.setMinimumSize(QtCore.QSize(0, 25))
+        self.feedEndDateEdit.setCalendarPopup(True)
+        self.feedEndDateEdit.setDate(QtCore.QDate(2025, 1, 1))
+        self.feedEndDateEdit.setObjectName("feedEndDateEdit")
+        self.feedLayout.addWidget(self.feedEndDateEdit)
+        self.feedButton = QtWidgets.QPushButton(self.earthquakeGroup)
+        self.feedButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.feedButton.setObjectName("feedButton")
+        self.feedLayout.addWidget(self.feedButton)
+        self.earthquakeLayout.setLayout(7, QtWidgets.QFormLayout.FieldRole, self.feedLayout)
+        self.pgaLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.pgaLabel.setObjectName("pgaLabel")
+        self.earthquakeLayout.setWidget(8, QtWidgets.QFormLayout.LabelRole, self.pgaLabel)
+        self.pgaLayout = QtWidgets.QHBoxLayout()
+        self.pgaLayout.setSpacing(12)
+        self.pgaLayout.setObjectName("pgaLayout")
+        self.pgaCheckBox = QtWidgets.QCheckBox(self.earthquakeGroup)
+        self.pgaCheckBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.pgaCheckBox.setObjectName("pgaCheckBox")
+        self.pgaLayout.addWidget(self.pgaCheckBox)
+        self.pgaModelComboBox = QtWidgets.QComboBox(self.earthquakeGroup)
+        self.pgaModelComboBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.pgaModelComboBox.setObjectName("pgaModelComboBox")
+        self.pgaLayout.addWidget(self.pgaModelComboBox)
+        self.pgaCutoffLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.pgaCutoffLabel.setObjectName("pgaCutoffLabel")
+        self.pgaLayout.addWidget(self.pgaCutoffLabel)
+        self.pgaCutoffSpinBox = QtWidgets.QDoubleSpinBox(self.earthquakeGroup)
+        self.pgaCutoffSpinBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.pgaCutoffSpinBox.setDecimals(0)
+        self.pgaCutoffSpinBox.setMinimum(10.0)
+        self.pgaCutoffSpinBox.setMaximum(500.0)
+        self.pgaCutoffSpinBox.setSingleStep(10.0)
+        self.pgaCutoffSpinBox.setProperty("value", 100.0)
+        self.pgaCutoffSpinBox.setObjectName("pgaCutoffSpinBox")
+        self.pgaLayout.addWidget(self.pgaCutoffSpinBox)
+        self.pgaCellLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.pgaCellLabel.setObjectName("pgaCellLabel")
+        self.pgaLayout.addWidget(self.pgaCellLabel)
+        self.pgaCellSpinBox = QtWidgets.QDoubleSpinBox(self.earthquakeGroup)
+        self.pgaCellSpinBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.pgaCellSpinBox.setDecimals(1)
+        self.pgaCellSpinBox.setMinimum(0.5)
+        self.pgaCellSpinBox.setMaximum(20.0)
+        self.pgaCellSpinBox.setSingleStep(0.5)
+        self.pgaCellSpinBox.setProperty("value", 2.0)
+        self.pgaCellSpinBox.setObjectName("pgaCellSpinBox")
+        self.pgaLayout.addWidget(self.pgaCellSpinBox)
+        self.pgaPercentileLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.pgaPercentileLabel.setObjectName("pgaPercentileLabel")
+        self.pgaLayout.addWidget(self.pgaPercentileLabel)
+        self.pgaPercentileSpinBox = QtWidgets.QDoubleSpinBox(self.earthquakeGroup)
+        self.pgaPercentileSpinBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.pgaPercentileSpinBox.setSuffix("")
+        self.pgaPercentileSpinBox.setDecimals(0)
+        self.pgaPercentileSpinBox.setMinimum(50.0)
+        self.pgaPercentileSpinBox.setMaximum(100.0)
+        self.pgaPercentileSpinBox.setSingleStep(5.0)
+        self.pgaPercentileSpinBox.setProperty("value", 100.0)
+        self.pgaPercentileSpinBox.setObjectName("pgaPercentileSpinBox")
+        self.pgaLayout.addWidget(self.pgaPercentileSpinBox)
+        self.pgaWorkersLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.pgaWorkersLabel.setObjectName("pgaWorkersLabel")
+        self.pgaLayout.addWidget(self.pgaWorkersLabel)
+        self.pgaWorkersSpinBox = QtWidgets.QSpinBox(self.earthquakeGroup)
+        self.pgaWorkersSpinBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.pgaWorkersSpinBox.setMinimum(1)
+        self.pgaWorkersSpinBox.setMaximum(32)
+        self.pgaWorkersSpinBox.setProperty("value", 1)
+        self.pgaWorkersSpinBox.setObjectName("pgaWorkersSpinBox")
+        self.pgaLayout.addWidget(self.pgaWorkersSpinBox)
+        self.earthquakeLayout.setLayout(8, QtWidgets.QFormLayout.FieldRole, self.pgaLayout)
+        self.mwConversionLabel = QtWidgets.QLabel(self.earthquakeGroup)
+        self.mwConversionLabel.setObjectName("mwConversionLabel")
+        self.earthquakeLayout.setWidget(9, QtWidgets.QFormLayout.LabelRole, self.mwConversionLabel)
+        self.mwConversionEdit = QtWidgets.QLineEdit(self.earthquakeGroup)
+        self.mwConversionEdit.setMinimumSize(QtCore.QSize(0, 25))
+        self.mwConversionEdit.setObjectName("mwConversionEdit")
+        self.earthquakeLayout.setWidget(9, QtWidgets.QFormLayout.FieldRole, self.mwConversionEdit)
+        self.verticalLayout.addWidget(self.earthquakeGroup)
+        self.filterGroup = QtWidgets.QGroupBox(IlceFilterDialog)
+        self.filterGroup.setObjectName("filterGroup")
+        self.filterLayout = QtWidgets.QFormLayout(self.filterGroup)
+        self.filterLayout.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
+        self.filterLayout.setContentsMargins(12, 12, 12, 12)
+        self.filterLayout.setSpacing(12)
+        self.filterLayout.setObjectName("filterLayout")
+        self.ilLabel = QtWidgets.QLabel(self.filterGroup)
+        self.ilLabel.setObjectName("ilLabel")
+        self.filterLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.ilLabel)
+        self.ilComboBox = QtWidgets.QComboBox(self.filterGroup)
+        self.ilComboBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.ilComboBox.setObjectName("ilComboBox")
+        self.filterLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.ilComboBox)
+        self.ilceLabel = QtWidgets.QLabel(self.filterGroup)
+        self.ilceLabel.setObjectName("ilceLabel")
+        self.filterLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.ilceLabel)
+        self.ilceComboBox = QtWidgets.QComboBox(self.filterGroup)
+        self.ilceComboBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.ilceComboBox.setObjectName("ilceComboBox")
+        self.filterLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.ilceComboBox)
+        self.optionsLayout = QtWidgets.QHBoxLayout()
+        self.optionsLayout.setContentsMargins(0, 6, 0, 6)
+        self.optionsLayout.setSpacing(12)
+        self.optionsLayout.setObjectName("optionsLayout")
+        self.showLabelsCheckBox = QtWidgets.QCheckBox(self.filterGroup)
+        self.showLabelsCheckBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.showLabelsCheckBox.setObjectName("showLabelsCheckBox")
+        self.optionsLayout.addWidget(self.showLabelsCheckBox)
+        spacerItem6 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.optionsLayout.addItem(spacerItem6)
+        self.bufferLabel = QtWidgets.QLabel(self.filterGroup)
+        self.bufferLabel.setMinimumSize(QtCore.QSize(0, 25))
+        self.bufferLabel.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignVCenter)
+        self.bufferLabel.setObjectName("bufferLabel")
+        self.optionsLayout.addWidget(self.bufferLabel)
+        self.bufferSpinBox = QtWidgets.QSpinBox(self.filterGroup)
+        self.bufferSpinBox.setMinimumSize(QtCore.QSize(120, 25))
+        self.bufferSpinBox.setMaximum(500)
+        self.bufferSpinBox.setSingleStep(5)
+        self.bufferSpinBox.setObjectName("bufferSpinBox")
+        self.optionsLayout.addWidget(self.bufferSpinBox)
+        self.filterLayout.setLayout(2, QtWidgets.QFormLayout.SpanningRole, self.optionsLayout)
+        self.regionSourceLabel = QtWidgets.QLabel(self.filterGroup)
+        self.regionSourceLabel.setObjectName("regionSourceLabel")
+        self.filterLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.regionSourceLabel)
+        self.regionSourceLayout = QtWidgets.QHBoxLayout()
+        self.regionSourceLayout.setSpacing(12)
+        self.regionSourceLayout.setObjectName("regionSourceLayout")
+        self.regionSourceValueLabel = QtWidgets.QLabel(self.filterGroup)
+        self.regionSourceValueLabel.setObjectName("regionSourceValueLabel")
+        self.regionSourceLayout.addWidget(self.regionSourceValueLabel)
+        spacerItem7 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.regionSourceLayout.addItem(spacerItem7)
+        self.regionSourceResetButton = QtWidgets.QPushButton(self.filterGroup)
+        self.regionSourceResetButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.regionSourceResetButton.setObjectName("regionSourceResetButton")
+        self.regionSourceLayout.addWidget(self.regionSourceResetButton)
+        self.filterLayout.setLayout(3, QtWidgets.QFormLayout.FieldRole, self.regionSourceLayout)
+        self.regionTreeLabel = QtWidgets.QLabel(self.filterGroup)
+        self.regionTreeLabel.setObjectName("regionTreeLabel")
+        self.filterLayout.setWidget(4, QtWidgets.QFormLayout.LabelRole, self.regionTreeLabel)
+        self.regionTreeLayout = QtWidgets.QVBoxLayout()
+        self.regionTreeLayout.setSpacing(6)
+        self.regionTreeLayout.setObjectName("regionTreeLayout")
+        self.regionTreeWidget = QtWidgets.QTreeWidget(self.filterGroup)
+        self.regionTreeWidget.setMinimumSize(QtCore.QSize(0, 120))
+        self.regionTreeWidget.setObjectName("regionTreeWidget")
+        self.regionTreeLayout.addWidget(self.regionTreeWidget)
+        self.regionSelectionLayout = QtWidgets.QHBoxLayout()
+        self.regionSelectionLayout.setSpacing(12)
+        self.regionSelectionLayout.setObjectName("regionSelectionLayout")
+        self.regionSelectionButton = QtWidgets.QPushButton(self.filterGroup)
+        self.regionSelectionButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.regionSelectionButton.setObjectName("regionSelectionButton")
+        self.regionSelectionLayout.addWidget(self.regionSelectionButton)
+        self.breakdownCheckBox = QtWidgets.QCheckBox(self.filterGroup)
+        self.breakdownCheckBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.breakdownCheckBox.setChecked(True)
+        self.breakdownCheckBox.setObjectName("breakdownCheckBox")
+        self.regionSelectionLayout.addWidget(self.breakdownCheckBox)
+        spacerItem8 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.regionSelectionLayout.addItem(spacerItem8)
+        self.regionTreeLayout.addLayout(self.regionSelectionLayout)
+        self.filterLayout.setLayout(4, QtWidgets.QFormLayout.FieldRole, self.regionTreeLayout)
+        self.verticalLayout.addWidget(self.filterGroup)
+        self.faultLinesGroup = QtWidgets.QGroupBox(IlceFilterDialog)
+        self.faultLinesGroup.setObjectName("faultLinesGroup")
+        self.faultLinesLayout = QtWidgets.QFormLayout(self.faultLinesGroup)
+        self.faultLinesLayout.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
+        self.faultLinesLayout.setContentsMargins(12, 12, 12, 12)
+        self.faultLinesLayout.setSpacing(12)
+        self.faultLinesLayout.setObjectName("faultLinesLayout")
+        self.faultLineFileLayout = QtWidgets.QHBoxLayout()
+        self.faultLineFileLayout.setSpacing(12)
+        self.faultLineFileLayout.setObjectName("faultLineFileLayout")
+        self.faultLineFileEdit = QtWidgets.QLineEdit(self.faultLinesGroup)
+        self.faultLineFileEdit.setMinimumSize(QtCore.QSize(0, 25))
+        self.faultLineFileEdit.setReadOnly(True)
+        self.faultLineFileEdit.setObjectName("faultLineFileEdit")
+        self.faultLineFileLayout.addWidget(self.faultLineFileEdit)
+        self.faultLineFileButton = QtWidgets.QPushButton(self.faultLinesGroup)
+        self.faultLineFileButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.faultLineFileButton.setObjectName("faultLineFileButton")
+        self.faultLineFileLayout.addWidget(self.faultLineFileButton)
+        self.faultLinesLayout.setLayout(0, QtWidgets.QFormLayout.SpanningRole, self.faultLineFileLayout)
+        self.faultDistanceLabel = QtWidgets.QLabel(self.faultLinesGroup)
+        self.faultDistanceLabel.setObjectName("faultDistanceLabel")
+        self.faultLinesLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.faultDistanceLabel)
+        self.faultDistanceSpinBox = QtWidgets.QDoubleSpinBox(self.faultLinesGroup)
+        self.faultDistanceSpinBox.setMinimumSize(QtCore.QSize(120, 25))
+        self.faultDistanceSpinBox.setDecimals(1)
+        self.faultDistanceSpinBox.setMaximum(500.0)
+        self.faultDistanceSpinBox.setSingleStep(1.0)
+        self.faultDistanceSpinBox.setObjectName("faultDistanceSpinBox")
+        self.faultLinesLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.faultDistanceSpinBox)
+        self.verticalLayout.addWidget(self.faultLinesGroup)
+        self.settlementGroup = QtWidgets.QGroupBox(IlceFilterDialog)
+        self.settlementGroup.setObjectName("settlementGroup")
+        self.settlementLayout = QtWidgets.QFormLayout(self.settlementGroup)
+        self.settlementLayout.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
+        self.settlementLayout.setContentsMargins(12, 12, 12, 12)
+        self.settlementLayout.setSpacing(12)
+        self.settlementLayout.setObjectName("settlementLayout")
+        self.settlementFileLayout = QtWidgets.QHBoxLayout()
+        self.settlementFileLayout.setSpacing(12)
+        self.settlementFileLayout.setObjectName("settlementFileLayout")
+        self.settlementFileEdit = QtWidgets.QLineEdit(self.settlementGroup)
+        self.settlementFileEdit.setMinimumSize(QtCore.QSize(0, 25))
+        self.settlementFileEdit.setReadOnly(True)
+        self.settlementFileEdit.setObjectName("settlementFileEdit")
+        self.settlementFileLayout.addWidget(self.settlementFileEdit)
+        self.settlementFileButton = QtWidgets.QPushButton(self.settlementGroup)
+        self.settlementFileButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.settlementFileButton.setObjectName("settlementFileButton")
+        self.settlementFileLayout.addWidget(self.settlementFileButton)
+        self.settlementLayout.setLayout(0, QtWidgets.QFormLayout.SpanningRole, self.settlementFileLayout)
+        self.settlementIlLabel = QtWidgets.QLabel(self.settlementGroup)
+        self.settlementIlLabel.setObjectName("settlementIlLabel")
+        self.settlementLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.settlementIlLabel)
+        self.settlementIlColumnComboBox = QtWidgets.QComboBox(self.settlementGroup)
+        self.settlementIlColumnComboBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.settlementIlColumnComboBox.setObjectName("settlementIlColumnComboBox")
+        self.settlementLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.settlementIlColumnComboBox)
+        self.settlementIlceLabel = QtWidgets.QLabel(self.settlementGroup)
+        self.settlementIlceLabel.setObjectName("settlementIlceLabel")
+        self.settlementLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.settlementIlceLabel)
+        self.settlementIlceColumnComboBox = QtWidgets.QComboBox(self.settlementGroup)
+        self.settlementIlceColumnComboBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.settlementIlceColumnComboBox.setObjectName("settlementIlceColumnComboBox")
+        self.settlementLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.settlementIlceColumnComboBox)
+        self.settlementExposureLabel = QtWidgets.QLabel(self.settlementGroup)
+        self.settlementExposureLabel.setObjectName("settlementExposureLabel")
+        self.settlementLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.settlementExposureLabel)
+        self.settlementExposureLayout = QtWidgets.QHBoxLayout()
+        self.settlementExposureLayout.setSpacing(12)
+        self.settlementExposureLayout.setObjectName("settlementExposureLayout")
+        self.settlementMagnitudeLabel = QtWidgets.QLabel(self.settlementGroup)
+        self.settlementMagnitudeLabel.setObjectName("settlementMagnitudeLabel")
+        self.settlementExposureLayout.addWidget(self.settlementMagnitudeLabel)
+        self.settlementMagnitudeSpinBox = QtWidgets.QDoubleSpinBox(self.settlementGroup)
+        self.settlementMagnitudeSpinBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.settlementMagnitudeSpinBox.setSuffix("")
+        self.settlementMagnitudeSpinBox.setDecimals(1)
+        self.settlementMagnitudeSpinBox.setMinimum(0.0)
+        self.settlementMagnitudeSpinBox.setMaximum(10.0)
+        self.settlementMagnitudeSpinBox.setSingleStep(0.1)
+        self.settlementMagnitudeSpinBox.setProperty("value", 4.0)
+        self.settlementMagnitudeSpinBox.setObjectName("settlementMagnitudeSpinBox")
+        self.settlementExposureLayout.addWidget(self.settlementMagnitudeSpinBox)
+        self.settlementRadiusLabel = QtWidgets.QLabel(self.settlementGroup)
+        self.settlementRadiusLabel.setObjectName("settlementRadiusLabel")
+        self.settlementExposureLayout.addWidget(self.settlementRadiusLabel)
+        self.settlementRadiusSpinBox = QtWidgets.QDoubleSpinBox(self.settlementGroup)
+        self.settlementRadiusSpinBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.settlementRadiusSpinBox.setDecimals(0)
+        self.settlementRadiusSpinBox.setMinimum(1.0)
+        self.settlementRadiusSpinBox.setMaximum(200.0)
+        self.settlementRadiusSpinBox.setSingleStep(1.0)
+        self.settlementRadiusSpinBox.setProperty("value", 10.0)
+        self.settlementRadiusSpinBox.setObjectName("settlementRadiusSpinBox")
+        self.settlementExposureLayout.addWidget(self.settlementRadiusSpinBox)
+        self.settlementExposureButton = QtWidgets.QPushButton(self.settlementGroup)
+        self.settlementExposureButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.settlementExposureButton.setObjectName("settlementExposureButton")
+        self.settlementExposureLayout.addWidget(self.settlementExposureButton)
+        self.settlementLayout.setLayout(3, QtWidgets.QFormLayout.FieldRole, self.settlementExposureLayout)
+        self.verticalLayout.addWidget(self.settlementGroup)
+        self.populationGroup = QtWidgets.QGroupBox(IlceFilterDialog)
+        self.populationGroup.setObjectName("populationGroup")
+        self.populationLayout = QtWidgets.QFormLayout(self.populationGroup)
+        self.populationLayout.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
+        self.populationLayout.setContentsMargins(12, 12, 12, 12)
+        self.populationLayout.setSpacing(12)
+        self.populationLayout.setObjectName("populationLayout")
+        self.xlsxFileLayout = QtWidgets.QHBoxLayout()
+        self.xlsxFileLayout.setSpacing(12)
+        self.xlsxFileLayout.setObjectName("xlsxFileLayout")
+        self.xlsxFileEdit = QtWidgets.QLineEdit(self.populationGroup)
+        self.xlsxFileEdit.setMinimumSize(QtCore.QSize(0, 25))
+        self.xlsxFileEdit.setReadOnly(True)
+        self.xlsxFileEdit.setObjectName("xlsxFileEdit")
+        self.xlsxFileLayout.addWidget(self.xlsxFileEdit)
+        self.xlsxFileButton = QtWidgets.QPushButton(self.populationGroup)
+        self.xlsxFileButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.xlsxFileButton.setObjectName("xlsxFileButton")
+        self.xlsxFileLayout.addWidget(self.xlsxFileButton)
+        self.populationLayout.setLayout(0, QtWidgets.QFormLayout.SpanningRole, self.xlsxFileLayout)
+        self.exposureLabel = QtWidgets.QLabel(self.populationGroup)
+        self.exposureLabel.setObjectName("exposureLabel")
+        self.populationLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.exposureLabel)
+        self.exposureLayout = QtWidgets.QHBoxLayout()
+        self.exposureLayout.setSpacing(12)
+        self.exposureLayout.setObjectName("exposureLayout")
+        self.exposureMagnitudeLabel = QtWidgets.QLabel(self.populationGroup)
+        self.exposureMagnitudeLabel.setObjectName("exposureMagnitudeLabel")
+        self.exposureLayout.addWidget(self.exposureMagnitudeLabel)
+        self.exposureMagnitudeSpinBox = QtWidgets.QDoubleSpinBox(self.populationGroup)
+        self.exposureMagnitudeSpinBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.exposureMagnitudeSpinBox.setSuffix("")
+        self.exposureMagnitudeSpinBox.setDecimals(1)
+        self.exposureMagnitudeSpinBox.setMinimum(0.0)
+        self.exposureMagnitudeSpinBox.setMaximum(10.0)
+        self.exposureMagnitudeSpinBox.setSingleStep(0.1)
+        self.exposureMagnitudeSpinBox.setProperty("value", 4.0)
+        self.exposureMagnitudeSpinBox.setObjectName("exposureMagnitudeSpinBox")
+        self.exposureLayout.addWidget(self.exposureMagnitudeSpinBox)
+        self.strongMagnitudeLabel = QtWidgets.QLabel(self.populationGroup)
+        self.strongMagnitudeLabel.setObjectName("strongMagnitudeLabel")
+        self.exposureLayout.addWidget(self.strongMagnitudeLabel)
+        self.strongMagnitudeSpinBox = QtWidgets.QDoubleSpinBox(self.populationGroup)
+        self.strongMagnitudeSpinBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.strongMagnitudeSpinBox.setSuffix("")
+        self.strongMagnitudeSpinBox.setDecimals(1)
+        self.strongMagnitudeSpinBox.setMinimum(0.0)
+        self.strongMagnitudeSpinBox.setMaximum(10.0)
+        self.strongMagnitudeSpinBox.setSingleStep(0.1)
+        self.strongMagnitudeSpinBox.setProperty("value", 5.0)
+        self.strongMagnitudeSpinBox.setObjectName("strongMagnitudeSpinBox")
+        self.exposureLayout.addWidget(self.strongMagnitudeSpinBox)
+        self.exposureRadiusLabel = QtWidgets.QLabel(self.populationGroup)
+        self.exposureRadiusLabel.setObjectName("exposureRadiusLabel")
+        self.exposureLayout.addWidget(self.exposureRadiusLabel)
+        self.exposureRadiusSpinBox = QtWidgets.QDoubleSpinBox(self.populationGroup)
+        self.exposureRadiusSpinBox.setMinimumSize(QtCore.QSize(0, 25))
+        self.exposureRadiusSpinBox.setDecimals(0)
+        self.exposureRadiusSpinBox.setMinimum(1.0)
+        self.exposureRadiusSpinBox.setMaximum(500.0)
+        self.exposureRadiusSpinBox.setSingleStep(5.0)
+        self.exposureRadiusSpinBox.setProperty("value", 25.0)
+        self.exposureRadiusSpinBox.setObjectName("exposureRadiusSpinBox")
+        self.exposureLayout.addWidget(self.exposureRadiusSpinBox)
+        self.exposureButton = QtWidgets.QPushButton(self.populationGroup)
+        self.exposureButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.exposureButton.setObjectName("exposureButton")
+        self.exposureLayout.addWidget(self.exposureButton)
+        self.populationLayout.setLayout(1, QtWidgets.QFormLayout.FieldRole, self.exposureLayout)
+        self.verticalLayout.addWidget(self.populationGroup)
+        self.energyGroup = QtWidgets.QGroupBox(IlceFilterDialog)
+        self.energyGroup.setObjectName("energyGroup")
+        self.energyLayout = QtWidgets.QHBoxLayout(self.energyGroup)
+        self.energyLayout.setContentsMargins(12, 12, 12, 12)
+        self.energyLayout.setSpacing(12)
+        self.energyLayout.setObjectName("energyLayout")
+        self.energyMwCheckBox = QtWidgets.QCheckBox(self.energyGroup)
+        self.energyMwCheckBox.setChecked(True)
+        self.energyMwCheckBox.setObjectName("energyMwCheckBox")
+        self.energyLayout.addWidget(self.energyMwCheckBox)
+        spacerItem9 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.energyLayout.addItem(spacerItem9)
+        self.energyButton = QtWidgets.QPushButton(self.energyGroup)
+        self.energyButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.energyButton.setObjectName("energyButton")
+        self.energyLayout.addWidget(self.energyButton)
+        self.verticalLayout.addWidget(self.energyGroup)
+        self.exportGroup = QtWidgets.QGroupBox(IlceFilterDialog)
+        self.exportGroup.setObjectName("exportGroup")
+        self.exportLayout = QtWidgets.QHBoxLayout(self.exportGroup)
+        self.exportLayout.setContentsMargins(12, 12, 12, 12)
+        self.exportLayout.setSpacing(12)
+        self.exportLayout.setObjectName("exportLayout")
+        self.exportFormatLabel = QtWidgets.QLabel(self.exportGroup)
+        self.exportFormatLabel.setObjectName("exportFormatLabel")
+        self.exportLayout.addWidget(self.exportFormatLabel)
+        self.exportFormatComboBox = QtWidgets.QComboBox(self.exportGroup)
+        self.exportFormatComboBox.setMinimumSize(QtCore.QSize(180, 25))
+        self.exportFormatComboBox.setObjectName("exportFormatComboBox")
+        self.exportLayout.addWidget(self.exportFormatComboBox)
+        spacerItem10 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.exportLayout.addItem(spacerItem10)
+        self.exportButton = QtWidgets.QPushButton(self.exportGroup)
+        self.exportButton.setMinimumSize(QtCore.QSize(120, 25))
+        self.exportButton.setObjectName("exportButton")
+        self.exportLayout.addWidget(self.exportButton)
+        self.verticalLayout.addWidget(self.exportGroup)
+        self.performanceGroup = QtWidgets.QGroupBox(IlceFilterDialog)
+        self.performanceGroup.setObjectName("performanceGroup")
+        self.performanceLayout = QtWidgets.QVBoxLayout(self.performanceGroup)
+        self.performanceLayout.setContentsMargins(12, 12, 12, 12)
+        self.performanceLayout.setSpacing(6)
+        self.performanceLayout.setObjectName("performanceLayout")
+        self.performanceOptionsLayout = QtWidgets.QHBoxLayout()
+        self.performanceOptionsLayout.setSpacing(12)
+        self.performanceOptionsLayout.setObjectName("performanceOptionsLayout")
+        self.profilingCheckBox = QtWidgets.QCheckBox(self.performanceGroup)
+        self.profilingCheckBox.setObjectName("profilingCheckBox")
+        self.performanceOptionsLayout.addWidget(self.profilingCheckBox)
+        self.profileCaptureCheckBox = QtWidgets.QCheckBox(self.performanceGroup)
+        self.profileCaptureCheckBox.setObjectName("profileCaptureCheckBox")
+        self.performanceOptionsLayout.addWidget(self.profileCaptureCheckBox)
+        spacerItem11 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.performanceOptionsLayout.addItem(spacerItem11)
+        self.performanceLayout.addLayout(self.performanceOptionsLayout)
+        self.performanceTextEdit = QtWidgets.QPlainTextEdit(self.performanceGroup)
+        self.performanceTextEdit.setMaximumSize(QtCore.QSize(16777215, 120))
+        self.performanceTextEdit.setReadOnly(True)
+        self.performanceTextEdit.setObjectName("performanceTextEdit")
+        self.performanceLayout.addWidget(self.performanceTextEdit)
+        self.verticalLayout.addWidget(self.performanceGroup)
+        spacerItem12 = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem12)
+        self.buttonBox = QtWidgets.QDialogButtonBox(IlceFilterDialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout.addWidget(self.buttonBox)
+
+        self.retranslateUi(IlceFilterDialog)
+        self.buttonBox.accepted.connect(IlceFilterDialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(IlceFilterDialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(IlceFilterDialog)
+
+    def retranslateUi(self, IlceFilterDialog):
+        _translate = QtCore.QCoreApplication.translate
+        IlceFilterDialog.setWindowTitle(_translate("IlceFilterDialog", "Deprem Analizi"))
+        self.shapefileGroup.setTitle(_translate("IlceFilterDialog", "İlçe Sınırları"))
+        self.filePathEdit.setPlaceholderText(_translate("IlceFilterDialog", "İlçe sınırları shapefile seçiniz..."))
+        self.filePathButton.setText(_translate("IlceFilterDialog", "Gözat..."))
+        self.ilColumnLabel.setText(_translate("IlceFilterDialog", "İl Sütunu:"))
+        self.ilColumnComboBox.setPlaceholderText(_translate("IlceFilterDialog", "İl sütununu seçiniz..."))
+        self.ilceColumnLabel.setText(_translate("IlceFilterDialog", "İlçe Sütunu:"))
+        self.ilceColumnComboBox.setPlaceholderText(_translate("IlceFilterDialog", "İlçe sütununu seçiniz..."))
+        self.projectStoreLabel.setText(_translate("IlceFilterDialog", "Proje Deposu:"))
+        self.projectStoreEdit.setPlaceholderText(_translate("IlceFilterDialog", "İçe aktarılmış GeoPackage deposu..."))
+        self.projectStoreOpenButton.setText(_translate("IlceFilterDialog", "Aç..."))
+        self.projectStoreImportButton.setText(_translate("IlceFilterDialog", "Oluştur..."))
+        self.earthquakeGroup.setTitle(_translate("IlceFilterDialog", "Deprem Verileri"))
+        self.csvFileLabel.setText(_translate("IlceFilterDialog", "Deprem Excel Dosyası:"))
+        self.csvFileEdit.setPlaceholderText(_translate("IlceFilterDialog", "Deprem verisi excel dosyası seçiniz..."))
+        self.csvFileButton.setText(_translate("IlceFilterDialog", "Gözat..."))
+        self.watchCheckBox.setToolTip(_translate("IlceFilterDialog", "Dosyaya eklenen yeni depremleri yeniden yüklemeden haritaya ekle"))
+        self.watchCheckBox.setText(_translate("IlceFilterDialog", "Dosyayı İzle"))
+        self.yearRangeLabel.setText(_translate("IlceFilterDialog", "Yıl Aralığı:"))
+        self.yearSeparatorLabel.setText(_translate("IlceFilterDialog", "-"))
+        self.settlementDistanceLabel.setText(_translate("IlceFilterDialog", "Yerleşim Noktalarına Uzaklık (km):"))
+        self.magnitudeRangeLabel.setText(_translate("IlceFilterDialog", "Büyüklük Aralığı:"))
+        self.magnitudeSeparatorLabel.setText(_translate("IlceFilterDialog", "-"))
+        self.magnitudeScaleComboBox.setToolTip(_translate("IlceFilterDialog", "Filtre ve stilde kullanılan magnitüd: ham değer veya türüne göre dönüştürülmüş Mw"))
+        self.magnitudeScaleComboBox.setItemText(0, _translate("IlceFilterDialog", "Ham Magnitüd"))
+        self.magnitudeScaleComboBox.setItemText(1, _translate("IlceFilterDialog", "Mw (Dönüştürülmüş)"))
+        self.displayModeLabel.setText(_translate("IlceFilterDialog", "Görünüm:"))
+        self.densityCheckBox.setText(_translate("IlceFilterDialog", "Yoğunluk Haritası (KDE)"))
+        self.lodCheckBox.setText(_translate("IlceFilterDialog", "Ölçeğe Bağlı Gösterim"))
+        self.catalogueSubsetCheckBox.setToolTip(_translate("IlceFilterDialog", "Tüm katalog bir kez indeksli GeoPackage\'a yazılır; filtreler sadece katman ifadesini değiştirir"))
+        self.catalogueSubsetCheckBox.setText(_translate("IlceFilterDialog", "Tek Katalog Katmanı"))
+        self.densityBandwidthLabel.setText(_translate("IlceFilterDialog", "Bant Genişliği (km):"))
+        self.declusterLabel.setText(_translate("IlceFilterDialog", "Kümesizleştirme:"))
+        self.declusterButton.setText(_translate("IlceFilterDialog", "Kümesizleştir"))
+        self.mainshockOnlyCheckBox.setText(_translate("IlceFilterDialog", "Sadece Ana Şoklar"))
+        self.depthRangeLabel.setText(_translate("IlceFilterDialog", "Derinlik Aralığı (km):"))
+        self.depthSeparatorLabel.setText(_translate("IlceFilterDialog", "-"))
+        self.swathWidthLabel.setText(_translate("IlceFilterDialog", "Kesit Şerit Genişliği (km):"))
+        self.swathWidthSpinBox.setToolTip(_translate("IlceFilterDialog", "Deprem Kesiti aracıyla çizilen hattın iki yanındaki toplam şerit genişliği"))
+        self.feedLabel.setText(_translate("IlceFilterDialog", "Olay Servisi:"))
+        self.feedUrlEdit.setPlaceholderText(_translate("IlceFilterDialog", "http://localhost:8080/fdsnws/event/1/query"))
+        self.feedFormatComboBox.setItemText(0, _translate("IlceFilterDialog", "text"))
+        self.feedFormatComboBox.setItemText(1, _translate("IlceFilterDialog", "xml"))
+        self.feedStartDateEdit.setDisplayFormat(_translate("IlceFilterDialog", "yyyy-MM-dd"))
+        self.feedSeparatorLabel.setText(_translate("IlceFilterDialog", "-"))
+        self.feedEndDateEdit.setDisplayFormat(_translate("IlceFilterDialog", "yyyy-MM-dd"))
+        self.feedButton.setText(_translate("IlceFilterDialog", "Servisten Al"))
+        self.pgaLabel.setText(_translate("IlceFilterDialog", "Yer Hareketi:"))
+        self.pgaCheckBox.setToolTip(_translate("IlceFilterDialog", "Filtrelenmiş depremlerden azalım ilişkisiyle hücre başına yaklaşık en büyük yer ivmesi (g)"))
+        self.pgaCheckBox.setText(_translate("IlceFilterDialog", "PGA Yüzeyi"))
+        self.pgaCutoffLabel.setText(_translate("IlceFilterDialog", "Kesme"))
+        self.pgaCutoffSpinBox.setSuffix(_translate("IlceFilterDialog", " km"))
+        self.pgaCellLabel.setText(_translate("IlceFilterDialog", "Hücre"))
+        self.pgaCellSpinBox.setSuffix(_translate("IlceFilterDialog", " km"))
+        self.pgaPercentileLabel.setText(_translate("IlceFilterDialog", "Yüzdelik"))
+        self.pgaPercentileSpinBox.setToolTip(_translate("IlceFilterDialog", "100: hücredeki en büyük değer"))
+        self.pgaWorkersLabel.setText(_translate("IlceFilterDialog", "İşlem"))
+        self.pgaWorkersSpinBox.setToolTip(_translate("IlceFilterDialog", "1\'den büyükse karolar ayrı süreçlerde hesaplanır"))
+        self.mwConversionLabel.setText(_translate("IlceFilterDialog", "Mw Dönüşümü:"))
+        self.mwConversionEdit.setToolTip(_translate("IlceFilterDialog", "Magnitüd türü başına Mw = a + b·M katsayıları (ör. ML: 0.422, 0.953; Md: 1.379, 0.764). Tabloda olmayan türler Mw kabul edilir."))
+        self.filterGroup.setTitle(_translate("IlceFilterDialog", "Bölge Seçimi"))
+        self.ilLabel.setText(_translate("IlceFilterDialog", "İl:"))
+        self.ilceLabel.setText(_translate("IlceFilterDialog", "İlçe:"))
+        self.showLabelsCheckBox.setText(_translate("IlceFilterDialog", "İlçe İsimlerini Göster"))
+        self.bufferLabel.setText(_translate("IlceFilterDialog", "Yakınlık Mesafesi (km):"))
+        self.regionSourceLabel.setText(_translate("IlceFilterDialog", "Bölge Kaynağı:"))
+        self.regionSourceValueLabel.setToolTip(_translate("IlceFilterDialog", "Çokgen, dikdörtgen, daire veya seçili nesnelerden bölge araç çubuğundaki Deprem Analizi araçlarıyla belirlenir"))
+        self.regionSourceValueLabel.setText(_translate("IlceFilterDialog", "İl / İlçe seçimi"))
+        self.regionSourceResetButton.setText(_translate("IlceFilterDialog", "İl/İlçe\'ye Dön"))
+        self.regionTreeLabel.setText(_translate("IlceFilterDialog", "Çoklu Seçim:"))
+        self.regionTreeWidget.setToolTip(_translate("IlceFilterDialog", "İşaretlenen il ve ilçeler tek bölge olarak birleştirilir"))
+        self.regionTreeWidget.headerItem().setText(0, _translate("IlceFilterDialog", "Bölge"))
+        self.regionTreeWidget.headerItem().setText(1, _translate("IlceFilterDialog", "Deprem"))
+        self.regionSelectionButton.setText(_translate("IlceFilterDialog", "Seçimi Bölge Yap"))
+        self.breakdownCheckBox.setText(_translate("IlceFilterDialog", "İlçe Bazında Döküm"))
+        self.faultLinesGroup.setTitle(_translate("IlceFilterDialog", "Diri Fay Hatları"))
+        self.faultLineFileEdit.setPlaceholderText(_translate("IlceFilterDialog", "Diri fay hatları shapefile seçiniz..."))
+        self.faultLineFileButton.setText(_translate("IlceFilterDialog", "Gözat..."))
+        self.faultDistanceLabel.setText(_translate("IlceFilterDialog", "Faya Maks. Uzaklık:"))
+        self.faultDistanceSpinBox.setToolTip(_translate("IlceFilterDialog", "Sadece en yakın diri faya bu mesafeden yakın depremleri göster (0 = kapalı)"))
+        self.faultDistanceSpinBox.setSpecialValueText(_translate("IlceFilterDialog", "Kapalı"))
+        self.faultDistanceSpinBox.setSuffix(_translate("IlceFilterDialog", " km"))
+        self.settlementGroup.setTitle(_translate("IlceFilterDialog", "Yerleşim Noktaları"))
+        self.settlementFileEdit.setPlaceholderText(_translate("IlceFilterDialog", "Yerleşim noktaları shapefile seçiniz..."))
+        self.settlementFileButton.setText(_translate("IlceFilterDialog", "Gözat..."))
+        self.settlementIlLabel.setText(_translate("IlceFilterDialog", "İl Sütunu:"))
+        self.settlementIlColumnComboBox.setPlaceholderText(_translate("IlceFilterDialog", "İl sütununu seçiniz..."))
+        self.settlementIlceLabel.setText(_translate("IlceFilterDialog", "İlçe Sütunu:"))
+        self.settlementIlceColumnComboBox.setPlaceholderText(_translate("IlceFilterDialog", "İlçe sütununu seçiniz..."))
+        self.settlementExposureLabel.setText(_translate("IlceFilterDialog", "Deprem Sayımı:"))
+        self.settlementMagnitudeLabel.setText(_translate("IlceFilterDialog", "M ≥"))
+        self.settlementRadiusLabel.setText(_translate("IlceFilterDialog", "Yarıçap"))
+        self.settlementRadiusSpinBox.setSuffix(_translate("IlceFilterDialog", " km"))
+        self.settlementExposureButton.setText(_translate("IlceFilterDialog", "Hesapla"))
+        self.populationGroup.setTitle(_translate("IlceFilterDialog", "Nüfus Etkilenimi"))
+        self.xlsxFileEdit.setPlaceholderText(_translate("IlceFilterDialog", "TÜİK ilçe nüfusu excel dosyası seçiniz..."))
+        self.xlsxFileButton.setText(_translate("IlceFilterDialog", "Gözat..."))
+        self.exposureLabel.setText(_translate("IlceFilterDialog", "Etkilenim:"))
+        self.exposureMagnitudeLabel.setText(_translate("IlceFilterDialog", "Deprem M ≥"))
+        self.strongMagnitudeLabel.setText(_translate("IlceFilterDialog", "Güçlü M ≥"))
+        self.exposureRadiusLabel.setText(_translate("IlceFilterDialog", "Yarıçap"))
+        self.exposureRadiusSpinBox.setSuffix(_translate("IlceFilterDialog", " km"))
+        self.exposureButton.setText(_translate("IlceFilterDialog", "Hesapla"))
+        self.energyGroup.setTitle(_translate("IlceFilterDialog", "Enerji ve Moment Birikimi"))
+        self.energyMwCheckBox.setText(_translate("IlceFilterDialog", "Magnitüd Türüne Göre Mw\'ye Çevir"))
+        self.energyButton.setText(_translate("IlceFilterDialog", "İlçe/Yıl Tablosu"))
+        self.exportGroup.setTitle(_translate("IlceFilterDialog", "Dışa Aktarma"))
+        self.exportFormatLabel.setText(_translate("IlceFilterDialog", "Biçim:"))
+        self.exportButton.setText(_translate("IlceFilterDialog", "Dışa Aktar..."))
+        self.performanceGroup.setTitle(_translate("IlceFilterDialog", "Performans"))
+        self.profilingCheckBox.setText(_translate("IlceFilterDialog", "Aşama Sürelerini Ölç"))
+        self.profileCaptureCheckBox.setText(_translate("IlceFilterDialog", "Sonraki Çalıştırmayı cProfile ile Yakala"))
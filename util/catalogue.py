@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+# CSV'den okunan sütunlar ve tarih biçimi
+CSV_COLUMNS = ['eventId', 'eventDate', 'longitude', 'latitude', 'depth', 'magnitudeType', 'magnitude', 'area']
+CSV_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+# Kaynak veride 4 ondalık basamaklı koordinatlar float32'de (~1e-6 derece) kayıpsız saklanır.
+# Büyüklük ve derinlik arayüz eşikleriyle karşılaştırılıp etiketlerde gösterildiği için float64 kalır.
+FLOAT32_COLUMNS = ('longitude', 'latitude')
+CATEGORY_COLUMNS = ('magnitudeType', 'area')
+
+
+def parse_event_dates(rows):
+    """Tarih sütununu datetime64'e çevir (olay servisinden gelen satırlar zaten ayrıştırılmıştır)"""
+    if not pd.api.types.is_datetime64_any_dtype(rows['eventDate']):
+        rows['eventDate'] = pd.to_datetime(rows['eventDate'], format=CSV_DATE_FORMAT)
+    return rows
+
+
+def valid_coordinate_mask(rows):
+    """Koordinatı eksik veya aralık dışı olmayan satırların maskesi"""
+    return (
+        rows['longitude'].between(-180, 180) &
+        rows['latitude'].between(-90, 90) &
+        rows['longitude'].notna() &
+        rows['latitude'].notna()
+    )
+
+
+def compact_catalogue(frame):
+    """Katalog sütunlarını sıkıştırılmış tiplere çevir (float32 koordinatlar, sözlük kodlu metinler)"""
+    columns = {}
+    for column in FLOAT32_COLUMNS:
+        if column in frame.columns and frame[column].dtype != np.float32:
+            columns[column] = frame[column].astype(np.float32)
+    for column in CATEGORY_COLUMNS:
+        if column in frame.columns and not isinstance(frame[column].dtype, pd.CategoricalDtype):
+            columns[column] = frame[column].astype('category')
+    if 'eventId' in frame.columns and frame['eventId'].dtype != np.int64:
+        columns['eventId'] = frame['eventId'].astype(np.int64)
+    return frame.assign(**columns) if columns else frame
+
+
+def concat_catalogue(catalogue, rows):
+    """Yeni satırları kataloğa ekle; kategori sütunları ortak sözlükle birleştirilir (object'e düşmez)"""
+    rows = compact_catalogue(rows)
+    catalogue_columns = {}
+    row_columns = {}
+    for column in CATEGORY_COLUMNS:
+        if column not in catalogue.columns or column not in rows.columns:
+            continue
+        old = catalogue[column].cat.categories
+        new = rows[column].cat.categories
+        # Mevcut kodlar değişmesin diye yeni kategoriler sona eklenir
+        categories = old.append(new.difference(old))
+        if len(categories) != len(old):
+            catalogue_columns[column] = catalogue[column].cat.set_categories(categories)
+        row_columns[column] = rows[column].cat.set_categories(categories)
+    if catalogue_columns:
+        catalogue = catalogue.assign(**catalogue_columns)
+    if row_columns:
+        rows = rows.assign(**row_columns)
+    return pd.concat([catalogue, rows])
+
+
+def memory_per_event(frame):
+    """Satır başına bellek kullanımı (bayt, metin içerikleri dahil)"""
+    if len(frame) == 0:
+        return 0.0
+    return float(frame.memory_usage(deep=True).sum()) / len(frame)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sqlite3
+
+import numpy as np
+from osgeo import ogr, osr
+
+from .magnitude import HARMONIZED_COLUMN
+
+from .geopackage import SOURCE_KEY_ITEM, stored_source_key, create_geopackage, create_attribute_index
+
+CATALOGUE_LAYER = 'depremler'
+# Bu sayıdan fazla olay için FID listesi yerine depodaki sonuç tablosu kullanılır
+FID_LIST_LIMIT = 20000
+# Büyük filtre sonuçlarının FID'lerinin yazıldığı tablo (katman şemasına kayıtlı değildir)
+RESULT_TABLE = 'filtre_sonucu'
+# Sonuç tablosu yazılırken GeoPackage kilidi için en fazla bekleme (s)
+LOCK_TIMEOUT = 30
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def catalogue_store_path(csv_path):
+    """CSV dosyasının yanındaki katalog GeoPackage yolunu döndür"""
+    return f"{csv_path}.katalog.gpkg"
+
+
+def catalogue_fids(index_labels):
+    """DataFrame indeks etiketlerinden GeoPackage FID değerlerini üret (FID 1'den başlar)"""
+    return np.asarray(index_labels, dtype=np.int64) + 1
+
+
+def catalogue_store_is_current(path, key):
+    return stored_source_key(path, CATALOGUE_LAYER) == key
+
+
+def write_features(layer, earthquake_data):
+    """Satırları indeks etiketlerinden türetilen FID'lerle katalog katmanına tek işlemde yaz"""
+    definition = layer.GetLayerDefn()
+    columns = zip(
+        catalogue_fids(earthquake_data.index.values),
+        earthquake_data['eventId'].astype(str).values,
+        earthquake_data['eventDate'].dt.strftime(DATE_FORMAT).values,
+        earthquake_data['depth'].values.astype(float),
+        earthquake_data['magnitudeType'].astype(str).values,
+        earthquake_data['magnitude'].values.astype(float),
+        earthquake_data['area'].astype(str).values,
+        earthquake_data[HARMONIZED_COLUMN].values.astype(float),
+        earthquake_data['longitude'].values.astype(float),
+        earthquake_data['latitude'].values.astype(float),
+    )
+
+    layer.StartTransaction()
+    for fid, event_id, date, depth, magnitude_type, magnitude, area, mw, lon, lat in columns:
+        feature = ogr.Feature(definition)
+        feature.SetFID(int(fid))
+        feature.SetField(0, event_id)
+        feature.SetField(1, date)
+        feature.SetField(2, float(depth))
+        feature.SetField(3, magnitude_type)
+        feature.SetField(4, float(magnitude))
+        feature.SetField(5, area)
+        feature.SetField(6, float(mw))
+        point = ogr.Geometry(ogr.wkbPoint)
+        point.AddPoint_2D(float(lon), float(lat))
+        feature.SetGeometry(point)
+        layer.CreateFeature(feature)
+    layer.CommitTransaction()
+
+
+def append_catalogue_store(path, rows, key):
+    """Kataloğa eklenen satırları mevcut depoya aynı FID kuralıyla ekle ve kaynak anahtarını güncelle"""
+    dataset = ogr.Open(path, 1)
+    if dataset is None:
+        raise Exception(f"Katalog deposu açılamadı: {path}")
+    layer = dataset.GetLayerByName(CATALOGUE_LAYER)
+    write_features(layer, rows)
+    layer.SetMetadataItem(SOURCE_KEY_ITEM, key)
+    dataset = None
+
+
+def write_catalogue_store(path, earthquake_data, key):
+    """Temizlenmiş kataloğu R-tree ve tarih/magnitüd indeksli GeoPackage olarak yaz"""
+    temp_path = path[:-len('.gpkg')] + '.tmp.gpkg'
+    dataset = create_geopackage(temp_path)
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(4326)
+    srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+    layer = dataset.CreateLayer(CATALOGUE_LAYER, srs, ogr.wkbPoint,
+                                options=['FID=fid', 'GEOMETRY_NAME=geom', 'SPATIAL_INDEX=YES'])
+
+    # Alanlar bellek katmanındaki deprem şemasıyla aynıdır
+    for name, field_type in (('eventId', ogr.OFTString), ('eventDate', ogr.OFTString),
+                             ('depth', ogr.OFTReal), ('magnitudeType', ogr.OFTString),
+                             ('magnitude', ogr.OFTReal), ('area', ogr.OFTString),
+                             (HARMONIZED_COLUMN, ogr.OFTReal)):
+        layer.CreateField(ogr.FieldDefn(name, field_type))
+
+    write_features(layer, earthquake_data)
+
+    create_attribute_index(dataset, CATALOGUE_LAYER, 'eventDate')
+    create_attribute_index(dataset, CATALOGUE_LAYER, 'magnitude')
+    create_attribute_index(dataset, CATALOGUE_LAYER, HARMONIZED_COLUMN)
+    layer.SetMetadataItem(SOURCE_KEY_ITEM, key)
+    dataset = None
+
+    os.replace(temp_path, path)
+    return path
+
+
+def write_result_table(path, fids):
+    """Sonuç FID'lerini depodaki sonuç tablosuna yaz; dönüş: yazılan sürüm numarası.
+
+    Her yazımda sürüm artar; alt küme ifadesi sürümü içerdiğinden katman yeni sonuçla yeniden sorgulanır.
+    """
+    connection = sqlite3.connect(path, timeout=LOCK_TIMEOUT)
+    try:
+        with connection:
+            connection.execute(
+                f'CREATE TABLE IF NOT EXISTS "{RESULT_TABLE}" (fid INTEGER PRIMARY KEY, surum INTEGER NOT NULL)'
+            )
+            previous = connection.execute(f'SELECT MAX(surum) FROM "{RESULT_TABLE}"').fetchone()[0]
+            version = (previous or 0) + 1
+            connection.execute(f'DELETE FROM "{RESULT_TABLE}"')
+            connection.executemany(
+                f'INSERT INTO "{RESULT_TABLE}" (fid, surum) VALUES (?, {version})',
+                ((fid,) for fid in np.unique(fids).tolist())
+            )
+    finally:
+        connection.close()
+    return version
+
+
+def catalogue_subset_string(path, earthquake_data):
+    """Filtre sonucunu tam olarak gösteren alt küme ifadesi üret.
+
+    Küçük sonuçlarda FID listesi, büyük sonuçlarda GeoPackage içindeki sonuç tablosuyla birleşim
+    kullanılır; her iki durumda da katman filtre sonucuyla birebir aynıdır.
+    """
+    if earthquake_data is None or earthquake_data.empty:
+        return '"fid" < 0'
+
+    fids = catalogue_fids(earthquake_data.index.values)
+    if len(fids) <= FID_LIST_LIMIT:
+        return f"\"fid\" IN ({','.join(map(str, fids.tolist()))})"
+
+    version = write_result_table(path, fids)
+    return f'"fid" IN (SELECT fid FROM "{RESULT_TABLE}" WHERE surum = {version})'
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+import csv
+import io
+import os
+
+import numpy as np
+import pandas as pd
+
+
+class CatalogueRewritten(Exception):
+    """CSV dosyası kısaldı veya başlığı değişti; artımlı okuma yerine yeniden yükleme gerekir"""
+
+
+def csv_header(path):
+    """CSV dosyasının başlık satırındaki sütun adlarını döndür"""
+    with open(path, newline='', encoding='utf-8-sig') as handle:
+        return next(csv.reader(handle), [])
+
+
+class CatalogueTail(object):
+    """CSV dosyasına sonradan eklenen satırları son okunan bayt konumundan itibaren okur.
+
+    Sadece tamamlanmış (satır sonu karakteriyle biten) satırlar okunur; yarım yazılmış son satır
+    bir sonraki okumaya bırakılır. Yeni satırların indeks etiketleri ilk yüklemedeki gibi CSV
+    satır numaralarıdır.
+    """
+
+    def __init__(self, path, offset, row_count, last_event_id=None):
+        self.path = path
+        self.offset = offset
+        self.row_count = row_count
+        self.last_event_id = last_event_id
+        self.header = csv_header(path)
+
+    def has_new_data(self):
+        """Dosya son okumadan sonra büyüdüyse True döndür"""
+        size = os.path.getsize(self.path)
+        if size < self.offset:
+            raise CatalogueRewritten(self.path)
+        return size > self.offset
+
+    def read_new_rows(self, usecols):
+        """Eklenen tamamlanmış satırları DataFrame olarak döndür; yeni satır yoksa None"""
+        if not self.has_new_data():
+            return None
+        if csv_header(self.path) != self.header:
+            raise CatalogueRewritten(self.path)
+
+        with open(self.path, 'rb') as handle:
+            handle.seek(self.offset)
+            chunk = handle.read()
+        end = chunk.rfind(b'\n')
+        if end < 0:
+            return None
+        chunk = chunk[:end + 1]
+
+        rows = pd.read_csv(io.BytesIO(chunk), header=None, names=self.header, usecols=usecols)
+        rows.index = pd.RangeIndex(self.row_count, self.row_count + len(rows))
+        self.offset += len(chunk)
+        self.row_count += len(rows)
+        if len(rows) > 0:
+            self.last_event_id = rows['eventId'].iloc[-1]
+        return rows
+
+    def drop_known(self, rows, known_event_ids):
+        """Katalogda zaten bulunan olayları (ör. yeniden yazılan satırlar) çıkar"""
+        if rows is None or rows.empty:
+            return rows
+        return rows[~np.isin(rows['eventId'].values, known_event_ids)]
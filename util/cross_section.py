@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def project_onto_line(x, y, start, end):
+    """Noktaları hatta izdüşür.
+
+    Dönüş: (hat boyunca uzaklık, hatta dik işaretli uzaklık); birimler girdiyle aynıdır.
+    """
+    (x0, y0), (x1, y1) = start, end
+    length = float(np.hypot(x1 - x0, y1 - y0))
+    if length == 0:
+        return np.hypot(x - x0, y - y0), np.zeros(len(x))
+    ux = (x1 - x0) / length
+    uy = (y1 - y0) / length
+    dx = x - x0
+    dy = y - y0
+    return dx * ux + dy * uy, dx * -uy + dy * ux
+
+
+def swath_query(spatial_index, start, end, half_width):
+    """Hat etrafındaki şerit içindeki noktaları bul.
+
+    Uzun ve çapraz hatlarda tek bir kapsam kutusu çok aday getireceği için hat,
+    şerit genişliğiyle orantılı parçalara bölünüp her parçanın kutusu indekste sorgulanır.
+    Dönüş: (nokta indeksleri, hat boyunca uzaklık, hatta dik uzaklık) - uzaklığa göre sıralı
+    """
+    (x0, y0), (x1, y1) = start, end
+    length = float(np.hypot(x1 - x0, y1 - y0))
+    piece_length = max(4.0 * half_width, spatial_index.cell_size)
+    pieces = max(1, int(np.ceil(length / piece_length)))
+
+    candidates = []
+    for k in range(pieces):
+        ax = x0 + (x1 - x0) * k / pieces
+        ay = y0 + (y1 - y0) * k / pieces
+        bx = x0 + (x1 - x0) * (k + 1) / pieces
+        by = y0 + (y1 - y0) * (k + 1) / pieces
+        candidates.append(spatial_index.query_bbox(
+            min(ax, bx) - half_width, min(ay, by) - half_width,
+            max(ax, bx) + half_width, max(ay, by) + half_width
+        ))
+    candidates = np.unique(np.concatenate(candidates))
+
+    along, offset = project_onto_line(spatial_index.x[candidates], spatial_index.y[candidates], start, end)
+    inside = (along >= 0) & (along <= length) & (np.abs(offset) <= half_width)
+    candidates, along, offset = candidates[inside], along[inside], offset[inside]
+
+    order = np.argsort(along, kind='stable')
+    return candidates[order], along[order], offset[order]
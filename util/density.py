@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+# Derece -> km dönüşüm katsayıları (WGS84 üzerinde yaklaşık değerler)
+KM_PER_DEG_LAT = 110.574
+KM_PER_DEG_LON = 111.320
+
+# Raster boyutu için üst sınır - olay sayısından bağımsız sabit maliyet sağlar
+MAX_GRID_SIZE = 1024
+
+
+def gaussian_kernel_1d(sigma_cells):
+    """Tek boyutlu, toplamı 1 olan Gauss çekirdeği oluştur"""
+    radius = max(1, int(np.ceil(3 * sigma_cells)))
+    x = np.arange(-radius, radius + 1, dtype=np.float64)
+    kernel = np.exp(-0.5 * (x / sigma_cells) ** 2)
+    return kernel / kernel.sum()
+
+
+def fft_convolve_axis(grid, kernel, axis):
+    """Izgarayı verilen eksen boyunca FFT ile çekirdekle konvolüsyona sok (aynı boyutta çıktı)"""
+    n = grid.shape[axis]
+    m = len(kernel)
+    fft_size = 1 << (n + m - 2).bit_length()
+
+    grid_fft = np.fft.rfft(grid, fft_size, axis=axis)
+    kernel_fft = np.fft.rfft(kernel, fft_size)
+    shape = [1] * grid.ndim
+    shape[axis] = -1
+    result = np.fft.irfft(grid_fft * kernel_fft.reshape(shape), fft_size, axis=axis)
+
+    # Merkezlenmiş ("same") bölümü al
+    start = (m - 1) // 2
+    return np.take(result, np.arange(start, start + n), axis=axis)
+
+
+def grid_shape(extent, cell_size_km):
+    """Kapsam ve hücre boyutundan ızgara boyutlarını ve derece cinsinden hücre boyutunu hesapla"""
+    xmin, ymin, xmax, ymax = extent
+    lat0 = np.radians((ymin + ymax) / 2.0)
+    dx = cell_size_km / (KM_PER_DEG_LON * max(np.cos(lat0), 1e-6))
+    dy = cell_size_km / KM_PER_DEG_LAT
+
+    cols = max(1, int(np.ceil((xmax - xmin) / dx)))
+    rows = max(1, int(np.ceil((ymax - ymin) / dy)))
+
+    # Izgara çok büyükse hücre boyutunu büyüt
+    scale = max(cols, rows) / float(MAX_GRID_SIZE)
+    if scale > 1:
+        dx *= scale
+        dy *= scale
+        cols = max(1, int(np.ceil((xmax - xmin) / dx)))
+        rows = max(1, int(np.ceil((ymax - ymin) / dy)))
+
+    return rows, cols, dx, dy
+
+
+def kernel_density(longitudes, latitudes, extent, cell_size_km=1.0, bandwidth_km=5.0, weights=None):
+    """Noktaları ızgaraya topla ve ayrılabilir Gauss çekirdeği ile yumuşat.
+
+    Dönüş: (yoğunluk ızgarası [olay/km²], geotransform). Izgaranın ilk satırı kuzeydir.
+    """
+    xmin, ymin, xmax, ymax = extent
+    rows, cols, dx, dy = grid_shape(extent, cell_size_km)
+    xmax = xmin + cols * dx
+    ymax = ymin + rows * dy
+
+    # Binned sayım - tek bir vektörize histogram çağrısı
+    counts, _, _ = np.histogram2d(
+        np.asarray(latitudes, dtype=np.float64),
+        np.asarray(longitudes, dtype=np.float64),
+        bins=(rows, cols),
+        range=((ymin, ymax), (xmin, xmax)),
+        weights=weights
+    )
+
+    # Ayrılabilir Gauss yumuşatma (önce satırlar, sonra sütunlar)
+    if bandwidth_km > 0:
+        lat0 = np.radians((ymin + ymax) / 2.0)
+        cell_km_x = dx * KM_PER_DEG_LON * np.cos(lat0)
+        cell_km_y = dy * KM_PER_DEG_LAT
+        counts = fft_convolve_axis(counts, gaussian_kernel_1d(bandwidth_km / cell_km_y), axis=0)
+        counts = fft_convolve_axis(counts, gaussian_kernel_1d(bandwidth_km / cell_km_x), axis=1)
+        # FFT yuvarlama hatalarından gelen küçük negatif değerleri temizle
+        np.clip(counts, 0, None, out=counts)
+        cell_area_km2 = cell_km_x * cell_km_y
+    else:
+        lat0 = np.radians((ymin + ymax) / 2.0)
+        cell_area_km2 = (dx * KM_PER_DEG_LON * np.cos(lat0)) * (dy * KM_PER_DEG_LAT)
+
+    density = counts / cell_area_km2
+
+    # histogram2d güneyden kuzeye sıralar; raster için kuzey üstte olmalı
+    density = density[::-1, :]
+    geotransform = (xmin, dx, 0.0, ymax, 0.0, -dy)
+    return density, geotransform
+
+
+def cell_centers(geotransform, rows, cols):
+    """Izgara hücre merkezlerinin koordinatlarını döndür"""
+    x0, dx, _, y0, _, dy = geotransform
+    xs = x0 + (np.arange(cols) + 0.5) * dx
+    ys = y0 + (np.arange(rows) + 0.5) * dy
+    return np.meshgrid(xs, ys)
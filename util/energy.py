@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+
+def seismic_moment(mw):
+    """Sismik moment (N·m): log10 M0 = 1.5 Mw + 9.1 (Hanks & Kanamori)"""
+    return 10.0 ** (1.5 * np.asarray(mw, dtype=np.float64) + 9.1)
+
+
+def radiated_energy(mw):
+    """Yayılan enerji (J): log10 E = 1.5 M + 4.8 (Gutenberg & Richter)"""
+    return 10.0 ** (1.5 * np.asarray(mw, dtype=np.float64) + 4.8)
+
+
+def event_years(dates):
+    """datetime64 tarihlerinden tamsayı yıl"""
+    return np.asarray(dates).astype('datetime64[Y]').astype(np.int64) + 1970
+
+
+def district_year_sums(labels, years, mw, district_count):
+    """İlçe x yıl ızgarasında deprem sayısı, enerji, moment ve Benioff (√E) toplamları.
+
+    labels: deprem başına ilçe no (-1: hiçbiri). İlçe ve yıl tek tamsayı anahtarda birleştirilir
+    ve toplamlar bincount ile tek geçişte alınır. Dönüş: (ilk yıl, {sütun: (ilçe, yıl) dizisi})
+    """
+    inside = labels >= 0
+    labels = labels[inside]
+    years = years[inside]
+    mw = mw[inside]
+    if len(labels) == 0:
+        empty = np.zeros((district_count, 0))
+        return 0, {'deprem_sayisi': empty.astype(np.int64), 'enerji_j': empty, 'moment_nm': empty, 'benioff': empty}
+
+    first_year = int(years.min())
+    year_count = int(years.max()) - first_year + 1
+    keys = labels.astype(np.int64) * year_count + (years - first_year)
+    size = district_count * year_count
+    shape = (district_count, year_count)
+    energy = radiated_energy(mw)
+    return first_year, {
+        'deprem_sayisi': np.bincount(keys, minlength=size).reshape(shape),
+        'enerji_j': np.bincount(keys, weights=energy, minlength=size).reshape(shape),
+        'moment_nm': np.bincount(keys, weights=seismic_moment(mw), minlength=size).reshape(shape),
+        'benioff': np.bincount(keys, weights=np.sqrt(energy), minlength=size).reshape(shape),
+    }
+
+
+def district_year_table(first_year, sums):
+    """Boş olmayan ilçe-yıl hücrelerinin uzun tablosu (ilçe başına kümülatif moment ve Benioff birikimi ile)"""
+    counts = sums['deprem_sayisi']
+    cumulative_moment = np.cumsum(sums['moment_nm'], axis=1)
+    cumulative_benioff = np.cumsum(sums['benioff'], axis=1)
+    district, year = np.nonzero(counts)
+    return pd.DataFrame({
+        'ilce_no': district,
+        'yil': year + first_year,
+        'deprem_sayisi': counts[district, year],
+        'enerji_j': sums['enerji_j'][district, year],
+        'moment_nm': sums['moment_nm'][district, year],
+        'kumulatif_moment': cumulative_moment[district, year],
+        'benioff': cumulative_benioff[district, year],
+    })
+
+
+def yearly_series(first_year, sums):
+    """Tüm ilçelerin yıllık toplamları; grafik veri kümesi olarak boş yıllar dahil sürekli seri"""
+    totals = {column: values.sum(axis=0) for column, values in sums.items()}
+    return pd.DataFrame({
+        'yil': np.arange(first_year, first_year + len(totals['deprem_sayisi'])),
+        'deprem_sayisi': totals['deprem_sayisi'],
+        'enerji_j': totals['enerji_j'],
+        'moment_nm': totals['moment_nm'],
+        'kumulatif_moment': np.cumsum(totals['moment_nm']),
+        'benioff': np.cumsum(totals['benioff']),
+    })
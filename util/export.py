@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from osgeo import ogr, osr
+
+from .catalogue import CSV_DATE_FORMAT
+
+# GeoParquet yazımı için pyarrow isteğe bağlıdır
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Dosya diyaloğu filtresi -> (biçim, uzantı)
+EXPORT_FORMATS = {
+    'GeoPackage (*.gpkg)': ('GPKG', '.gpkg'),
+    'FlatGeobuf (*.fgb)': ('FlatGeobuf', '.fgb'),
+    'GeoParquet (*.parquet)': ('parquet', '.parquet'),
+    'CSV (*.csv)': ('csv', '.csv'),
+}
+
+EXPORT_LAYER = 'depremler'
+# Bellekte aynı anda tutulan en fazla satır sayısı
+CHUNK_ROWS = 100000
+OGR_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+# Koordinatlar nokta geometrisine yazılır; CSV'de sütun olarak kalır
+COORDINATE_COLUMNS = ('longitude', 'latitude')
+
+
+def available_formats():
+    """Kurulu bağımlılıklarla yazılabilen biçimler"""
+    return [name for name, (fmt, _) in EXPORT_FORMATS.items() if fmt != 'parquet' or pa is not None]
+
+
+def export_path(path, fmt):
+    """Biçimin uzantısı eksikse ekle"""
+    extension = next(ext for code, ext in EXPORT_FORMATS.values() if code == fmt)
+    return path if path.lower().endswith(extension) else path + extension
+
+
+def ogr_field_type(dtype):
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return ogr.OFTInteger64
+    if pd.api.types.is_float_dtype(dtype):
+        return ogr.OFTReal
+    return ogr.OFTString
+
+
+def attribute_columns(frame):
+    return [column for column in frame.columns if column not in COORDINATE_COLUMNS]
+
+
+def chunk_columns(chunk, columns):
+    """Parçanın sütunlarını OGR'ye yazılacak Python değer listelerine çevir"""
+    values = []
+    for column in columns:
+        series = chunk[column]
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            values.append(series.dt.strftime(OGR_DATE_FORMAT).tolist())
+        elif pd.api.types.is_bool_dtype(series.dtype) or pd.api.types.is_integer_dtype(series.dtype):
+            values.append(series.values.astype(np.int64).tolist())
+        elif pd.api.types.is_float_dtype(series.dtype):
+            values.append(series.values.astype(np.float64).tolist())
+        else:
+            values.append(series.astype(str).tolist())
+    return values
+
+
+def chunk_frame(catalogue, positions, extra, start, stop):
+    """Sonucun [start, stop) dilimini katalogdan konumlarla al; ek sütunlar aynı dilimden eklenir"""
+    chunk = catalogue.take(positions[start:stop])
+    if extra:
+        chunk = chunk.assign(**{name: values[start:stop] for name, values in extra.items()})
+    return chunk
+
+
+def schema_frame(catalogue, positions, extra=None):
+    """Sütun adları ve tipleri için boş parça"""
+    return chunk_frame(catalogue, positions, extra, 0, 0)
+
+
+def iter_chunks(catalogue, positions, extra=None, chunk_rows=CHUNK_ROWS):
+    """Sonuç satırlarını parça parça üret; bellekte aynı anda en fazla bir parça tutulur"""
+    for start in range(0, len(positions), chunk_rows):
+        yield start, chunk_frame(catalogue, positions, extra, start, start + chunk_rows)
+
+
+def write_ogr(path, driver_name, catalogue, positions, extra=None, chunk_rows=CHUNK_ROWS, progress=None):
+    """Satırları OGR ile parça parça yaz; destekleyen sürücülerde (GeoPackage) tek işlemde.
+
+    QgsFeature oluşturulmaz; her parça için sütunlar bir kez listeye çevrilir. İptalde False döner.
+    """
+    driver = ogr.GetDriverByName(driver_name)
+    if driver is None:
+        raise Exception(f"OGR sürücüsü bulunamadı: {driver_name}")
+    if os.path.exists(path):
+        driver.DeleteDataSource(path)
+    dataset = driver.CreateDataSource(path)
+    if dataset is None:
+        raise Exception(f"Dosya oluşturulamadı: {path}")
+
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(4326)
+    srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+    layer = dataset.CreateLayer(EXPORT_LAYER, srs, ogr.wkbPoint, options=['SPATIAL_INDEX=YES'])
+    schema = schema_frame(catalogue, positions, extra)
+    columns = attribute_columns(schema)
+    for column in columns:
+        layer.CreateField(ogr.FieldDefn(str(column), ogr_field_type(schema[column].dtype)))
+    definition = layer.GetLayerDefn()
+
+    transaction = dataset.TestCapability(ogr.ODsCTransactions)
+    if transaction:
+        dataset.StartTransaction()
+    completed = True
+    for start, chunk in iter_chunks(catalogue, positions, extra, chunk_rows):
+        values = chunk_columns(chunk, columns)
+        longitudes = chunk['longitude'].values.astype(np.float64).tolist()
+        latitudes = chunk['latitude'].values.astype(np.float64).tolist()
+        for row, (lon, lat) in enumerate(zip(longitudes, latitudes)):
+            feature = ogr.Feature(definition)
+            for field, column_values in enumerate(values):
+                feature.SetField(field, column_values[row])
+            point = ogr.Geometry(ogr.wkbPoint)
+            point.AddPoint_2D(lon, lat)
+            feature.SetGeometry(point)
+            layer.CreateFeature(feature)
+        if progress is not None and not progress((start + len(chunk)) / len(positions)):
+            completed = False
+            break
+    if transaction:
+        if completed:
+            dataset.CommitTransaction()
+        else:
+            dataset.RollbackTransaction()
+    dataset = None
+    return completed
+
+
+def point_wkb(longitudes, latitudes):
+    """Nokta geometrilerini vektörel olarak WKB'ye çevir (küçük endian, 21 bayt)"""
+    wkb = np.empty(len(longitudes), dtype=[('order', 'u1'), ('type', '<u4'), ('x', '<f8'), ('y', '<f8')])
+    wkb['order'] = 1
+    wkb['type'] = 1
+    wkb['x'] = longitudes
+    wkb['y'] = latitudes
+    return pa.FixedSizeBinaryArray.from_buffers(
+        pa.binary(wkb.dtype.itemsize), len(wkb), [None, pa.py_buffer(wkb.tobytes())]
+    ).cast(pa.binary())
+
+
+def write_parquet(path, catalogue, positions, extra=None, chunk_rows=CHUNK_ROWS, progress=None):
+    """Satırları GeoParquet (WKB geometri sütunu) olarak parça parça yaz; her parça bir satır grubudur"""
+    if pa is None:
+        raise Exception("GeoParquet için pyarrow kurulu olmalıdır")
+    columns = attribute_columns(schema_frame(catalogue, positions, extra))
+    metadata = {
+        'version': '1.0.0',
+        'primary_column': 'geometry',
+        'columns': {'geometry': {'encoding': 'WKB', 'geometry_types': ['Point']}},
+    }
+    writer = None
+    try:
+        for start, chunk in iter_chunks(catalogue, positions, extra, chunk_rows):
+            # Kategori sütunları parçalar arasında şema sabit kalsın diye metin olarak yazılır
+            attributes = {
+                column: chunk[column].astype(str) if isinstance(chunk[column].dtype, pd.CategoricalDtype) else chunk[column]
+                for column in columns
+            }
+            table = pa.Table.from_pandas(pd.DataFrame(attributes), preserve_index=False)
+            table = table.append_column('geometry', point_wkb(
+                chunk['longitude'].values.astype(np.float64), chunk['latitude'].values.astype(np.float64)
+            ))
+            if writer is None:
+                schema = table.schema.with_metadata({**(table.schema.metadata or {}), b'geo': json.dumps(metadata).encode()})
+                writer = pq.ParquetWriter(path, schema)
+            writer.write_table(table.cast(writer.schema))
+            if progress is not None and not progress((start + len(chunk)) / len(positions)):
+                return False
+    finally:
+        if writer is not None:
+            writer.close()
+    return True
+
+
+def write_csv(path, catalogue, positions, extra=None, chunk_rows=CHUNK_ROWS, progress=None):
+    """Satırları kaynak CSV biçiminde parça parça dosyaya ekle"""
+    with open(path, 'w', encoding='utf-8', newline='') as stream:
+        for start, chunk in iter_chunks(catalogue, positions, extra, chunk_rows):
+            chunk.to_csv(stream, header=start == 0, index=False, date_format=CSV_DATE_FORMAT)
+            if progress is not None and not progress((start + len(chunk)) / len(positions)):
+                return False
+    return True
+
+
+def export_events(path, fmt, catalogue, positions, extra=None, chunk_rows=CHUNK_ROWS, progress=None):
+    """Filtre sonucunu seçilen biçimde yaz.
+
+    Sonuç, sıkıştırılmış katalog ve sonuç satırlarının konum dizisiyle verilir; her parça
+    catalogue.take ile ayrı oluşturulduğundan bellek kullanımı sonuç boyutundan bağımsızdır.
+    extra: konum dizisiyle aynı uzunlukta ek sütunlar (ör. bölge dökümü).
+    Önce geçici dosyaya yazılır, tamamlanınca hedefin yerine konur; iptal veya hatada yarım dosya
+    kalmaz. Dönüş: yazılan yol, iptalde None
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    root, extension = os.path.splitext(path)
+    temp_path = f"{root}.tmp{extension}"
+    try:
+        if fmt == 'parquet':
+            completed = write_parquet(temp_path, catalogue, positions, extra, chunk_rows, progress)
+        elif fmt == 'csv':
+            completed = write_csv(temp_path, catalogue, positions, extra, chunk_rows, progress)
+        else:
+            completed = write_ogr(temp_path, fmt, catalogue, positions, extra, chunk_rows, progress)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    if not completed:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return None
+    os.replace(temp_path, path)
+    return path
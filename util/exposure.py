@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from .fault_distance import point_segment_distance
+from .spatial_index import GridIndex
+from .text import name_key, normalize_series
+
+# Nüfus tablosunun toplam nüfus sütunu
+POPULATION_COLUMN = 'GENEL TOPLAM_TOPLAM'
+
+# Bir blokta hesaplanan nokta x deprem uzaklık sayısı üst sınırı
+MAX_BLOCK_ELEMENTS = 4000000
+
+
+def district_key(il, ilce):
+    """İl ve ilçe adından büyük/küçük harf ve Türkçe karakter duyarsız birleştirme anahtarı üret"""
+    return f"{name_key(str(il))}|{name_key(str(ilce))}"
+
+
+def district_keys(il_values, ilce_values):
+    """district_key'in sütun sürümü: tekil adlar bir kez normalize edilir"""
+    il_keys = normalize_series(il_values, key=True).values
+    ilce_keys = normalize_series(ilce_values, key=True).values
+    return (pd.Series(il_keys, dtype=object) + "|" + pd.Series(ilce_keys, dtype=object)).tolist()
+
+
+def join_population(district_keys, population_keys, population_values):
+    """İlçe anahtarlarını nüfus tablosuna hash tablosu (pandas Index) ile bağla.
+
+    Dönüş: ilçe sırasında nüfus dizisi (eşleşmeyenler NaN) ve eşleşme maskesi
+    """
+    lookup = pd.Index(population_keys)
+    if not lookup.is_unique:
+        # Aynı ilçe birden çok satırda ise ilk satır kullanılır
+        keep = ~lookup.duplicated()
+        lookup = lookup[keep]
+        population_values = np.asarray(population_values)[keep]
+    positions = lookup.get_indexer(district_keys)
+    matched = positions >= 0
+    population = np.full(len(district_keys), np.nan)
+    population[matched] = np.asarray(population_values, dtype=np.float64)[positions[matched]]
+    return population, matched
+
+
+def districts_near_points(px, py, segments, radius, district_count):
+    """Noktalardan en az birine sınırı radius km'den yakın olan ilçeleri işaretle.
+
+    segments: (x0, y0, x1, y1, ilçe no) km cinsinden sınır segmentleri. Segment orta noktaları
+    ızgara indeksine alınır; her nokta için sadece yakındaki segmentlerin uzaklığı hesaplanır.
+    """
+    x0, y0, x1, y1, ids = segments
+    near = np.zeros(district_count, dtype=bool)
+    if len(x0) == 0 or len(px) == 0:
+        return near
+
+    half_length = float(np.max(np.hypot(x1 - x0, y1 - y0))) / 2.0
+    index = GridIndex((x0 + x1) / 2.0, (y0 + y1) / 2.0, max(radius, 1.0))
+    for x, y in zip(px, py):
+        candidates = index.query_radius(x, y, radius + half_length)
+        if len(candidates) == 0:
+            continue
+        distance = point_segment_distance(x, y, x0[candidates], y0[candidates], x1[candidates], y1[candidates])
+        near[ids[candidates[distance <= radius]]] = True
+    return near
+
+
+def exposure_metrics(event_labels, magnitudes, population, min_magnitude, strong_magnitude,
+                     strong_near):
+    """Tüm ilçeler için etkilenim ölçütlerini tek geçişte hesapla.
+
+    event_labels: her depremin içinde bulunduğu ilçe no (-1: hiçbiri)
+    strong_near: güçlü depremlerin radius km yakınındaki ilçeler (bool)
+    """
+    district_count = len(population)
+    inside = event_labels >= 0
+    counts = np.bincount(event_labels[inside & (magnitudes >= min_magnitude)], minlength=district_count)
+    strong_counts = np.bincount(event_labels[inside & (magnitudes >= strong_magnitude)], minlength=district_count)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rate = np.where(population > 0, counts / population * 100000.0, np.nan)
+
+    # İçinde güçlü deprem olan ilçe de (uzaklık 0) etkilenmiş sayılır
+    exposed = strong_near | (strong_counts > 0)
+    exposed_population = np.where(exposed, np.nan_to_num(population), 0.0)
+    return {
+        'deprem_sayisi': counts,
+        'deprem_100k': rate,
+        'guclu_deprem': strong_counts,
+        'etkilenen_nufus': exposed_population,
+    }
+
+
+def radius_event_stats(qx, qy, ex, ey, magnitudes, radius, progress=None):
+    """Her sorgu noktasının radius km içindeki deprem sayısı ve en büyük magnitüdü.
+
+    Depremler hücre boyu radius olan ızgara indeksine alınır. Sorgu noktaları aynı hücrelere
+    gruplanır; her grup için aday depremler tek kutu sorgusuyla bulunur ve uzaklıklar
+    grup x aday bloklarında vektörel hesaplanır. İptalde None döner.
+    """
+    qx = np.asarray(qx, dtype=np.float64)
+    qy = np.asarray(qy, dtype=np.float64)
+    magnitudes = np.asarray(magnitudes, dtype=np.float64)
+    counts = np.zeros(len(qx), dtype=np.int64)
+    max_magnitude = np.full(len(qx), np.nan)
+    if len(qx) == 0 or len(ex) == 0:
+        return counts, max_magnitude
+
+    index = GridIndex(ex, ey, radius)
+    # Sorgu noktalarının hücreleri (ızgara dışındakiler ayrı hücrelerde kalır, kırpılmaz)
+    cells = np.floor((qx - index.x0) / index.cell_size).astype(np.int64) * 1000003 + \
+        np.floor((qy - index.y0) / index.cell_size).astype(np.int64)
+    order = np.argsort(cells, kind='stable')
+    boundaries = np.flatnonzero(np.diff(cells[order])) + 1
+    groups = np.split(order, boundaries)
+
+    radius2 = radius * radius
+    done = 0
+    for group in groups:
+        gx = qx[group]
+        gy = qy[group]
+        candidates = index.query_bbox(gx.min() - radius, gy.min() - radius, gx.max() + radius, gy.max() + radius)
+        if len(candidates) > 0:
+            cx = index.x[candidates]
+            cy = index.y[candidates]
+            cm = magnitudes[candidates]
+            block = max(1, MAX_BLOCK_ELEMENTS // len(candidates))
+            for start in range(0, len(group), block):
+                rows = slice(start, start + block)
+                within = (gx[rows, None] - cx[None, :]) ** 2 + (gy[rows, None] - cy[None, :]) ** 2 <= radius2
+                found = within.sum(axis=1)
+                counts[group[rows]] = found
+                strongest = np.where(within, cm[None, :], -np.inf).max(axis=1)
+                max_magnitude[group[rows]] = np.where(found > 0, strongest, np.nan)
+
+        done += len(group)
+        if progress is not None and not progress(done / len(qx)):
+            return None
+    return counts, max_magnitude
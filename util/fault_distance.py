@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+# shapely 2 varsa STRtree ile vektörel en yakın komşu sorgusu kullanılır
+try:
+    import shapely
+    HAS_STRTREE = hasattr(shapely, 'STRtree') and hasattr(shapely, 'linestrings')
+except ImportError:
+    shapely = None
+    HAS_STRTREE = False
+
+# Numpy yedek yolunda bir blokta hesaplanan nokta x segment uzaklık sayısı üst sınırı
+MAX_BLOCK_ELEMENTS = 4000000
+
+
+def polyline_segments(polylines):
+    """(fay kimliği, Nx2 km koordinat dizisi) listesinden segment dizileri üret.
+
+    Dönüş: (x0, y0, x1, y1, segment başına fay kimliği)
+    """
+    starts, ends, ids = [], [], []
+    for fault_id, coords in polylines:
+        coords = np.asarray(coords, dtype=np.float64)
+        if len(coords) < 2:
+            continue
+        starts.append(coords[:-1])
+        ends.append(coords[1:])
+        ids.append(np.full(len(coords) - 1, fault_id, dtype=np.int64))
+
+    if not starts:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty, empty, empty, np.empty(0, dtype=np.int64)
+
+    starts = np.concatenate(starts)
+    ends = np.concatenate(ends)
+    return starts[:, 0], starts[:, 1], ends[:, 0], ends[:, 1], np.concatenate(ids)
+
+
+def point_segment_distance(px, py, x0, y0, x1, y1):
+    """Noktalarla segmentler arasındaki uzaklık (girdiler yayınlanabilir dizilerdir)"""
+    dx = x1 - x0
+    dy = y1 - y0
+    length2 = dx * dx + dy * dy
+    t = np.divide((px - x0) * dx + (py - y0) * dy, length2,
+                  out=np.zeros(np.broadcast(px, length2).shape), where=length2 > 0)
+    t = np.clip(t, 0.0, 1.0)
+    return np.hypot(px - (x0 + t * dx), py - (y0 + t * dy))
+
+
+def nearest_segment_strtree(px, py, x0, y0, x1, y1):
+    """STRtree ile her nokta için en yakın segmenti ve uzaklığı bul"""
+    lines = shapely.linestrings(np.stack((np.column_stack((x0, y0)), np.column_stack((x1, y1))), axis=1))
+    tree = shapely.STRtree(lines)
+    (point_index, segment_index), distances = tree.query_nearest(
+        shapely.points(px, py), return_distance=True, all_matches=False
+    )
+    nearest = np.zeros(len(px), dtype=np.int64)
+    distance = np.full(len(px), np.nan)
+    nearest[point_index] = segment_index
+    distance[point_index] = distances
+    return distance, nearest
+
+
+def nearest_segment_blocked(px, py, x0, y0, x1, y1, progress=None):
+    """Bellek sınırlı bloklarla tam (kaba kuvvet) en yakın segment araması"""
+    count = len(px)
+    block = max(1, MAX_BLOCK_ELEMENTS // max(len(x0), 1))
+    nearest = np.zeros(count, dtype=np.int64)
+    distance = np.empty(count, dtype=np.float64)
+
+    for start in range(0, count, block):
+        stop = min(start + block, count)
+        d = point_segment_distance(px[start:stop, None], py[start:stop, None],
+                                   x0[None, :], y0[None, :], x1[None, :], y1[None, :])
+        best = np.argmin(d, axis=1)
+        nearest[start:stop] = best
+        distance[start:stop] = d[np.arange(stop - start), best]
+        if progress is not None and not progress(stop / count):
+            return None
+    return distance, nearest
+
+
+def nearest_fault(px, py, segments, progress=None):
+    """Her noktanın en yakın faya uzaklığını (km) ve fay kimliğini döndür; iptalde None"""
+    x0, y0, x1, y1, fault_ids = segments
+    px = np.asarray(px, dtype=np.float64)
+    py = np.asarray(py, dtype=np.float64)
+    if len(x0) == 0:
+        return np.full(len(px), np.nan), np.full(len(px), -1, dtype=np.int64)
+
+    if HAS_STRTREE:
+        distance, nearest = nearest_segment_strtree(px, py, x0, y0, x1, y1)
+    else:
+        result = nearest_segment_blocked(px, py, x0, y0, x1, y1, progress)
+        if result is None:
+            return None
+        distance, nearest = result
+    return distance, fault_ids[nearest]
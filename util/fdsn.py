@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import io
+import xml.etree.ElementTree as ElementTree
+from datetime import timedelta
+from urllib.parse import urlencode
+
+import numpy as np
+import pandas as pd
+
+# FDSN metin biçimindeki sütunların katalog sütunlarına karşılığı
+TEXT_COLUMNS = {
+    'EventID': 'eventId',
+    'Time': 'eventDate',
+    'Latitude': 'latitude',
+    'Longitude': 'longitude',
+    'Depth/km': 'depth',
+    'MagType': 'magnitudeType',
+    'Magnitude': 'magnitude',
+    'EventLocationName': 'area',
+}
+
+CATALOGUE_COLUMNS = ['eventId', 'eventDate', 'longitude', 'latitude', 'depth', 'magnitudeType', 'magnitude', 'area']
+
+FORMAT_TEXT = 'text'
+FORMAT_QUAKEML = 'xml'
+
+
+def time_windows(start, end, window_days):
+    """[start, end) aralığını window_days uzunluğunda ardışık pencerelere böl"""
+    windows = []
+    step = timedelta(days=window_days)
+    current = start
+    while current < end:
+        windows.append((current, min(current + step, end)))
+        current += step
+    return windows
+
+
+def query_url(base_url, start, end, fmt=FORMAT_TEXT, **params):
+    """FDSN event servisi için sorgu adresi oluştur"""
+    query = {
+        'starttime': start.strftime('%Y-%m-%dT%H:%M:%S'),
+        'endtime': end.strftime('%Y-%m-%dT%H:%M:%S'),
+        'format': fmt,
+        'orderby': 'time-asc',
+    }
+    query.update({key: value for key, value in params.items() if value is not None})
+    return f"{base_url}?{urlencode(query)}"
+
+
+def numeric_event_ids(values):
+    """Olay kimliklerini int64'e çevir; sayısal olmayanlar kararlı 63 bitlik özetle eşlenir"""
+    values = pd.Series(values, dtype=object).astype(str).str.strip()
+    numeric = pd.to_numeric(values, errors='coerce')
+    result = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+    missing = np.isnan(result)
+    ids = np.zeros(len(values), dtype=np.int64)
+    ids[~missing] = result[~missing].astype(np.int64)
+    for i in np.nonzero(missing)[0]:
+        digest = hashlib.blake2b(values.iat[i].encode('utf-8'), digest_size=8).digest()
+        ids[i] = int.from_bytes(digest, 'big') >> 1
+    return ids
+
+
+def parse_event_time(values):
+    """ISO 8601 zamanları saniye çözünürlüğünde datetime64'e çevir (kesirli saniye ve Z atılır)"""
+    return pd.to_datetime(pd.Series(values, dtype=str).str.slice(0, 19), format='%Y-%m-%dT%H:%M:%S')
+
+
+def finish_frame(frame):
+    """Sütunları katalog düzenine getir ve tipleri eşitle"""
+    frame['eventId'] = numeric_event_ids(frame['eventId'].values)
+    frame['eventDate'] = parse_event_time(frame['eventDate'].values).values
+    for column in ('longitude', 'latitude', 'depth', 'magnitude'):
+        frame[column] = pd.to_numeric(frame[column], errors='coerce')
+    return frame[CATALOGUE_COLUMNS].reset_index(drop=True)
+
+
+def empty_frame():
+    return finish_frame(pd.DataFrame({column: [] for column in CATALOGUE_COLUMNS}))
+
+
+def parse_text(data):
+    """FDSN metin (|-ayrılmış) yanıtını katalog DataFrame'ine çevir"""
+    if not data or not data.strip():
+        return empty_frame()
+    frame = pd.read_csv(io.BytesIO(data), sep='|', dtype=str, skipinitialspace=True)
+    frame.columns = [column.strip().lstrip('#').strip() for column in frame.columns]
+    frame = frame.rename(columns=TEXT_COLUMNS)
+    for column in CATALOGUE_COLUMNS:
+        if column not in frame.columns:
+            frame[column] = None
+    return finish_frame(frame)
+
+
+def _value(element, path):
+    """QuakeML öğesinde 'a/b/value' yolundaki metni döndür; yoksa None"""
+    if element is None:
+        return None
+    found = element.find('/'.join(f"{{*}}{part}" for part in path.split('/')))
+    return found.text if found is not None else None
+
+
+def _preferred(event, tag, preferred_id):
+    """Olayın tercih edilen origin/magnitude öğesini döndür; belirtilmemişse ilkini"""
+    candidates = event.findall(f"{{*}}{tag}")
+    for candidate in candidates:
+        if preferred_id and candidate.get('publicID') == preferred_id:
+            return candidate
+    return candidates[0] if candidates else None
+
+
+def parse_quakeml(data):
+    """QuakeML yanıtını olay olay (iterparse) okuyup katalog DataFrame'ine çevir"""
+    if not data or not data.strip():
+        return empty_frame()
+
+    rows = {column: [] for column in CATALOGUE_COLUMNS}
+    for _, element in ElementTree.iterparse(io.BytesIO(data), events=('end',)):
+        if not element.tag.endswith('}event'):
+            continue
+        origin = _preferred(element, 'origin', _value(element, 'preferredOriginID'))
+        magnitude = _preferred(element, 'magnitude', _value(element, 'preferredMagnitudeID'))
+        depth_m = _value(origin, 'depth/value')
+
+        public_id = element.get('publicID', '')
+        rows['eventId'].append(public_id.rstrip('/').split('/')[-1].split('=')[-1])
+        rows['eventDate'].append(_value(origin, 'time/value'))
+        rows['longitude'].append(_value(origin, 'longitude/value'))
+        rows['latitude'].append(_value(origin, 'latitude/value'))
+        # QuakeML derinliği metre cinsindendir
+        rows['depth'].append(float(depth_m) / 1000.0 if depth_m is not None else None)
+        rows['magnitudeType'].append(_value(magnitude, 'type'))
+        rows['magnitude'].append(_value(magnitude, 'mag/value'))
+        rows['area'].append(_value(element, 'description/text'))
+        element.clear()
+
+    return finish_frame(pd.DataFrame(rows))
+
+
+def parse_response(data, fmt):
+    """Yanıtı biçimine göre ayrıştır"""
+    return parse_quakeml(data) if fmt == FORMAT_QUAKEML else parse_text(data)
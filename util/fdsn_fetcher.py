@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+from functools import partial
+
+from qgis.PyQt.QtCore import QObject, QUrl, pyqtSignal
+from qgis.PyQt.QtNetwork import QNetworkReply, QNetworkRequest
+from qgis.core import QgsNetworkAccessManager
+
+from .fdsn import FORMAT_TEXT, query_url, time_windows
+
+# Aynı anda açık tutulan en fazla istek sayısı
+MAX_CONCURRENT_REQUESTS = 4
+
+
+class FdsnFetcher(QObject):
+    """FDSN event servisinden zaman pencerelerini eşzamanlı ve engellemeden çeker.
+
+    İstekler QgsNetworkAccessManager üzerinden asenkron gönderilir; her pencerenin ham yanıtı
+    dataReceived ile yayınlanır, ayrıştırma arayüz iş parçacığını bekletmemek için alıcının
+    arka plan görevine bırakılır. Pencereler tamamlanma sırasına göre gelir.
+    """
+    dataReceived = pyqtSignal(bytes)
+    progressChanged = pyqtSignal(int, int)
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+    def __init__(self, base_url, start, end, fmt=FORMAT_TEXT, window_days=30,
+                 max_concurrent=MAX_CONCURRENT_REQUESTS, parent=None, **params):
+        super(FdsnFetcher, self).__init__(parent)
+        self.base_url = base_url
+        self.fmt = fmt
+        self.params = params
+        self.max_concurrent = max_concurrent
+        self.pending = time_windows(start, end, window_days)
+        self.total = len(self.pending)
+        self.completed = 0
+        self.received_pages = 0
+        self.replies = []
+        self.cancelled = False
+
+    def start(self):
+        """İlk istekleri gönder; kalanlar yanıt geldikçe sıraya alınır"""
+        if not self.pending:
+            self.finished.emit(0)
+            return
+        while self.pending and len(self.replies) < self.max_concurrent:
+            self.request_next()
+
+    def request_next(self):
+        window_start, window_end = self.pending.pop(0)
+        url = query_url(self.base_url, window_start, window_end, self.fmt, **self.params)
+        request = QNetworkRequest(QUrl(url))
+        reply = QgsNetworkAccessManager.instance().get(request)
+        reply.finished.connect(partial(self.on_reply_finished, reply))
+        self.replies.append(reply)
+
+    def on_reply_finished(self, reply):
+        """Yanıt geldiğinde ham içeriği yayınla ve sıradaki pencereyi iste"""
+        if reply in self.replies:
+            self.replies.remove(reply)
+        try:
+            if self.cancelled:
+                return
+            if reply.error() != QNetworkReply.NoError:
+                self.cancel()
+                self.failed.emit(reply.errorString())
+                return
+
+            # 204: pencerede olay yok
+            status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+            if status != 204:
+                data = bytes(reply.readAll())
+                if data:
+                    self.received_pages += 1
+                    self.dataReceived.emit(data)
+        except Exception as e:
+            self.cancel()
+            self.failed.emit(str(e))
+            return
+        finally:
+            reply.deleteLater()
+
+        self.completed += 1
+        self.progressChanged.emit(self.completed, self.total)
+        if self.pending:
+            self.request_next()
+        elif not self.replies:
+            self.finished.emit(self.received_pages)
+
+    def cancel(self):
+        """Bekleyen ve açık istekleri iptal et"""
+        self.cancelled = True
+        self.pending = []
+        for reply in list(self.replies):
+            reply.abort()
+        self.replies = []
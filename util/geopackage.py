@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+from osgeo import ogr
+
+# Kaynak dosya imzasının saklandığı katman üst veri anahtarı
+SOURCE_KEY_ITEM = 'KAYNAK_ANAHTARI'
+
+
+def stored_source_key(path, layer_name):
+    """GeoPackage katmanına yazılmış kaynak anahtarını döndür; dosya/katman yoksa None"""
+    if not os.path.exists(path):
+        return None
+    dataset = ogr.Open(path)
+    if dataset is None:
+        return None
+    layer = dataset.GetLayerByName(layer_name)
+    if layer is None:
+        return None
+    return layer.GetMetadataItem(SOURCE_KEY_ITEM)
+
+
+def create_geopackage(path):
+    """Var olan dosyayı silip boş bir GeoPackage oluştur"""
+    driver = ogr.GetDriverByName('GPKG')
+    if os.path.exists(path):
+        driver.DeleteDataSource(path)
+    dataset = driver.CreateDataSource(path)
+    if dataset is None:
+        raise Exception(f"GeoPackage oluşturulamadı: {path}")
+    return dataset
+
+
+def create_attribute_index(dataset, layer_name, column):
+    """Katman sütununa SQLite indeksi ekle"""
+    dataset.ExecuteSQL(
+        f'CREATE INDEX IF NOT EXISTS "idx_{layer_name}_{column}" ON "{layer_name}" ("{column}")'
+    )
+
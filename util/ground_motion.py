@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from .spatial_index import GridIndex
+
+# Bir blokta hesaplanan hücre x deprem değerlendirme sayısı üst sınırı
+MAX_BLOCK_ELEMENTS = 2000000
+
+
+def joyner_boore_1981(magnitude, distance_km):
+    """Joyner & Boore (1981): log10(PGA[g]) = -1.02 + 0.249 M - log10(r) - 0.00255 r, r = sqrt(d² + 7.3²)"""
+    r = np.sqrt(distance_km * distance_km + 7.3 * 7.3)
+    return 10 ** (-1.02 + 0.249 * magnitude - np.log10(r) - 0.00255 * r)
+
+
+def campbell_1981(magnitude, distance_km):
+    """Campbell (1981): ln(PGA[g]) = -4.141 + 0.868 M - 1.09 ln(R + 0.0606 exp(0.7 M))"""
+    return np.exp(-4.141 + 0.868 * magnitude - 1.09 * np.log(distance_km + 0.0606 * np.exp(0.7 * magnitude)))
+
+
+# Azalım ilişkileri: (magnitüd, episantral uzaklık km) -> PGA (g)
+GMPE_MODELS = {
+    'Joyner-Boore (1981)': joyner_boore_1981,
+    'Campbell (1981)': campbell_1981,
+}
+
+
+def _pga_rows(cell_x, cell_y, ex, ey, magnitudes, model, cutoff_km, percentile):
+    """Hücre bloğu için her hücrenin PGA istatistiği (cutoff içinde deprem yoksa NaN).
+
+    cell_x/cell_y hücre merkezleri, ex/ey/magnitudes bu bloğa yakın aday depremlerdir.
+    """
+    result = np.full(len(cell_x), np.nan)
+    if len(ex) == 0:
+        return result
+    gmpe = GMPE_MODELS[model]
+    block = max(1, MAX_BLOCK_ELEMENTS // len(ex))
+    for start in range(0, len(cell_x), block):
+        rows = slice(start, start + block)
+        dx = cell_x[rows, None] - ex[None, :]
+        dy = cell_y[rows, None] - ey[None, :]
+        distance2 = dx * dx + dy * dy
+        within = distance2 <= cutoff_km * cutoff_km
+        if percentile >= 100:
+            # En büyük değer için azalım ilişkisi sadece cutoff içindeki çiftlerde hesaplanır;
+            # çiftler satır sırasında olduğundan hücre başına en büyük değer reduceat ile alınır
+            cell_index, event_index = np.nonzero(within)
+            if len(cell_index) == 0:
+                continue
+            pga = gmpe(magnitudes[event_index], np.sqrt(distance2[cell_index, event_index]))
+            starts = np.flatnonzero(np.r_[True, cell_index[1:] != cell_index[:-1]])
+            target = result[rows]
+            target[cell_index[starts]] = np.maximum.reduceat(pga, starts)
+            result[rows] = target
+            continue
+
+        pga = gmpe(magnitudes[None, :], np.sqrt(distance2))
+        pga[~within] = np.nan
+        valid = np.any(within, axis=1)
+        if not np.any(valid):
+            continue
+        target = result[rows]
+        target[valid] = np.nanpercentile(pga[valid], percentile, axis=1)
+        result[rows] = target
+    return result
+
+
+def python_executable():
+    """Süreç havuzu işçileri için Python yorumlayıcısının yolu; bulunamazsa None.
+
+    QGIS içinde sys.executable (Windows ve macOS'ta) QGIS uygulamasıdır; spawn işçileri onunla
+    başlatılırsa yeni QGIS örnekleri açılır. Bu durumda QGIS ile gelen yorumlayıcı aranır.
+    """
+    name = os.path.basename(sys.executable).lower()
+    if name.startswith('python'):
+        return sys.executable
+    for prefix in (sys.exec_prefix, os.path.dirname(sys.executable)):
+        for candidate in (
+            os.path.join(prefix, 'python.exe'),
+            os.path.join(prefix, 'python3.exe'),
+            os.path.join(prefix, 'bin', f'python{sys.version_info.major}.{sys.version_info.minor}'),
+            os.path.join(prefix, 'bin', 'python3'),
+            os.path.join(prefix, 'bin', 'python'),
+        ):
+            if os.path.isfile(candidate):
+                return candidate
+    return None
+
+
+def _pga_chunk(args):
+    """Süreç havuzu için tek argümanlı sarmalayıcı"""
+    return _pga_rows(*args)
+
+
+def pga_grid(cell_x, cell_y, ex, ey, magnitudes, model, cutoff_km, percentile=100.0,
+             spatial_index=None, tile_cells=16, workers=1, progress=None):
+    """Izgara hücrelerinde deprem başına PGA'nın en büyüğünü veya yüzdeliğini hesapla.
+
+    cell_x, cell_y: (satır, sütun) boyutlu hücre merkezleri (km). Izgara tile_cells x tile_cells
+    karolara bölünür; her karo için sadece cutoff_km içindeki depremler mekansal indeksten kutu
+    sorgusuyla alınır. workers > 1 ise karolar süreç havuzunda hesaplanır; havuz açılamazsa seri
+    hesaba dönülür (QGIS ile gelen yorumlayıcı bulunamazsa havuz hiç açılmaz). İptalde None döner.
+    """
+    cell_x = np.asarray(cell_x, dtype=np.float64)
+    cell_y = np.asarray(cell_y, dtype=np.float64)
+    ex = np.asarray(ex, dtype=np.float64)
+    ey = np.asarray(ey, dtype=np.float64)
+    magnitudes = np.asarray(magnitudes, dtype=np.float64)
+    rows, cols = cell_x.shape
+    result = np.full(cell_x.shape, np.nan)
+    if len(ex) == 0:
+        return result
+    if spatial_index is None:
+        spatial_index = GridIndex(ex, ey, cutoff_km)
+
+    tiles, jobs = [], []
+    for row in range(0, rows, tile_cells):
+        for col in range(0, cols, tile_cells):
+            tile = (slice(row, row + tile_cells), slice(col, col + tile_cells))
+            bx = cell_x[tile].ravel()
+            by = cell_y[tile].ravel()
+            candidates = spatial_index.query_bbox(
+                bx.min() - cutoff_km, by.min() - cutoff_km, bx.max() + cutoff_km, by.max() + cutoff_km
+            )
+            if len(candidates) == 0:
+                continue
+            tiles.append(tile)
+            jobs.append((bx, by, ex[candidates], ey[candidates], magnitudes[candidates], model, cutoff_km, percentile))
+
+    def store(tile, values):
+        result[tile] = values.reshape(result[tile].shape)
+
+    executable = python_executable() if workers > 1 and len(jobs) > 1 else None
+    if executable is not None:
+        try:
+            # QGIS içinde fork güvenli değildir; spawn bağlamı QGIS uygulaması yerine Python yorumlayıcısıyla çalışır
+            context = multiprocessing.get_context('spawn')
+            context.set_executable(executable)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                for done, (tile, values) in enumerate(zip(tiles, pool.map(_pga_chunk, jobs, chunksize=4))):
+                    store(tile, values)
+                    if progress is not None and not progress((done + 1) / len(jobs)):
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        return None
+            return result
+        except (OSError, RuntimeError, ImportError, BrokenProcessPool):
+            # Süreç başlatılamayan ortamlarda (gömülü yorumlayıcı) seri hesaba dön
+            pass
+
+    for done, (tile, job) in enumerate(zip(tiles, jobs)):
+        store(tile, _pga_rows(*job))
+        if progress is not None and not progress((done + 1) / len(jobs)):
+            return None
+    return result
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+# Küçük ölçekte gösterilecek küme ızgarasının bir kenarındaki hücre sayısı
+CLUSTER_GRID_SIZE = 64
+
+
+def cluster_cell_size(extent, grid_size=CLUSTER_GRID_SIZE):
+    """Kapsamın uzun kenarını grid_size hücreye bölen hücre boyutunu döndür"""
+    xmin, ymin, xmax, ymax = extent
+    return max(xmax - xmin, ymax - ymin, 1e-9) / float(grid_size)
+
+
+def grid_aggregate(longitudes, latitudes, magnitudes, cell_size):
+    """Noktaları ızgara hücrelerinde topla.
+
+    Dönüş: (ağırlık merkezi boylamları, enlemleri, hücre başına olay sayısı, en büyük magnitüd)
+    """
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    magnitudes = np.asarray(magnitudes, dtype=np.float64)
+
+    ix = np.floor(longitudes / cell_size).astype(np.int64)
+    iy = np.floor(latitudes / cell_size).astype(np.int64)
+    ix -= ix.min()
+    iy -= iy.min()
+    codes = iy * (int(ix.max()) + 1) + ix
+
+    _, inverse = np.unique(codes, return_inverse=True)
+    counts = np.bincount(inverse)
+    center_lon = np.bincount(inverse, weights=longitudes) / counts
+    center_lat = np.bincount(inverse, weights=latitudes) / counts
+
+    max_magnitude = np.full(len(counts), -np.inf)
+    np.maximum.at(max_magnitude, inverse, magnitudes)
+
+    return center_lon, center_lat, counts, max_magnitude
+
+
+def top_n_threshold(magnitudes, n):
+    """En büyük n magnitüdü seçen alt eşiği döndür"""
+    magnitudes = np.asarray(magnitudes, dtype=np.float64)
+    if len(magnitudes) == 0:
+        return 0.0
+    if len(magnitudes) <= n:
+        return float(magnitudes.min())
+    return float(np.partition(magnitudes, len(magnitudes) - n)[len(magnitudes) - n])
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+# Dönüşüm katsayılarının saklandığı ayar anahtarı (diyalog ve Processing algoritmaları ortak kullanır)
+MW_CONVERSION_SETTING = 'pau_earthquake_analysis/mw_conversions'
+
+# Katalogda dönüştürülmüş moment magnitüdünün tutulduğu sütun
+HARMONIZED_COLUMN = 'Mw'
+
+# Magnitüd türünden moment magnitüdüne doğrusal dönüşüm: Mw = a + b * M
+# Türkiye için Akkar vd. (2010) ilişkileri; tabloda olmayan türler Mw kabul edilir
+MW_CONVERSIONS = {
+    'Mw': (0.0, 1.0),
+    'ML': (0.422, 0.953),
+    'Md': (1.379, 0.764),
+    'mb': (-0.194, 1.104),
+    'Ms': (2.304, 0.572),
+}
+
+
+def type_coefficients(magnitude_types, table=MW_CONVERSIONS):
+    """Her deprem için (a, b) dönüşüm katsayıları.
+
+    Tablo sadece tekil türler (kategori sözlüğü) için büyük/küçük harf duyarsız aranır, sonuç
+    kategori kodlarıyla dağıtılır. Eksik veya bilinmeyen türler için a=0, b=1 döner.
+    """
+    lookup = {name.strip().lower(): coefficients for name, coefficients in table.items()}
+    categorical = pd.Categorical(magnitude_types)
+    intercepts = np.zeros(len(categorical.categories) + 1)
+    slopes = np.ones(len(categorical.categories) + 1)
+    for code, name in enumerate(categorical.categories):
+        intercepts[code], slopes[code] = lookup.get(str(name).strip().lower(), (0.0, 1.0))
+    # Eksik değerlerin kodu -1: dizinin sonundaki birim dönüşüme düşer
+    codes = categorical.codes
+    return intercepts[codes], slopes[codes]
+
+
+def moment_magnitude(magnitudes, magnitude_types, table=MW_CONVERSIONS):
+    """Ham magnitüdleri türlerine göre Mw'ye çevir"""
+    intercepts, slopes = type_coefficients(magnitude_types, table)
+    return intercepts + slopes * np.asarray(magnitudes, dtype=np.float64)
+
+
+def harmonize_catalogue(frame, table=MW_CONVERSIONS):
+    """Kataloğa dönüştürülmüş Mw sütununu ekle (ham magnitude sütunu korunur)"""
+    return frame.assign(**{HARMONIZED_COLUMN: moment_magnitude(frame['magnitude'].values, frame['magnitudeType'], table)})
+
+
+def format_conversions(table):
+    """Dönüşüm tablosunu 'ML: 0.422, 0.953; ...' biçiminde metne çevir (a, b sırasıyla)"""
+    return '; '.join(f"{name}: {a:g}, {b:g}" for name, (a, b) in table.items())
+
+
+def stored_conversions(text):
+    """Ayarlarda saklanan metinden tabloyu oku; kayıt yoksa veya bozuksa varsayılanları kullan"""
+    if text:
+        try:
+            return parse_conversions(text)
+        except ValueError:
+            pass
+    return dict(MW_CONVERSIONS)
+
+
+def parse_conversions(text):
+    """format_conversions çıktısını tabloya geri çevir; hatalı girdide ValueError"""
+    table = {}
+    for item in text.split(';'):
+        if not item.strip():
+            continue
+        name, separator, values = item.partition(':')
+        parts = values.split(',')
+        if not separator or not name.strip() or len(parts) != 2:
+            raise ValueError(f"Geçersiz dönüşüm tanımı: '{item.strip()}' (beklenen biçim: ML: a, b)")
+        try:
+            table[name.strip()] = (float(parts[0]), float(parts[1]))
+        except ValueError:
+            raise ValueError(f"Geçersiz katsayı: '{item.strip()}'")
+    return table
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def ring_edges(rings):
+    """Halka listesinden (Nx2 koordinat dizileri) kenar dizilerini üret: (x0, y0, x1, y1)"""
+    starts, ends = [], []
+    for ring in rings:
+        ring = np.asarray(ring, dtype=np.float64)
+        if len(ring) < 3:
+            continue
+        starts.append(ring)
+        ends.append(np.roll(ring, -1, axis=0))
+    if not starts:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty, empty, empty
+    starts = np.concatenate(starts)
+    ends = np.concatenate(ends)
+    # Yatay kenarlar ışın kesişimine katkı vermez
+    keep = starts[:, 1] != ends[:, 1]
+    return starts[keep, 0], starts[keep, 1], ends[keep, 0], ends[keep, 1]
+
+
+def points_in_rings(x, y, rings):
+    """Çift-tek (even-odd) kuralıyla noktaların halkaların içinde olup olmadığını döndür.
+
+    Delikler ve çok parçalı poligonlar aynı kuralla doğru sonuç verir. Noktalar y'ye göre
+    bir kez sıralanır; her kenar için sadece y aralığındaki noktalar searchsorted ile seçilir.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    order = np.argsort(y, kind='stable')
+    xs = x[order]
+    ys = y[order]
+    inside = np.zeros(len(x), dtype=bool)
+
+    x0, y0, x1, y1 = ring_edges(rings)
+    low = np.minimum(y0, y1)
+    high = np.maximum(y0, y1)
+    starts = np.searchsorted(ys, low, side='left')
+    ends = np.searchsorted(ys, high, side='left')
+    slopes = (x1 - x0) / (y1 - y0)
+
+    for k in np.nonzero(ends > starts)[0]:
+        s, e = starts[k], ends[k]
+        crossing = x0[k] + (ys[s:e] - y0[k]) * slopes[k]
+        inside[s:e] ^= xs[s:e] < crossing
+
+    result = np.empty(len(x), dtype=bool)
+    result[order] = inside
+    return result
+
+
+def point_labels(x, y, rings, ring_labels):
+    """Her noktanın içinde kaldığı poligonun etiketini tek geçişte döndür; dışarıdakiler -1.
+
+    Poligonların örtüşmediği varsayılır. Kesişilen her kenarın etiketi (etiket + 1) noktanın
+    birikimine XOR'lanır: bir poligonun kenarları çift sayıda kesilirse katkısı sıfırlanır,
+    tek sayıda kesilen (noktayı içeren) poligonun etiketi kalır.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    order = np.argsort(y, kind='stable')
+    xs = x[order]
+    ys = y[order]
+    accumulated = np.zeros(len(x), dtype=np.int64)
+
+    # Kenar etiketleri ring_edges ile aynı sırada üretilir
+    edge_labels = []
+    for ring, label in zip(rings, ring_labels):
+        ring = np.asarray(ring, dtype=np.float64)
+        if len(ring) < 3:
+            continue
+        keep = ring[:, 1] != np.roll(ring, -1, axis=0)[:, 1]
+        edge_labels.append(np.full(int(keep.sum()), int(label) + 1, dtype=np.int64))
+    edge_labels = np.concatenate(edge_labels) if edge_labels else np.empty(0, dtype=np.int64)
+
+    x0, y0, x1, y1 = ring_edges(rings)
+    low = np.minimum(y0, y1)
+    high = np.maximum(y0, y1)
+    starts = np.searchsorted(ys, low, side='left')
+    ends = np.searchsorted(ys, high, side='left')
+    slopes = (x1 - x0) / (y1 - y0)
+
+    for k in np.nonzero(ends > starts)[0]:
+        s, e = starts[k], ends[k]
+        crossing = x0[k] + (ys[s:e] - y0[k]) * slopes[k]
+        accumulated[s:e] ^= np.where(xs[s:e] < crossing, edge_labels[k], 0)
+
+    result = np.empty(len(x), dtype=np.int64)
+    result[order] = accumulated - 1
+    return result
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from .exposure import district_key
+from .sidecar_cache import file_signature, load_sidecar, save_sidecar
+
+POPULATION_SHEET = 'İLÇE NÜFUSU'
+POPULATION_COLUMNS = [
+    'İL KAYIT NO', 'İLÇE KAYIT NO', 'İL ADI', 'İLÇE ADI',
+    'GENEL TOPLAM_TOPLAM', 'GENEL TOPLAM_ERKEK', 'GENEL TOPLAM_KADIN',
+    'İL ve İLÇE MERKEZLERİ_TOPLAM', 'İL ve İLÇE MERKEZLERİ_ERKEK', 'İL ve İLÇE MERKEZLERİ_KADIN',
+    'BELDE ve KÖYLER_TOPLAM', 'BELDE ve KÖYLER_ERKEK', 'BELDE ve KÖYLER_KADIN'
+]
+REQUIRED_COLUMNS = [
+    'İL KAYIT NO', 'İLÇE KAYIT NO', 'İL ADI', 'İLÇE ADI',
+    'GENEL TOPLAM_TOPLAM', 'GENEL TOPLAM_ERKEK', 'GENEL TOPLAM_KADIN'
+]
+TEXT_COLUMNS = ('İL ADI', 'İLÇE ADI')
+
+# Ayrıştırma biçimi değişirse eski önbellekler geçersiz sayılır
+CACHE_NAME = 'nufus'
+CACHE_VERSION = '1'
+
+
+def read_population_workbook(path):
+    """TÜİK ilçe nüfus tablosunu Excel'den oku (9. satırdan itibaren, sabit sütun adlarıyla)"""
+    frame = pd.read_excel(path, sheet_name=POPULATION_SHEET, skiprows=8, names=POPULATION_COLUMNS)
+    missing = [column for column in REQUIRED_COLUMNS if column not in frame.columns]
+    if missing:
+        raise ValueError(f"Excel dosyasında gerekli sütunlar eksik: {', '.join(missing)}")
+    frame = frame.dropna(subset=list(TEXT_COLUMNS))
+    columns = {}
+    for column in frame.columns:
+        if column in TEXT_COLUMNS:
+            columns[column] = frame[column].astype(str).str.strip()
+        else:
+            columns[column] = pd.to_numeric(frame[column], errors='coerce')
+    return pd.DataFrame(columns).reset_index(drop=True)
+
+
+def load_population_table(path):
+    """Nüfus tablosunu yan önbellekten (boyut ve değiştirilme zamanı anahtarlı) veya Excel'den yükle.
+
+    Dönüş: (DataFrame, önbellekten okundu mu)
+    """
+    key = f"{CACHE_VERSION}|{file_signature(path)}"
+    cached = load_sidecar(path, CACHE_NAME, key)
+    if cached is not None and all(f"sutun_{i}" in cached for i in range(len(POPULATION_COLUMNS))):
+        frame = pd.DataFrame({column: cached[f"sutun_{i}"] for i, column in enumerate(POPULATION_COLUMNS)})
+        return frame, True
+
+    frame = read_population_workbook(path)
+    # Sütun adları Türkçe karakter ve boşluk içerdiği için sıra numarasıyla saklanır
+    arrays = {}
+    for i, column in enumerate(POPULATION_COLUMNS):
+        dtype = str if column in TEXT_COLUMNS else np.float64
+        arrays[f"sutun_{i}"] = np.asarray(frame[column].values, dtype=dtype)
+    save_sidecar(path, CACHE_NAME, key, **arrays)
+    return frame, False
+
+
+def district_lookup(rows):
+    """(fid, il, ilçe) satırlarından normalize anahtar -> (il, ilçe, [fid, ...]) sözlüğü üret.
+
+    Aynı ilçenin birden çok parçası tek anahtarda toplanır; eşleştirme ilçe başına O(1) sözlük erişimidir.
+    """
+    lookup = {}
+    for fid, il, ilce in rows:
+        if not il or not ilce:
+            continue
+        key = district_key(il, ilce)
+        entry = lookup.get(key)
+        if entry is None:
+            lookup[key] = (il, ilce, [fid])
+        else:
+            entry[2].append(fid)
+    return lookup
+
+
+def unmatched_names(lookup, population_keys, population_il, population_ilce):
+    """Eşleşmeyen adların gözden geçirme tablosu: sınır katmanında olup tabloda olmayanlar ve tersi"""
+    population_set = set(population_keys)
+    rows = [
+        ('ilce_siniri', il, ilce, key)
+        for key, (il, ilce, _) in sorted(lookup.items())
+        if key not in population_set
+    ]
+    rows.extend(
+        ('nufus_tablosu', il, ilce, key)
+        for key, il, ilce in zip(population_keys, population_il, population_ilce)
+        if key not in lookup
+    )
+    return pd.DataFrame(rows, columns=['kaynak', 'il', 'ilce', 'anahtar'])
+
+
+def unmatched_report_path(workbook_path):
+    return f"{workbook_path}.eslesmeyen.csv"
+
+
+def write_unmatched_report(workbook_path, report):
+    """Eşleşmeyen adları Excel dosyasının yanına CSV olarak yaz; yazılamazsa None döndür"""
+    path = unmatched_report_path(workbook_path)
+    try:
+        report.to_csv(path, index=False, encoding='utf-8-sig')
+        return path
+    except Exception:
+        return None
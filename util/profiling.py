@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+import cProfile
+import functools
+import io
+import pstats
+import time
+
+
+class _NullStage(object):
+    """Ölçüm kapalıyken kullanılan, hiçbir şey yapmayan bağlam yöneticisi"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+NULL_STAGE = _NullStage()
+
+
+class _Stage(object):
+    """Bir aşamanın duvar saati süresini ölçen bağlam yöneticisi"""
+    __slots__ = ('monitor', 'name', 'start')
+
+    def __init__(self, monitor, name):
+        self.monitor = monitor
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.monitor.add_time(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class PerformanceMonitor(object):
+    """Aşama süreleri, aday sayıları ve önbellek isabetleri için hafif ölçüm yüzeyi.
+
+    Kapalıyken stage() paylaşılan boş bir nesne döndürür ve count() hemen döner.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.capture_next_run = False
+        self.timings = {}
+        self.counters = {}
+        self._profiler = None
+        self._run_depth = 0
+        self._run_start = 0.0
+        self.last_profile_report = ""
+
+    def reset(self):
+        """Biriken ölçümleri temizle"""
+        self.timings = {}
+        self.counters = {}
+
+    def stage(self, name):
+        """Aşama süresini ölçen bağlam yöneticisi döndür"""
+        if not self.enabled:
+            return NULL_STAGE
+        return _Stage(self, name)
+
+    def timed(self, name):
+        """Fonksiyonun tamamını bir aşama olarak ölçen dekoratör"""
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with _Stage(self, name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def add_time(self, name, seconds):
+        """Aşamaya süre ekle"""
+        entry = self.timings.get(name)
+        if entry is None:
+            self.timings[name] = [seconds, 1]
+        else:
+            entry[0] += seconds
+            entry[1] += 1
+
+    def count(self, name, value=1):
+        """Sayaç değerini artır"""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + int(value)
+
+    def cache_hit(self, name):
+        self.count(f"{name}.isabet")
+
+    def cache_miss(self, name):
+        self.count(f"{name}.kayip")
+
+    def begin_run(self):
+        """Bir çalıştırmanın başlangıcı; iç içe çağrılarda sadece en dıştaki sayılır"""
+        if not self.enabled:
+            return
+        self._run_depth += 1
+        if self._run_depth > 1:
+            return
+        self.reset()
+        self._run_start = time.perf_counter()
+        if self.capture_next_run:
+            self._profiler = self.start_capture()
+
+    def end_run(self):
+        """Çalıştırmanın sonu; en dıştaki çağrıda rapor metnini döndürür, aksi halde None"""
+        if not self.enabled or self._run_depth == 0:
+            return None
+        self._run_depth -= 1
+        if self._run_depth > 0:
+            return None
+
+        self.add_time('toplam', time.perf_counter() - self._run_start)
+        if self._profiler is not None:
+            self.last_profile_report = self.stop_capture(self._profiler)
+            self._profiler = None
+            self.capture_next_run = False
+        return self.report()
+
+    def start_capture(self):
+        """Tek çalıştırmalık profil yakalamayı başlat (pyinstrument varsa onu, yoksa cProfile kullan)"""
+        try:
+            from pyinstrument import Profiler
+            profiler = Profiler()
+            profiler.start()
+        except ImportError:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        return profiler
+
+    def stop_capture(self, profiler, limit=25):
+        """Profil yakalamayı durdur ve sonucu metin olarak döndür"""
+        if isinstance(profiler, cProfile.Profile):
+            profiler.disable()
+            stream = io.StringIO()
+            stats = pstats.Stats(profiler, stream=stream)
+            stats.sort_stats('cumulative').print_stats(limit)
+            return stream.getvalue()
+        profiler.stop()
+        return profiler.output_text(unicode=True)
+
+    def snapshot(self):
+        """Ölçümlerin JSON'a yazılabilir kopyasını döndür"""
+        return {
+            'timings': {name: {'seconds': total, 'calls': calls} for name, (total, calls) in self.timings.items()},
+            'counters': dict(self.counters),
+        }
+
+    def report(self):
+        """Ölçümleri okunabilir metin olarak döndür"""
+        lines = []
+        for name, (total, calls) in sorted(self.timings.items(), key=lambda item: -item[1][0]):
+            suffix = f" ({calls} kez)" if calls > 1 else ""
+            lines.append(f"{name:28s} {total * 1000:10.1f} ms{suffix}")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:28s} {value:10d}")
+        return "\n".join(lines)
+
+
+# Diyalog ve eklenti sınıfının ortak kullandığı ölçüm nesnesi
+monitor = PerformanceMonitor()
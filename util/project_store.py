@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+from osgeo import gdal
+
+from .geopackage import SOURCE_KEY_ITEM, stored_source_key, create_attribute_index
+from .sidecar_cache import file_signature
+
+DISTRICT_LAYER = 'ilceler'
+FAULT_LAYER = 'faylar'
+SETTLEMENT_LAYER = 'yerlesimler'
+
+
+def store_layer_uri(store_path, layer_name):
+    """GeoPackage içindeki katman için QGIS/OGR kaynak adresini döndür"""
+    return f"{store_path}|layername={layer_name}"
+
+
+def store_layer_names(store_path):
+    """Depoda bulunan katman adlarını döndür"""
+    dataset = gdal.OpenEx(store_path, gdal.OF_VECTOR)
+    if dataset is None:
+        return []
+    return [dataset.GetLayerByIndex(i).GetName() for i in range(dataset.GetLayerCount())]
+
+
+def import_layer(store_path, layer_name, source_path, target_srs, index_columns=(), promote_to_multi=False):
+    """Kaynak dosyayı hedef koordinat sisteminde, mekansal ve öznitelik indeksleriyle depoya yaz.
+
+    Kaynak ve koordinat sistemi değişmediyse yazmaz; yazıldıysa True döndürür.
+    """
+    key = f"{os.path.abspath(source_path)}|{file_signature(source_path)}|{target_srs}"
+    if stored_source_key(store_path, layer_name) == key:
+        return False
+
+    exists = os.path.exists(store_path)
+    options = gdal.VectorTranslateOptions(
+        format='GPKG',
+        dstSRS=target_srs,
+        layerName=layer_name,
+        accessMode='overwrite' if exists else None,
+        geometryType='PROMOTE_TO_MULTI' if promote_to_multi else None,
+        layerCreationOptions=['SPATIAL_INDEX=YES'],
+    )
+    if gdal.VectorTranslate(store_path, source_path, options=options) is None:
+        raise Exception(f"Katman depoya yazılamadı: {source_path}")
+
+    dataset = gdal.OpenEx(store_path, gdal.OF_VECTOR | gdal.OF_UPDATE)
+    layer = dataset.GetLayerByName(layer_name)
+    definition = layer.GetLayerDefn()
+    field_names = {definition.GetFieldDefn(i).GetName() for i in range(definition.GetFieldCount())}
+    for column in index_columns:
+        if column in field_names:
+            create_attribute_index(dataset, layer_name, column)
+    layer.SetMetadataItem(SOURCE_KEY_ITEM, key)
+    dataset = None
+    return True
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+
+import numpy as np
+from osgeo import gdal, ogr
+
+NODATA_VALUE = -9999.0
+
+
+def temporary_raster_path(prefix):
+    """Geçici GeoTIFF dosyası için yol oluştur"""
+    handle, path = tempfile.mkstemp(suffix='.tif', prefix=prefix)
+    os.close(handle)
+    return path
+
+
+def write_geotiff(path, grid, geotransform, crs_wkt, nodata=NODATA_VALUE):
+    """Numpy ızgarasını tek bantlı GeoTIFF olarak yaz"""
+    rows, cols = grid.shape
+    driver = gdal.GetDriverByName('GTiff')
+    dataset = driver.Create(path, cols, rows, 1, gdal.GDT_Float32, options=['COMPRESS=DEFLATE'])
+    if dataset is None:
+        raise Exception(f"Raster dosyası oluşturulamadı: {path}")
+
+    dataset.SetGeoTransform(geotransform)
+    dataset.SetProjection(crs_wkt)
+    band = dataset.GetRasterBand(1)
+    band.SetNoDataValue(nodata)
+    band.WriteArray(np.where(np.isfinite(grid), grid, nodata).astype(np.float32))
+    band.FlushCache()
+    dataset = None
+    return path
+
+
+def geometry_mask(geometry_wkt, geotransform, shape):
+    """WKT geometrisini verilen ızgaraya rasterleştir; içerideki hücreler için True döndür"""
+    rows, cols = shape
+    mask_dataset = gdal.GetDriverByName('MEM').Create('', cols, rows, 1, gdal.GDT_Byte)
+    mask_dataset.SetGeoTransform(geotransform)
+
+    source = ogr.GetDriverByName('Memory').CreateDataSource('mask')
+    layer = source.CreateLayer('mask')
+    feature = ogr.Feature(layer.GetLayerDefn())
+    feature.SetGeometry(ogr.CreateGeometryFromWkt(geometry_wkt))
+    layer.CreateFeature(feature)
+
+    gdal.RasterizeLayer(mask_dataset, [1], layer, burn_values=[1])
+    mask = mask_dataset.GetRasterBand(1).ReadAsArray().astype(bool)
+
+    feature = None
+    source = None
+    mask_dataset = None
+    return mask
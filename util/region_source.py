@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+
+import numpy as np
+from qgis.core import (
+    QgsGeometry, QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+    QgsFeatureRequest, QgsProject
+)
+
+WGS84 = 'EPSG:4326'
+# Mesafe tabanlı bölgeler (daire) bu metrik sistemde oluşturulur (tampon ile aynı)
+METRIC_CRS = 'EPSG:32636'
+
+
+def transform_geometry(geometry, source_crs, target_authid=WGS84):
+    """Geometrinin kopyasını hedef koordinat sistemine dönüştür"""
+    result = QgsGeometry(geometry)
+    target_crs = QgsCoordinateReferenceSystem(target_authid)
+    if source_crs != target_crs:
+        result.transform(QgsCoordinateTransform(source_crs, target_crs, QgsProject.instance()))
+    return result
+
+
+def geometry_rings(geometry):
+    """Poligon geometrisinin tüm dış ve iç halkalarını Nx2 numpy dizileri olarak döndür"""
+    polygons = geometry.asMultiPolygon() if geometry.isMultipart() else [geometry.asPolygon()]
+    rings = []
+    for polygon in polygons:
+        for ring in polygon:
+            rings.append(np.array([(p.x(), p.y()) for p in ring], dtype=np.float64))
+    return rings
+
+
+def features_ignoring_subset(layer, request):
+    """Katmanın alt küme filtresini geçici olarak kaldırıp istekteki nesneleri döndür"""
+    subset = layer.subsetString()
+    if not subset:
+        return list(layer.getFeatures(request))
+    layer.blockSignals(True)
+    try:
+        layer.setSubsetString("")
+        return list(layer.getFeatures(request))
+    finally:
+        layer.setSubsetString(subset)
+        layer.blockSignals(False)
+
+
+class RegionSource(object):
+    """Filtre bölgesi kaynağı: önbellek anahtarı ve WGS84 geometrisi sağlar"""
+    description = ""
+    label_names = ()
+
+    def cache_key(self):
+        raise NotImplementedError
+
+    def geometry(self):
+        """Tamponsuz bölge geometrisini WGS84'te döndür; bölge boşsa None"""
+        raise NotImplementedError
+
+    def label_rings(self):
+        """Alt bölge dökümü için (halkalar, halka etiketleri) döndür; döküm desteklenmiyorsa None"""
+        return None
+
+
+class AdminRegionSource(RegionSource):
+    """İl/ilçe katmanında ifadeyle seçilen idari birimler"""
+
+    def __init__(self, layer, filter_exp):
+        self.layer = layer
+        self.filter_exp = filter_exp
+        self.description = "İl / İlçe seçimi"
+
+    def cache_key(self):
+        return ('idari', self.layer.id(), self.filter_exp)
+
+    def geometry(self):
+        request = QgsFeatureRequest().setFilterExpression(self.filter_exp)
+        geometries = [f.geometry() for f in self.layer.getFeatures(request)]
+        if not geometries:
+            return None
+        return transform_geometry(QgsGeometry.unaryUnion(geometries), self.layer.crs())
+
+
+class DistrictSelectionRegionSource(RegionSource):
+    """FID listesiyle seçilen birden çok il/ilçe; tek geometri olarak birleştirilir"""
+
+    def __init__(self, layer, fid_groups):
+        # fid_groups: [(ilçe adı, [fid, ...]), ...] - her grup dökümde bir etiket olur
+        self.layer = layer
+        self.label_names = [name for name, _ in fid_groups]
+        self.fid_groups = [list(fids) for _, fids in fid_groups]
+        self.feature_ids = sorted(fid for fids in self.fid_groups for fid in fids)
+        self.description = f"Çoklu seçim ({len(self.fid_groups)} ilçe)"
+        self._parts = None
+
+    def cache_key(self):
+        return ('coklu', self.layer.id(), tuple(self.feature_ids))
+
+    def parts(self):
+        """Seçili nesnelerin WGS84 geometrilerini FID'ye göre bir kez oku"""
+        if self._parts is None:
+            request = QgsFeatureRequest().setFilterFids(self.feature_ids)
+            self._parts = {
+                f.id(): transform_geometry(f.geometry(), self.layer.crs())
+                for f in features_ignoring_subset(self.layer, request)
+                if f.hasGeometry()
+            }
+        return self._parts
+
+    def geometry(self):
+        if not self.feature_ids:
+            return None
+        geometries = list(self.parts().values())
+        if not geometries:
+            return None
+        return QgsGeometry.unaryUnion(geometries)
+
+    def label_rings(self):
+        parts = self.parts()
+        rings, labels = [], []
+        for label, fids in enumerate(self.fid_groups):
+            for fid in fids:
+                if fid in parts:
+                    part_rings = geometry_rings(parts[fid])
+                    rings.extend(part_rings)
+                    labels.extend([label] * len(part_rings))
+        return rings, np.array(labels, dtype=np.int64)
+
+
+class DrawnRegionSource(RegionSource):
+    """Haritada çizilen çokgen veya dikdörtgen"""
+
+    def __init__(self, geometry, crs, description="Çizilen bölge"):
+        self.drawn_geometry = QgsGeometry(geometry)
+        self.crs = crs
+        self.description = description
+        self._key = hashlib.sha1(f"{crs.authid()}|{geometry.asWkt()}".encode('utf-8')).hexdigest()
+
+    def cache_key(self):
+        return ('cizim', self._key)
+
+    def geometry(self):
+        if self.drawn_geometry.isEmpty():
+            return None
+        return transform_geometry(self.drawn_geometry, self.crs)
+
+
+class LayerSelectionRegionSource(RegionSource):
+    """Projedeki bir poligon katmanının seçili nesneleri"""
+
+    def __init__(self, layer):
+        self.layer = layer
+        self.feature_ids = sorted(layer.selectedFeatureIds())
+        self.description = f"{layer.name()} ({len(self.feature_ids)} seçili nesne)"
+
+    def cache_key(self):
+        return ('katman', self.layer.id(), tuple(self.feature_ids))
+
+    def geometry(self):
+        if not self.feature_ids:
+            return None
+        request = QgsFeatureRequest().setFilterFids(self.feature_ids)
+        geometries = [f.geometry() for f in self.layer.getFeatures(request)]
+        if not geometries:
+            return None
+        return transform_geometry(QgsGeometry.unaryUnion(geometries), self.layer.crs())
+
+
+class CircleRegionSource(RegionSource):
+    """Bir nokta etrafında verilen yarıçaplı daire"""
+
+    def __init__(self, center, crs, radius_km):
+        self.center = center
+        self.crs = crs
+        self.radius_km = radius_km
+        self.description = f"Daire ({radius_km:.1f} km)"
+
+    def cache_key(self):
+        return ('daire', self.crs.authid(), round(self.center.x(), 6), round(self.center.y(), 6),
+                round(self.radius_km, 3))
+
+    def geometry(self):
+        center = transform_geometry(QgsGeometry.fromPointXY(self.center), self.crs, METRIC_CRS)
+        circle = center.buffer(self.radius_km * 1000, 32)
+        return transform_geometry(circle, QgsCoordinateReferenceSystem(METRIC_CRS))
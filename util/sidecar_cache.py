@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import numpy as np
+
+
+def file_signature(path):
+    """Dosya boyutu ve değiştirilme zamanından önbellek anahtarı üret"""
+    stat = os.stat(path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def sidecar_path(path, name):
+    """Kaynak dosyanın yanındaki önbellek dosyasının yolunu döndür"""
+    return f"{path}.{name}.npz"
+
+
+def load_sidecar(path, name, key):
+    """Anahtar eşleşirse önbellekteki dizileri döndür, aksi halde None"""
+    cache_path = sidecar_path(path, name)
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            if str(data['cache_key']) != key:
+                return None
+            return {k: data[k] for k in data.files if k != 'cache_key'}
+    except Exception:
+        # Bozuk veya eski formatlı önbellek - yeniden hesaplanacak
+        return None
+
+
+def save_sidecar(path, name, key, **arrays):
+    """Dizileri kaynak dosyanın yanına önbellek olarak yaz; başarı durumunu döndür"""
+    cache_path = sidecar_path(path, name)
+    temp_path = cache_path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as handle:
+            np.savez(handle, cache_key=np.array(key), **arrays)
+        os.replace(temp_path, cache_path)
+        return True
+    except Exception:
+        # Salt okunur dizinlerde önbellek yazılamayabilir; hesaplama sonucu yine kullanılır
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from .density import KM_PER_DEG_LAT, KM_PER_DEG_LON
+
+# extend ile ızgara dışına düşen noktaların oranı bunu aşarsa indeks yeniden kurulur
+EXTEND_REBUILD_FRACTION = 0.1
+
+
+def local_km_coordinates(longitudes, latitudes, origin):
+    """Boylam/enlem dizilerini verilen orijine göre yerel düzlem koordinatlarına (km) çevir.
+
+    Eşdikdörtgen (equirectangular) yaklaşımı kullanılır; Türkiye ölçeğinde hata %1 mertebesindedir.
+    """
+    lon0, lat0 = origin
+    scale_x = KM_PER_DEG_LON * np.cos(np.radians(lat0))
+    x = (np.asarray(longitudes, dtype=np.float64) - lon0) * scale_x
+    y = (np.asarray(latitudes, dtype=np.float64) - lat0) * KM_PER_DEG_LAT
+    return x, y
+
+
+def catalogue_origin(longitudes, latitudes):
+    """Yerel projeksiyon için katalog merkezini döndür"""
+    return (float(np.nanmean(longitudes)), float(np.nanmean(latitudes)))
+
+
+class GridIndex(object):
+    """Sıralı hücre kodları üzerinde çalışan düzenli ızgara mekansal indeksi.
+
+    Noktalar hücre koduna göre bir kez sıralanır; her sorgu satır başına bir
+    searchsorted ile (logaritmik) aday aralıklarını bulur.
+    """
+
+    def __init__(self, x, y, cell_size):
+        self.cell_size = float(cell_size)
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+
+        if len(self.x) > 0:
+            self.x0 = float(np.min(self.x))
+            self.y0 = float(np.min(self.y))
+            self.ncols = int((np.max(self.x) - self.x0) // self.cell_size) + 1
+            self.nrows = int((np.max(self.y) - self.y0) // self.cell_size) + 1
+        else:
+            self.x0 = self.y0 = 0.0
+            self.ncols = self.nrows = 1
+
+        # Sıra ve hücre kodları sığdığı sürece int32 tutulur (nokta başına 8 bayt)
+        codes = self._cell_codes(self.x, self.y)
+        self.order = np.argsort(codes, kind='stable').astype(self._index_dtype(len(self.x)))
+        self.sorted_codes = codes[self.order].astype(self._index_dtype(self.ncols * self.nrows))
+        self.outside_count = 0
+
+    def __len__(self):
+        return len(self.x)
+
+    @staticmethod
+    def _index_dtype(limit):
+        return np.int32 if limit < np.iinfo(np.int32).max else np.int64
+
+    def extend(self, x, y):
+        """Yeni noktaları yeniden sıralamadan ekle; konumları mevcut noktalardan sonra gelir.
+
+        Izgara sınırları değişmez: dışarıda kalan noktalar kenar hücrelere yazılır ve
+        sorgularda yine tam koordinat kontrolüyle doğru sonuç verir. Dış noktalar çoğalırsa
+        indeks genişletilmiş sınırlarla yeniden kurulur.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if len(x) == 0:
+            return
+        outside = np.count_nonzero(
+            (x < self.x0) | (x >= self.x0 + self.ncols * self.cell_size) |
+            (y < self.y0) | (y >= self.y0 + self.nrows * self.cell_size)
+        )
+        if len(self.x) == 0 or self.outside_count + outside > EXTEND_REBUILD_FRACTION * (len(self.x) + len(x)):
+            # Kenar hücreler aşırı dolmasın diye sınırlar yeni noktalarla yeniden hesaplanır
+            self.__init__(np.concatenate((self.x, x)), np.concatenate((self.y, y)), self.cell_size)
+            return
+        self.outside_count += outside
+
+        codes = self._cell_codes(x, y)
+        new_order = np.argsort(codes, kind='stable')
+        new_codes = codes[new_order].astype(self.sorted_codes.dtype)
+        # Sıralı kodlara birleştirme: mevcut sıralama korunur, sadece yeni noktalar yerleştirilir
+        positions = np.searchsorted(self.sorted_codes, new_codes, side='right')
+        self.sorted_codes = np.insert(self.sorted_codes, positions, new_codes)
+        order_dtype = self._index_dtype(len(self.x) + len(x))
+        self.order = np.insert(self.order.astype(order_dtype, copy=False), positions,
+                               (new_order + len(self.x)).astype(order_dtype))
+        self.x = np.concatenate((self.x, x))
+        self.y = np.concatenate((self.y, y))
+
+    def _cell_codes(self, x, y):
+        ix = np.clip(((x - self.x0) // self.cell_size).astype(np.int64), 0, self.ncols - 1)
+        iy = np.clip(((y - self.y0) // self.cell_size).astype(np.int64), 0, self.nrows - 1)
+        return iy * self.ncols + ix
+
+    def query_bbox(self, xmin, ymin, xmax, ymax):
+        """Kutu içindeki noktaların indekslerini döndür"""
+        if xmin > xmax or ymin > ymax:
+            return np.empty(0, dtype=np.int64)
+        # Hücre aralığı ızgaraya kırpılır; extend ile eklenen dış noktalar kenar hücrelerdedir
+        ix0 = min(max(0, int((xmin - self.x0) // self.cell_size)), self.ncols - 1)
+        ix1 = min(max(0, int((xmax - self.x0) // self.cell_size)), self.ncols - 1)
+        iy0 = min(max(0, int((ymin - self.y0) // self.cell_size)), self.nrows - 1)
+        iy1 = min(max(0, int((ymax - self.y0) // self.cell_size)), self.nrows - 1)
+
+        # Her ızgara satırı sıralı dizide kesintisiz bir aralıktır
+        # Anahtarlar indeksle aynı tipte verilir; aksi halde searchsorted tüm diziyi her sorguda dönüştürür
+        rows = np.arange(iy0, iy1 + 1, dtype=np.int64) * self.ncols
+        starts = np.searchsorted(self.sorted_codes, (rows + ix0).astype(self.sorted_codes.dtype), side='left')
+        ends = np.searchsorted(self.sorted_codes, (rows + ix1).astype(self.sorted_codes.dtype), side='right')
+        if not np.any(ends > starts):
+            return np.empty(0, dtype=np.int64)
+        candidates = np.concatenate([self.order[s:e] for s, e in zip(starts, ends) if e > s])
+
+        inside = (
+            (self.x[candidates] >= xmin) & (self.x[candidates] <= xmax) &
+            (self.y[candidates] >= ymin) & (self.y[candidates] <= ymax)
+        )
+        return candidates[inside]
+
+    def query_radius(self, cx, cy, radius):
+        """Merkeze verilen yarıçaptan yakın noktaların indekslerini döndür"""
+        candidates = self.query_bbox(cx - radius, cy - radius, cx + radius, cy + radius)
+        dx = self.x[candidates] - cx
+        dy = self.y[candidates] - cy
+        return candidates[dx * dx + dy * dy <= radius * radius]
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+import unicodedata
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Türkçe karakterlerin ASCII karşılıkları; tek str.translate çağrısıyla uygulanır
+TURKISH_TO_ASCII = str.maketrans({
+    'ı': 'i', 'ğ': 'g', 'ü': 'u', 'ş': 's', 'ö': 'o', 'ç': 'c',
+    'İ': 'I', 'Ğ': 'G', 'Ü': 'U', 'Ş': 'S', 'Ö': 'O', 'Ç': 'C',
+})
+
+# İl/ilçe/köy adları tekrar ettiği için sonuçlar bellekte tutulur
+NORMALIZE_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_text(text):
+    """Metni normalize et (Türkçe karakterler ASCII'ye çevrilir, diğer aksanlar atılır)"""
+    text = text.translate(TURKISH_TO_ASCII)
+    if text.isascii():
+        return text
+    return unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('ASCII')
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def name_key(text):
+    """Büyük/küçük harf ve Türkçe karakter duyarsız ad anahtarı (katman adları ve birleştirmeler için)"""
+    return normalize_text(text).lower().strip()
+
+
+def normalize_series(values, key=False):
+    """Bir sütunun tüm değerlerini normalize et.
+
+    Değerler önce tekilleştirilir (factorize); her tekil ad bir kez çevrilip kodlarla geri dağıtılır.
+    Eksik değerler boş metin olur. key=True ise name_key uygulanır.
+    """
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    convert = name_key if key else normalize_text
+    converted = np.array([convert(str(value)) for value in uniques] + [""], dtype=object)
+    # Eksik değerlerin kodu -1: dizinin sonundaki boş metne düşer
+    return pd.Series(converted[codes], index=values.index if isinstance(values, pd.Series) else None, dtype=object)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from qgis.PyQt import QtWidgets, uic, QtCore
-from qgis.PyQt.QtCore import pyqtSignal, QTimer
+from qgis.PyQt import QtWidgets, QtCore
+from qgis.PyQt.QtCore import pyqtSignal, QTimer, QVariant
 from qgis.PyQt.QtGui import QColor, QFont
 from qgis.core import (
     Qgis, QgsVectorLayer, QgsProject, QgsFeature, QgsGeometry,
@@ -9,17 +9,160 @@ from qgis.core import (
     QgsTextFormat, QgsVectorLayerSimpleLabeling, QgsCoordinateReferenceSystem,
     QgsCoordinateTransform, QgsSymbol, QgsRendererRange, QgsGraduatedSymbolRenderer,
     QgsMarkerSymbol, QgsTextBufferSettings, QgsFillSymbol, QgsSingleSymbolRenderer,
-    QgsFeatureRequest
+    QgsFeatureRequest, QgsApplication, QgsTask, QgsMessageLog, QgsSettings, QgsWkbTypes
 )
 from qgis.utils import iface
+import copy
+import datetime
 import os
-import unicodedata
 import pandas as pd
 import numpy as np
 
-FORM_CLASS, _ = uic.loadUiType(
-    os.path.join(os.path.dirname(__file__), "..", "ui", "ui_EarthquakeAnalysisDialog.ui")
+from ..util.catalogue import (
+    CSV_COLUMNS, compact_catalogue, concat_catalogue, memory_per_event, parse_event_dates, valid_coordinate_mask
 )
+from ..util.spatial_index import GridIndex, local_km_coordinates, catalogue_origin
+from ..util.decluster import decluster, WINDOW_METHODS
+from ..util.exposure import (
+    POPULATION_COLUMN, district_keys, join_population, districts_near_points, exposure_metrics, radius_event_stats
+)
+from ..util.text import name_key
+from ..util.population import load_population_table, district_lookup, unmatched_names, write_unmatched_report
+from ..util.fault_distance import polyline_segments, nearest_fault
+from ..util.ground_motion import GMPE_MODELS
+from ..util.energy import event_years, district_year_sums, district_year_table, yearly_series
+from ..util.magnitude import (
+    HARMONIZED_COLUMN, MW_CONVERSION_SETTING, harmonize_catalogue, format_conversions, parse_conversions,
+    stored_conversions
+)
+from ..util.point_in_polygon import points_in_rings, point_labels
+from ..util.region_source import (
+    AdminRegionSource, DistrictSelectionRegionSource, features_ignoring_subset, geometry_rings
+)
+from ..util.sidecar_cache import file_signature, load_sidecar, save_sidecar
+from ..util.profiling import monitor
+from ..util.fdsn import parse_response
+from ..util.fdsn_fetcher import FdsnFetcher
+from ..util.catalogue_tail import CatalogueTail, CatalogueRewritten
+from ..util.export import EXPORT_FORMATS, available_formats, export_path, export_events
+from ..util.catalogue_store import (
+    append_catalogue_store, catalogue_store_path, catalogue_store_is_current, write_catalogue_store
+)
+from ..util.project_store import (
+    DISTRICT_LAYER, FAULT_LAYER, SETTLEMENT_LAYER, store_layer_uri, store_layer_names, import_layer
+)
+
+# Arayüz pyuic5 ile önceden derlenmiş modülden yüklenir; .ui değişince
+# `python -m benchmarks.bench_startup --regenerate-ui` ile yeniden üretin
+from ..ui.ui_EarthquakeAnalysisDialog import Ui_IlceFilterDialog as FORM_CLASS
+
+# Son kullanılan proje deposunun saklandığı ayar anahtarı
+PROJECT_STORE_SETTING = 'pau_earthquake_analysis/project_store'
+# Katalog mekansal indeksinin hücre boyutu (km)
+CATALOGUE_INDEX_CELL_KM = 10.0
+
+# CSV'den okunan sütunlar
+EARTHQUAKE_COLUMNS = CSV_COLUMNS
+
+# İzleme modunda dosya boyutunun kontrol aralığı (ms)
+CATALOGUE_WATCH_INTERVAL_MS = 5000
+
+
+def run_declustering_task(task, times, x_km, y_km, magnitudes, spatial_index, method):
+    """Arka plan görevinde kümesizleştirmeyi çalıştır"""
+    def progress(fraction):
+        task.setProgress(fraction * 100)
+        return not task.isCanceled()
+
+    mainshock, aftershock, cluster_id = decluster(
+        times, x_km, y_km, magnitudes, spatial_index, method=method, progress=progress
+    )
+    if task.isCanceled():
+        return None
+    return {'mainshock': mainshock, 'aftershock': aftershock, 'cluster_id': cluster_id}
+
+def run_fault_distance_task(task, x_km, y_km, segments):
+    """Arka plan görevinde depremlerin en yakın faya uzaklığını hesapla"""
+    def progress(fraction):
+        task.setProgress(fraction * 100)
+        return not task.isCanceled()
+
+    result = nearest_fault(x_km, y_km, segments, progress=progress)
+    if result is None or task.isCanceled():
+        return None
+    distance, fault_id = result
+    return {'fault_distance_km': distance, 'nearest_fault_id': fault_id}
+
+def run_settlement_exposure_task(task, qx, qy, ex, ey, magnitudes, radius_km):
+    """Arka plan görevinde her yerleşimin yakınındaki deprem sayısını ve en büyük magnitüdü hesapla"""
+    def progress(fraction):
+        task.setProgress(fraction * 100)
+        return not task.isCanceled()
+
+    result = radius_event_stats(qx, qy, ex, ey, magnitudes, radius_km, progress=progress)
+    if result is None or task.isCanceled():
+        return None
+    counts, max_magnitude = result
+    return {'counts': counts, 'max_magnitude': max_magnitude}
+
+def run_export_task(task, path, fmt, catalogue, positions, extra):
+    """Arka plan görevinde filtre sonucunu parça parça dosyaya yaz"""
+    def progress(fraction):
+        task.setProgress(fraction * 100)
+        return not task.isCanceled()
+
+    return export_events(path, fmt, catalogue, positions, extra, progress=progress)
+
+def merge_catalogue_rows(catalogue, xy_km, times, spatial_index, rows, origin, segments=None):
+    """Yeni olayları katalog, koordinat ve zaman dizileri ile mekansal indeksin genişletilmiş kopyalarına ekle"""
+    x_km, y_km = local_km_coordinates(rows['longitude'].values, rows['latitude'].values, origin)
+    
+    # Türetilmiş sütunlar: kümesizleştirme yeniden çalıştırılana kadar yeni olaylar ana şok sayılır
+    if 'mainshock' in catalogue.columns:
+        rows = rows.assign(mainshock=True, aftershock=False, cluster_id=-1)
+    if segments is not None:
+        distance, fault_id = nearest_fault(x_km, y_km, segments)
+        rows = rows.assign(fault_distance_km=distance, nearest_fault_id=fault_id)
+    
+    # Çalışan görevler mevcut indeksi kullanıyor olabilir; genişletme sığ bir kopya üzerinde yapılır
+    index = copy.copy(spatial_index)
+    index.extend(x_km, y_km)
+    return {
+        'rows': rows,
+        'catalogue': concat_catalogue(catalogue, rows),
+        'xy_km': (np.concatenate((xy_km[0], x_km)), np.concatenate((xy_km[1], y_km))),
+        'times': np.concatenate((times, rows['eventDate'].values.astype('datetime64[ns]').astype(np.int64))),
+        'index': index,
+    }
+
+def run_feed_merge_task(task, payloads, fmt, conversions, catalogue, xy_km, times, spatial_index, origin,
+                        segments, row_start):
+    """Arka plan görevinde servis yanıtlarını ayrıştır ve kataloğa eklenmiş dizileri hazırla"""
+    frames = []
+    for number, data in enumerate(payloads):
+        frames.append(parse_response(data, fmt))
+        task.setProgress((number + 1) * 100.0 / len(payloads))
+        if task.isCanceled():
+            return None
+    rows = pd.concat(frames, ignore_index=True)
+    
+    # CSV yüklemesiyle aynı hazırlık: tarih, koordinat denetimi, sıkıştırma ve Mw sütunu
+    rows = parse_event_dates(rows)
+    rows = compact_catalogue(rows[valid_coordinate_mask(rows)])
+    rows = harmonize_catalogue(rows, conversions).drop_duplicates('eventId')
+    result = {'snapshot': catalogue, 'rows': rows, 'merged': None}
+    if catalogue is None or rows.empty:
+        return result
+    
+    new_rows = rows[~np.isin(rows['eventId'].values, catalogue['eventId'].values)]
+    if new_rows.empty or task.isCanceled():
+        return result
+    # CSV izleme etiketleriyle çakışmaması için etiketler satır sayacından sonra başlar
+    start = max(int(catalogue.index.max()) + 1, row_start)
+    new_rows.index = pd.RangeIndex(start, start + len(new_rows))
+    result['merged'] = merge_catalogue_rows(catalogue, xy_km, times, spatial_index, new_rows, origin, segments)
+    return result
+
 
 class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
     closingPlugin = pyqtSignal()
@@ -39,6 +182,9 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         self.filterGroup.setEnabled(False)
         self.faultLinesGroup.setEnabled(False)
         self.settlementGroup.setEnabled(False)
+        self.populationGroup.setEnabled(False)
+        self.energyGroup.setEnabled(False)
+        self.exportGroup.setEnabled(False)
         
         # Başlangıçta yakınlık mesafesi alanını devre dışı bırak
         self.bufferSpinBox.setEnabled(False)
@@ -60,6 +206,28 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         self.maxMagnitudeSpinBox.setEnabled(False)
         self.magnitudeRangeLabel.setEnabled(False)
         self.magnitudeSeparatorLabel.setEnabled(False)
+        self.magnitudeScaleComboBox.setEnabled(False)
+        
+        # Derinlik filtresi alanlarını başlangıçta devre dışı bırak
+        self.minDepthSpinBox.setEnabled(False)
+        self.maxDepthSpinBox.setEnabled(False)
+        self.depthRangeLabel.setEnabled(False)
+        self.depthSeparatorLabel.setEnabled(False)
+        
+        # Kümesizleştirme alanlarını başlangıçta devre dışı bırak
+        self.declusterMethodComboBox.addItems(list(WINDOW_METHODS.keys()))
+        self.declusterMethodComboBox.setEnabled(False)
+        self.declusterButton.setEnabled(False)
+        self.declusterLabel.setEnabled(False)
+        self.mainshockOnlyCheckBox.setEnabled(False)
+        
+        # Faya uzaklık filtresi uzaklıklar hesaplanınca aktif olur
+        self.faultDistanceSpinBox.setEnabled(False)
+        self.faultDistanceLabel.setEnabled(False)
+        
+        # Yoğunluk haritası bant genişliği sadece yoğunluk görünümünde aktif
+        self.densityBandwidthSpinBox.setEnabled(False)
+        self.densityBandwidthLabel.setEnabled(False)
         
         # Başlangıçta yerleşim noktaları alanlarını devre dışı bırak
         self.settlementIlColumnComboBox.setEnabled(False)
@@ -67,6 +235,7 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         self.settlementIlLabel.setEnabled(False)
         self.settlementIlceLabel.setEnabled(False)
         self.settlementDistanceSpinBox.setEnabled(False)
+        self.settlementExposureButton.setEnabled(False)
         
         # Tamam butonunu başlangıçta devre dışı bırak
         self.buttonBox.button(QtWidgets.QDialogButtonBox.Ok).setEnabled(False)
@@ -74,6 +243,8 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         # Yerleşim noktaları katmanı için değişken
         self.settlement_layer = None
         self.settlement_file_path = None
+        self.settlement_exposure_task = None
+        self.settlement_exposure_fids = None
         
         # Sinyalleri bağla
         self.filePathButton.clicked.connect(self.select_shapefile)
@@ -91,6 +262,42 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         self.yearComboBox.currentTextChanged.connect(self.on_year_changed)
         self.endYearComboBox.currentTextChanged.connect(self.on_year_changed)
         
+        # Yoğunluk haritası sinyallerini bağla
+        self.densityCheckBox.stateChanged.connect(self.on_display_mode_changed)
+        self.densityBandwidthSpinBox.valueChanged.connect(self.on_display_mode_changed)
+        self.lodCheckBox.stateChanged.connect(self.on_display_mode_changed)
+        self.catalogueSubsetCheckBox.stateChanged.connect(self.on_display_mode_changed)
+        
+        # Yer hareketi (PGA) yüzeyi sinyallerini bağla
+        self.pgaModelComboBox.addItems(list(GMPE_MODELS.keys()))
+        self.pgaCheckBox.stateChanged.connect(self.on_display_mode_changed)
+        for widget in (self.pgaCutoffSpinBox, self.pgaCellSpinBox, self.pgaPercentileSpinBox):
+            widget.valueChanged.connect(self.on_pga_params_changed)
+        self.pgaModelComboBox.currentTextChanged.connect(self.on_pga_params_changed)
+        for widget in (self.pgaModelComboBox, self.pgaCutoffSpinBox, self.pgaCellSpinBox,
+                       self.pgaPercentileSpinBox, self.pgaWorkersSpinBox):
+            widget.setEnabled(False)
+        
+        # Kümesizleştirme sinyallerini bağla
+        self.declusterButton.clicked.connect(self.start_declustering)
+        self.declusterMethodComboBox.currentTextChanged.connect(self.load_cached_declustering)
+        self.mainshockOnlyCheckBox.stateChanged.connect(self.on_mainshock_filter_changed)
+        
+        # Faya uzaklık filtresi
+        self.faultDistanceSpinBox.valueChanged.connect(self.on_fault_distance_changed)
+        
+        # Büyüklük aralığı filtresi (katalog her yüklendiğinde yeniden bağlanmaz)
+        self.minMagnitudeSpinBox.valueChanged.connect(self.on_magnitude_changed)
+        self.maxMagnitudeSpinBox.valueChanged.connect(self.on_magnitude_changed)
+        
+        # Derinlik aralığı filtresi
+        self.minDepthSpinBox.valueChanged.connect(self.on_depth_changed)
+        self.maxDepthSpinBox.valueChanged.connect(self.on_depth_changed)
+        
+        # Performans ölçümü sinyallerini bağla
+        self.profilingCheckBox.toggled.connect(self.on_profiling_toggled)
+        self.profileCaptureCheckBox.toggled.connect(self.on_profile_capture_toggled)
+        
         # ComboBox placeholder metinleri
         self.ilComboBox.setPlaceholderText("İl seçiniz...")
         self.ilceComboBox.setPlaceholderText("İlçe seçiniz...")
@@ -102,13 +309,36 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         self.csv_file_path = None
         self.fault_line_layer = None
         self.earthquake_data = None
-        self.earthquake_points = None
         self.target_crs = QgsCoordinateReferenceSystem('EPSG:32635')
         
+        # Katalog indeksleri (yerel km koordinatları, zaman dizisi, mekansal indeks)
+        self.projection_origin = None
+        self.earthquake_xy_km = None
+        self.earthquake_times = None
+        self.earthquake_index = None
+        self.decluster_task = None
+        self.decluster_task_key = None
+        self.fault_distance_task = None
+        self.fault_distance_task_key = None
+        
         # Cache için değişkenler
         self.cached_geometry = None
         self.cached_filter_exp = None
         self.cached_buffer_distance = None
+        self.cached_region_geometry = None  # Son filtrede kullanılan bölge geometrisi (WGS84)
+        
+        # Bölge kaynağı: None ise il/ilçe seçimi kullanılır; çizim, katman seçimi veya daire atanabilir
+        self.region_source = None
+        self.cached_region_key = None
+        self.cached_region_base = None  # Kaynağın tamponsuz WGS84 geometrisi
+        self.regionSourceResetButton.clicked.connect(self.reset_region_source)
+        self.regionSourceResetButton.setEnabled(False)
+        
+        # Çoklu il/ilçe seçimi: il düğümü işaretlenince tüm ilçeleri işaretlenir
+        self.regionTreeWidget.header().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        self.regionTreeWidget.header().setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeToContents)
+        self.regionSelectionButton.clicked.connect(self.apply_region_selection)
+        self.breakdownCheckBox.stateChanged.connect(self.on_breakdown_changed)
         
         # Buttonbox metinlerini güncelle
         self.buttonBox.button(QtWidgets.QDialogButtonBox.Ok).setText("Tamam")
@@ -124,19 +354,64 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         # Sinyalleri bağla
         self.settlementFileButton.clicked.connect(self.select_settlement_file)
         
-    def normalize_text(self, text):
-        """Metni normalize et (büyük/küçük harf ve türkçe karakter duyarsız)"""
-        # Türkçe karakterleri İngilizce karakterlere çevir
-        tr_chars = {'ı': 'i', 'ğ': 'g', 'ü': 'u', 'ş': 's', 'ö': 'o', 'ç': 'c',
-                   'İ': 'I', 'Ğ': 'G', 'Ü': 'U', 'Ş': 'S', 'Ö': 'O', 'Ç': 'C'}
-        for tr_char, eng_char in tr_chars.items():
-            text = text.replace(tr_char, eng_char)
-        # Büyük harfe çevir ve unicode normalize et
-        return unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('ASCII')
+        # Proje deposu (içe aktarılmış GeoPackage)
+        self.project_store_path = None
+        self.fault_line_file_path = None
+        self.projectStoreOpenButton.clicked.connect(self.select_project_store)
+        self.projectStoreImportButton.clicked.connect(self.import_project_store)
+        last_store = QgsSettings().value(PROJECT_STORE_SETTING, "")
+        if last_store and os.path.exists(last_store):
+            self.projectStoreEdit.setText(last_store)
+        
+        # Magnitüd türü dönüşümü: Mw sütunu yüklemede bir kez hesaplanır, filtre ve stil
+        # ham/dönüştürülmüş sütun arasında yeniden hesaplama yapmadan geçer
+        self.mw_conversions = self.load_mw_conversions()
+        self.mwConversionEdit.setText(format_conversions(self.mw_conversions))
+        self.mwConversionEdit.editingFinished.connect(self.on_mw_conversion_edited)
+        self.magnitudeScaleComboBox.currentIndexChanged.connect(self.on_magnitude_scale_changed)
+        
+        # Katalog izleme: dosyaya eklenen satırlar son bayt konumundan itibaren okunur
+        self.catalogue_tail = None
+        self.catalogue_watch_timer = QTimer(self)
+        self.catalogue_watch_timer.setInterval(CATALOGUE_WATCH_INTERVAL_MS)
+        self.catalogue_watch_timer.timeout.connect(self.poll_catalogue_tail)
+        self.watchCheckBox.toggled.connect(self.on_watch_toggled)
+        self.watchCheckBox.setEnabled(False)
+        
+        # FDSN olay servisi: zaman pencereleri eşzamanlı çekilip kataloğa eklenir
+        self.feed_fetcher = None
+        # Katalog deposunun son yazıldığı/doğrulandığı anahtar (eklenen satırlar depoya bu anahtar üzerinden eklenir)
+        self.stored_catalogue_key = None
+        # Ham yanıtlar sıraya alınır ve tek bir arka plan görevinde sırayla ayrıştırılıp eklenir
+        self.feed_task = None
+        self.feed_pages = []
+        self.feed_format = None
+        self.feed_row_count = 0
+        self.feed_network_done = False
+        self.feedButton.clicked.connect(self.on_feed_button_clicked)
+        
+        # Nüfus etkilenimi: TÜİK ilçe nüfus tablosu ilçe sınırlarına normalize ad anahtarıyla bağlanır
+        self.xlsx_file_path = None
+        self.population_data = None
+        self.population_keys = None
+        self.cached_district_lookup_key = None
+        self.cached_district_lookup = None
+        self.cached_district_labels_key = None
+        self.cached_district_labels = None
+        self.xlsxFileButton.clicked.connect(self.select_xlsx_file)
+        self.exposureButton.clicked.connect(self.compute_population_exposure)
+        self.settlementExposureButton.clicked.connect(self.start_settlement_exposure)
+        self.energyButton.clicked.connect(self.compute_energy_accumulation)
+        
+        # Dışa aktarma: filtre sonucu katman nesneleri oluşturulmadan doğrudan dosyaya yazılır
+        self.export_task = None
+        self.exportFormatComboBox.addItems(available_formats())
+        self.exportButton.clicked.connect(self.export_filtered_events)
         
     def create_new_layer(self, file_path):
         """Yeni bir layer oluştur"""
-        if file_path and os.path.exists(file_path):
+        # GeoPackage deposundaki katmanlar "yol|layername=..." biçimindedir
+        if file_path and os.path.exists(file_path.split('|')[0]):
             # Layer'ı seçilen koordinat sisteminde oluştur
             new_layer = QgsVectorLayer(file_path, self.original_layer_name, "ogr")
             if new_layer.isValid():
@@ -189,6 +464,110 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
             return False
         return True
         
+    def select_project_store(self):
+        """Daha önce oluşturulmuş proje deposunu seç"""
+        file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self,
+            "Proje Deposu Seç",
+            self.projectStoreEdit.text(),
+            "GeoPackage (*.gpkg)"
+        )
+        
+        if file_path and os.path.exists(file_path):
+            self.open_project_store(file_path)
+
+    def import_project_store(self):
+        """Seçili ilçe, fay ve yerleşim dosyalarını hedef koordinat sisteminde tek GeoPackage'a yaz"""
+        if not self.file_path or '|' in self.file_path:
+            QtWidgets.QMessageBox.warning(
+                self,
+                "Uyarı",
+                "Depo oluşturmak için önce ilçe sınırları shapefile'ını seçiniz.",
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+
+        default_path = os.path.join(os.path.dirname(self.file_path), "deprem_proje_deposu.gpkg")
+        store_path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self,
+            "Proje Deposunu Kaydet",
+            default_path,
+            "GeoPackage (*.gpkg)"
+        )
+        if not store_path:
+            return
+
+        try:
+            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+            target_srs = self.target_crs.authid()
+            sources = [
+                (DISTRICT_LAYER, self.file_path,
+                 (self.ilColumnComboBox.currentText(), self.ilceColumnComboBox.currentText()), True),
+                (FAULT_LAYER, self.fault_line_file_path, (), True),
+                (SETTLEMENT_LAYER, self.settlement_file_path,
+                 (self.settlementIlColumnComboBox.currentText(), self.settlementIlceColumnComboBox.currentText()), False),
+            ]
+            written = []
+            for layer_name, source_path, index_columns, promote_to_multi in sources:
+                if not source_path or not os.path.exists(source_path):
+                    continue
+                with monitor.stage(f"depo.{layer_name}"):
+                    if import_layer(store_path, layer_name, source_path, target_srs,
+                                    [c for c in index_columns if c], promote_to_multi):
+                        written.append(layer_name)
+                QtWidgets.QApplication.processEvents()
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Hata",
+                f"Proje deposu oluşturulurken hata oluştu: {str(e)}",
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+        finally:
+            QtWidgets.QApplication.restoreOverrideCursor()
+
+        QtWidgets.QMessageBox.information(
+            self,
+            "Bilgi",
+            f"Proje deposu hazır. Yazılan katmanlar: {', '.join(written) if written else 'yok (güncel)'}",
+            QtWidgets.QMessageBox.Ok
+        )
+        self.open_project_store(store_path)
+
+    def open_project_store(self, store_path):
+        """Proje deposundaki katmanları yeniden dönüştürmeden doğrudan aç"""
+        layer_names = store_layer_names(store_path)
+        if DISTRICT_LAYER not in layer_names:
+            QtWidgets.QMessageBox.critical(self, "Hata", "Seçilen dosya geçerli bir proje deposu değil!")
+            return
+
+        self.project_store_path = store_path
+        self.projectStoreEdit.setText(store_path)
+        QgsSettings().setValue(PROJECT_STORE_SETTING, store_path)
+
+        # İlçe sınırları
+        self.file_path = store_layer_uri(store_path, DISTRICT_LAYER)
+        self.filePathEdit.setText(self.file_path)
+        self.original_layer_name = DISTRICT_LAYER
+        self.load_layer(self.file_path)
+        self.enable_fields()
+
+        # Diri fay hatları
+        if FAULT_LAYER in layer_names:
+            self.fault_line_file_path = store_layer_uri(store_path, FAULT_LAYER)
+            self.fault_line_layer = self.load_fault_line_layer(self.fault_line_file_path)
+            if self.fault_line_layer:
+                self.faultLineFileEdit.setText(self.fault_line_file_path)
+                self.update_fault_lines()
+                self.start_fault_distance()
+
+        # Yerleşim noktaları
+        if SETTLEMENT_LAYER in layer_names:
+            self.settlement_file_path = store_layer_uri(store_path, SETTLEMENT_LAYER)
+            self.settlementFileEdit.setText(self.settlement_file_path)
+            self.load_settlement_layer(self.settlement_file_path)
+
     def zoom_to_layer(self, filter_exp=None):
         """Haritayı verilen layer'a göre zoom yapar"""
         if not self.vector_layer or not self.ensure_valid_layer():
@@ -275,6 +654,8 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         self.filterGroup.setEnabled(True)
         self.faultLinesGroup.setEnabled(True)
         self.settlementGroup.setEnabled(True)
+        self.populationGroup.setEnabled(True)
+        self.energyGroup.setEnabled(True)
         
         # Sütun seçme alanlarını aktif hale getir
         self.ilColumnComboBox.setEnabled(True)
@@ -305,6 +686,82 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         self.ilComboBox.clear()
         self.ilceComboBox.clear()
         self.ilComboBox.addItems(il_list)
+        self.populate_region_tree()
+        
+    def populate_region_tree(self):
+        """Çoklu seçim ağacını il > ilçe düğümleriyle doldur; ilçe düğümleri FID listesini taşır"""
+        self.regionTreeWidget.clear()
+        il_column = self.ilColumnComboBox.currentText()
+        ilce_column = self.ilceColumnComboBox.currentText()
+        if not il_column or not ilce_column:
+            return
+            
+        request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes([il_column, ilce_column], self.vector_layer.fields())
+        groups = {}
+        for feature in features_ignoring_subset(self.vector_layer, request):
+            il = feature[il_column]
+            ilce = feature[ilce_column]
+            if il and ilce:
+                groups.setdefault(il, {}).setdefault(ilce, []).append(feature.id())
+        
+        self.regionTreeWidget.setUpdatesEnabled(False)
+        for il in sorted(groups):
+            il_item = QtWidgets.QTreeWidgetItem(self.regionTreeWidget, [il, ""])
+            il_item.setFlags(il_item.flags() | QtCore.Qt.ItemIsUserCheckable | QtCore.Qt.ItemIsAutoTristate)
+            il_item.setCheckState(0, QtCore.Qt.Unchecked)
+            for ilce in sorted(groups[il]):
+                ilce_item = QtWidgets.QTreeWidgetItem(il_item, [ilce, ""])
+                ilce_item.setFlags(ilce_item.flags() | QtCore.Qt.ItemIsUserCheckable)
+                ilce_item.setCheckState(0, QtCore.Qt.Unchecked)
+                ilce_item.setData(0, QtCore.Qt.UserRole, groups[il][ilce])
+        self.regionTreeWidget.setUpdatesEnabled(True)
+        
+    def checked_district_groups(self):
+        """Ağaçta işaretli ilçeleri [(\"İl / İlçe\", [fid, ...]), ...] olarak döndür"""
+        groups = []
+        for i in range(self.regionTreeWidget.topLevelItemCount()):
+            il_item = self.regionTreeWidget.topLevelItem(i)
+            if il_item.checkState(0) == QtCore.Qt.Unchecked:
+                continue
+            for j in range(il_item.childCount()):
+                ilce_item = il_item.child(j)
+                if ilce_item.checkState(0) == QtCore.Qt.Checked:
+                    groups.append((f"{il_item.text(0)} / {ilce_item.text(0)}", ilce_item.data(0, QtCore.Qt.UserRole)))
+        return groups
+        
+    def apply_region_selection(self):
+        """İşaretli il ve ilçeleri tek bölge kaynağı olarak kullan"""
+        if not self.ensure_valid_layer():
+            return
+        groups = self.checked_district_groups()
+        if not groups:
+            QtWidgets.QMessageBox.warning(self, "Uyarı", "Lütfen en az bir il veya ilçe işaretleyin!")
+            return
+        self.set_region_source(DistrictSelectionRegionSource(self.vector_layer, groups))
+        
+    def update_region_breakdown(self, region_source, labels):
+        """İlçe bazında deprem sayılarını ağacın ikinci sütununa yaz"""
+        counts = {}
+        if labels is not None:
+            totals = np.bincount(labels[labels >= 0], minlength=len(region_source.label_names))
+            counts = dict(zip(region_source.label_names, totals.tolist()))
+        
+        for i in range(self.regionTreeWidget.topLevelItemCount()):
+            il_item = self.regionTreeWidget.topLevelItem(i)
+            il_total = None
+            for j in range(il_item.childCount()):
+                ilce_item = il_item.child(j)
+                count = counts.get(f"{il_item.text(0)} / {ilce_item.text(0)}")
+                ilce_item.setText(1, "" if count is None else str(count))
+                if count is not None:
+                    il_total = (il_total or 0) + count
+            il_item.setText(1, "" if il_total is None else str(il_total))
+        
+    def on_breakdown_changed(self, *args):
+        """İlçe bazında döküm açılıp kapatıldığında filtreyi yeniden uygula"""
+        if self.earthquake_data is not None and self.region_source is not None:
+            self.apply_earthquake_filter()
         
     def update_ilce_combobox(self, selected_il):
         """İlçe listesini güncelle"""
@@ -398,8 +855,8 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         
         if il and ilce:
             # İl ve ilçe adlarını İngilizce formata çevir
-            il_eng = self.normalize_text(il).lower()
-            ilce_eng = self.normalize_text(ilce).lower()
+            il_eng = name_key(il)
+            ilce_eng = name_key(ilce)
             self.vector_layer.setName(f"{il_eng}_{ilce_eng}")  # province_district formatında
             filter_exp = self.get_filter_expression()
             self.vector_layer.setSubsetString(filter_exp)
@@ -419,7 +876,7 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
                 
         elif il:
             # Sadece il adını İngilizce formata çevir
-            il_eng = self.normalize_text(il).lower()
+            il_eng = name_key(il)
             self.vector_layer.setName(il_eng)  # Sadece province ismi
             filter_exp = self.get_filter_expression()
             self.vector_layer.setSubsetString(filter_exp)
@@ -515,55 +972,9 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
             
     def load_earthquake_data(self, file_path):
         """CSV dosyasından deprem verilerini yükle"""
+        monitor.begin_run()
         try:
-            # CSV'yi daha hızlı okumak için gerekli sütunları belirt
-            required_columns = ['eventId', 'eventDate', 'longitude', 'latitude', 'depth', 'magnitudeType', 'magnitude', 'area']
-            
-            # CSV'yi oku ve tarih sütununu parse et
-            self.earthquake_data = pd.read_csv(file_path, usecols=required_columns)
-            
-            # Tarih sütununu datetime'a çevir
-            self.earthquake_data['eventDate'] = pd.to_datetime(self.earthquake_data['eventDate'], format='%Y-%m-%dT%H:%M:%S')
-            
-            # Geçersiz koordinatları filtrele
-            mask = (
-                self.earthquake_data['longitude'].between(-180, 180) &
-                self.earthquake_data['latitude'].between(-90, 90) &
-                self.earthquake_data['longitude'].notna() &
-                self.earthquake_data['latitude'].notna()
-            )
-            self.earthquake_data = self.earthquake_data[mask]
-            
-            if len(self.earthquake_data) > 0:
-                # Koordinatları numpy array'e dönüştür (daha hızlı işlem için)
-                self.earthquake_points = np.column_stack((
-                    self.earthquake_data['longitude'].values,
-                    self.earthquake_data['latitude'].values
-                ))
-                
-                # Yıl listesini güncelle
-                self.update_year_list()
-                
-                # Yakınlık mesafesi ve yıl filtresi alanlarını aktif hale getir
-                self.bufferSpinBox.setEnabled(True)
-                self.bufferLabel.setEnabled(True)
-                self.yearComboBox.setEnabled(True)
-                self.endYearComboBox.setEnabled(True)
-                self.yearRangeLabel.setEnabled(True)
-                
-                # Büyüklük filtresi alanlarını aktif hale getir
-                self.minMagnitudeSpinBox.setEnabled(True)
-                self.maxMagnitudeSpinBox.setEnabled(True)
-                self.magnitudeRangeLabel.setEnabled(True)
-                self.magnitudeSeparatorLabel.setEnabled(True)
-                
-                # Büyüklük aralığı değişikliklerini bağla
-                self.minMagnitudeSpinBox.valueChanged.connect(self.on_magnitude_changed)
-                self.maxMagnitudeSpinBox.valueChanged.connect(self.on_magnitude_changed)
-                
-                # Yerleşim noktası mesafesi spinbox durumunu güncelle
-                self.update_settlement_distance_spinbox()
-                
+            if self.read_earthquake_csv(file_path) > 0:
                 # Başarılı mesajı göster
                 QtWidgets.QMessageBox.information(
                     self,
@@ -571,21 +982,735 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
                     f"CSV dosyası başarıyla yüklendi. Toplam {len(self.earthquake_data)} deprem verisi bulundu.",
                     QtWidgets.QMessageBox.Ok
                 )
-            else:
-                self.earthquake_data = None
-                self.earthquake_points = None
-                # Tüm filtre alanlarını devre dışı bırak
-                self.disable_filter_fields()
             
         except Exception as e:
             self.earthquake_data = None
-            self.earthquake_points = None
+            self.earthquake_index = None
+            self.catalogue_tail = None
             QtWidgets.QMessageBox.critical(
                 self,
                 "Hata",
                 f"CSV dosyası yüklenirken hata oluştu: {str(e)}",
                 QtWidgets.QMessageBox.Ok
             )
+        finally:
+            self.publish_performance(monitor.end_run())
+        
+    def reload_earthquake_data(self, file_path):
+        """İzlenen dosya baştan yazıldığında kataloğu sessizce yeniden yükle (kalıcı pencere açılmaz)"""
+        monitor.begin_run()
+        try:
+            count = self.read_earthquake_csv(file_path)
+            QgsMessageLog.logMessage(
+                f"İzlenen dosya baştan yazıldı, katalog yeniden yüklendi ({count} deprem)",
+                "Deprem Analizi",
+                Qgis.Info
+            )
+            return True
+        except Exception as e:
+            self.earthquake_data = None
+            self.earthquake_index = None
+            self.catalogue_tail = None
+            self.watchCheckBox.setChecked(False)
+            message = f"İzlenen dosya yeniden yüklenirken hata oluştu: {str(e)}"
+            QgsMessageLog.logMessage(message, "Deprem Analizi", Qgis.Critical)
+            if self.iface:
+                self.iface.messageBar().pushMessage("Katalog İzleme", message, level=Qgis.Critical)
+            return False
+        finally:
+            self.publish_performance(monitor.end_run())
+        
+    def read_earthquake_csv(self, file_path):
+        """CSV'yi oku, satırları hazırla ve katalog yapılarını kur; yüklenen deprem sayısını döndür"""
+        # İzleme için okuma başlamadan önceki dosya boyutu (sonradan eklenenler tekrar okunup ayıklanır)
+        tail_offset = os.path.getsize(file_path)
+        
+        # CSV'yi daha hızlı okumak için sadece gerekli sütunları oku
+        with monitor.stage('csv.okuma'):
+            raw_data = pd.read_csv(file_path, usecols=EARTHQUAKE_COLUMNS)
+        
+        self.earthquake_data = self.prepare_earthquake_rows(raw_data)
+        monitor.count('olay.yuklenen', len(self.earthquake_data))
+        self.catalogue_tail = CatalogueTail(file_path, tail_offset, len(raw_data))
+        
+        if len(self.earthquake_data) > 0:
+            self.initialize_earthquake_data()
+            return len(self.earthquake_data)
+        
+        self.earthquake_data = None
+        self.earthquake_index = None
+        self.catalogue_tail = None
+        # Tüm filtre alanlarını devre dışı bırak
+        self.disable_filter_fields()
+        return 0
+        
+    def initialize_earthquake_data(self):
+        """Yüklenen katalog için indeksleri kur, önbellekleri yükle ve filtre alanlarını aç"""
+        monitor.count('katalog.bayt_olay', memory_per_event(self.earthquake_data))
+        # Yeni katalog: depo ilk kullanımda doğrulanır veya yeniden yazılır
+        self.stored_catalogue_key = None
+        
+        # Zaman dizisi ve mekansal indeksi bir kez oluştur
+        with monitor.stage('katalog.indeks'):
+            self.build_catalogue_index()
+        
+        # Daha önce hesaplanmış kümesizleştirme sonuçlarını önbellekten yükle
+        with monitor.stage('katalog.kumesizlestirme_onbellek'):
+            self.load_cached_declustering()
+        
+        # Fay hatları yüklüyse faya uzaklıkları önbellekten al veya hesapla
+        self.faultDistanceSpinBox.setEnabled(False)
+        self.faultDistanceLabel.setEnabled(False)
+        self.start_fault_distance()
+        
+        # Yıl listesini güncelle
+        self.update_year_list()
+        
+        # Yakınlık mesafesi ve yıl filtresi alanlarını aktif hale getir
+        self.bufferSpinBox.setEnabled(True)
+        self.bufferLabel.setEnabled(True)
+        self.yearComboBox.setEnabled(True)
+        self.endYearComboBox.setEnabled(True)
+        self.yearRangeLabel.setEnabled(True)
+        
+        # Büyüklük filtresi alanlarını aktif hale getir
+        self.minMagnitudeSpinBox.setEnabled(True)
+        self.maxMagnitudeSpinBox.setEnabled(True)
+        self.magnitudeRangeLabel.setEnabled(True)
+        self.magnitudeSeparatorLabel.setEnabled(True)
+        self.magnitudeScaleComboBox.setEnabled(True)
+        
+        # Derinlik filtresi alanlarını aktif hale getir
+        self.minDepthSpinBox.setEnabled(True)
+        self.maxDepthSpinBox.setEnabled(True)
+        self.depthRangeLabel.setEnabled(True)
+        self.depthSeparatorLabel.setEnabled(True)
+        
+        # Kümesizleştirme alanlarını aktif hale getir
+        self.declusterMethodComboBox.setEnabled(True)
+        self.declusterButton.setEnabled(True)
+        self.declusterLabel.setEnabled(True)
+        self.watchCheckBox.setEnabled(self.catalogue_tail is not None)
+        self.exportGroup.setEnabled(True)
+        
+        # Yerleşim noktası mesafesi spinbox durumunu güncelle
+        self.update_settlement_distance_spinbox()
+        
+    def prepare_earthquake_rows(self, rows):
+        """Tarih sütununu çevir, geçersiz koordinatlı satırları çıkar ve sütunları sıkıştır"""
+        with monitor.stage('csv.tarih'):
+            rows = parse_event_dates(rows)
+        
+        with monitor.stage('csv.dogrulama'):
+            mask = valid_coordinate_mask(rows)
+        
+        # float32 koordinatlar ve sözlük kodlu metin sütunları
+        with monitor.stage('csv.sikistirma'):
+            rows = compact_catalogue(rows[mask])
+        
+        # Türüne göre Mw'ye dönüştürülmüş magnitüd sütunu (kategori kodları üzerinden)
+        with monitor.stage('csv.mw'):
+            return harmonize_catalogue(rows, self.mw_conversions)
+        
+    def load_mw_conversions(self):
+        """Kayıtlı dönüşüm katsayılarını oku; kayıt yoksa veya bozuksa varsayılanları kullan"""
+        return stored_conversions(QgsSettings().value(MW_CONVERSION_SETTING, ""))
+        
+    def mw_conversion_key(self):
+        """Mw sütununu üreten katsayıların metin anahtarı (önbellek ve katman geçerliliği için)"""
+        return format_conversions(self.mw_conversions)
+        
+    def magnitude_column(self):
+        """Filtre ve stilde kullanılan magnitüd sütunu (ham veya dönüştürülmüş Mw)"""
+        return HARMONIZED_COLUMN if self.magnitudeScaleComboBox.currentIndex() == 1 else 'magnitude'
+        
+    def on_mw_conversion_edited(self):
+        """Katsayılar değiştiyse kaydet ve Mw sütununu tüm katalog için bir kez yeniden hesapla"""
+        try:
+            conversions = parse_conversions(self.mwConversionEdit.text())
+        except ValueError as e:
+            QtWidgets.QMessageBox.warning(self, "Uyarı", str(e))
+            self.mwConversionEdit.setText(format_conversions(self.mw_conversions))
+            return
+        if conversions == self.mw_conversions:
+            return
+        
+        self.mw_conversions = conversions
+        QgsSettings().setValue(MW_CONVERSION_SETTING, format_conversions(conversions))
+        if self.earthquake_data is not None:
+            with monitor.stage('katalog.mw'):
+                self.earthquake_data = harmonize_catalogue(self.earthquake_data, conversions)
+            self.apply_earthquake_filter()
+        
+    def on_magnitude_scale_changed(self, *args):
+        """Ham/Mw geçişi: sütunlar hazır olduğu için sadece filtre yeniden uygulanır"""
+        if self.earthquake_data is not None:
+            self.apply_earthquake_filter()
+        
+    def on_watch_toggled(self, checked):
+        """Katalog izleme modunu aç/kapat"""
+        if checked and self.catalogue_tail is not None:
+            self.catalogue_watch_timer.start()
+            self.poll_catalogue_tail()
+        else:
+            self.catalogue_watch_timer.stop()
+        
+    def poll_catalogue_tail(self):
+        """CSV'ye eklenen satırları oku ve kataloğa artımlı olarak ekle"""
+        if self.catalogue_tail is None or self.earthquake_data is None:
+            return
+        try:
+            new_rows = self.catalogue_tail.read_new_rows(EARTHQUAKE_COLUMNS)
+        except CatalogueRewritten:
+            # Dosya baştan yazıldı: artımlı ekleme güvenli değil, tamamen yeniden yükle
+            # (filtre yıl listesi kurulurken yeniden uygulanır)
+            self.catalogue_watch_timer.stop()
+            if self.reload_earthquake_data(self.csv_file_path) and self.watchCheckBox.isChecked():
+                self.catalogue_watch_timer.start()
+            return
+        except Exception as e:
+            self.watchCheckBox.setChecked(False)
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Hata",
+                f"İzlenen dosyadan yeni depremler okunurken hata oluştu: {str(e)}",
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+        
+        if new_rows is None or new_rows.empty:
+            return
+        new_rows = self.prepare_earthquake_rows(new_rows)
+        new_rows = self.catalogue_tail.drop_known(new_rows, self.earthquake_data['eventId'].values)
+        if not new_rows.empty:
+            self.append_earthquake_rows(new_rows)
+        
+    def append_earthquake_rows(self, new_rows):
+        """Yeni olayları dizilere, zaman dizisine ve mekansal indekse ekle; filtreyi sadece yenilere uygula"""
+        monitor.begin_run()
+        try:
+            with monitor.stage('izleme.ekleme'):
+                segments = self.load_fault_segments() if 'fault_distance_km' in self.earthquake_data.columns else None
+                merged = merge_catalogue_rows(
+                    self.earthquake_data, self.earthquake_xy_km, self.earthquake_times, self.earthquake_index,
+                    new_rows, self.projection_origin, segments
+                )
+            self.apply_merged_rows(merged)
+        except Exception as e:
+            self.on_append_failed(e)
+        finally:
+            self.publish_performance(monitor.end_run())
+        
+    def apply_merged_rows(self, merged):
+        """merge_catalogue_rows ile hazırlanmış dizileri devral ve filtreyi sadece yeni olaylara uygula"""
+        monitor.begin_run()
+        try:
+            new_rows = merged['rows']
+            self.earthquake_data = merged['catalogue']
+            self.earthquake_xy_km = merged['xy_km']
+            self.earthquake_times = merged['times']
+            self.earthquake_index = merged['index']
+            monitor.count('izleme.yeni_olay', len(new_rows))
+            # Tek katalog katmanı depodan okunur; yeni olaylar FID'leri alt küme ifadesine girmeden depoya yazılır
+            self.append_to_catalogue_store(new_rows)
+            
+            # Filtre parametreleri değişmediyse sadece yeni olaylar filtrelenip önceki sonuca eklenir
+            # Ortak kategori sözlüğüyle birleştirilmiş son satırlar filtrelenir
+            filtered_data = self.get_filtered_earthquake_data(appended=self.earthquake_data.iloc[-len(new_rows):])
+            self.earthquakeDataFiltered.emit(filtered_data)
+            
+            QgsMessageLog.logMessage(
+                f"{len(new_rows)} yeni deprem eklendi (toplam {len(self.earthquake_data)})",
+                "Deprem Analizi",
+                Qgis.Info
+            )
+        except Exception as e:
+            self.on_append_failed(e)
+        finally:
+            self.publish_performance(monitor.end_run())
+        
+    def on_append_failed(self, exception):
+        self.watchCheckBox.setChecked(False)
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Hata",
+            f"Yeni depremler eklenirken hata oluştu: {str(exception)}",
+            QtWidgets.QMessageBox.Ok
+        )
+        
+    def on_feed_button_clicked(self):
+        """Olay servisinden çekmeyi başlat; çekme sürüyorsa iptal et"""
+        if self.feed_fetcher is not None:
+            self.feed_fetcher.cancel()
+            self.finish_feed_fetch()
+            return
+            
+        url = self.feedUrlEdit.text().strip()
+        if not url:
+            QtWidgets.QMessageBox.warning(self, "Uyarı", "Lütfen olay servisinin adresini girin!")
+            return
+        start = datetime.datetime.combine(self.feedStartDateEdit.date().toPyDate(), datetime.time())
+        end = datetime.datetime.combine(self.feedEndDateEdit.date().toPyDate(), datetime.time())
+        if start >= end:
+            QtWidgets.QMessageBox.warning(self, "Uyarı", "Başlangıç tarihi bitiş tarihinden önce olmalıdır!")
+            return
+            
+        self.feed_format = self.feedFormatComboBox.currentText()
+        self.feed_pages = []
+        self.feed_row_count = 0
+        self.feed_network_done = False
+        self.feed_fetcher = FdsnFetcher(url, start, end, fmt=self.feed_format, parent=self)
+        self.feed_fetcher.dataReceived.connect(self.on_feed_data_received)
+        self.feed_fetcher.progressChanged.connect(self.on_feed_progress)
+        self.feed_fetcher.finished.connect(self.on_feed_finished)
+        self.feed_fetcher.failed.connect(self.on_feed_failed)
+        self.feedButton.setText("İptal")
+        self.feed_fetcher.start()
+        
+    def on_feed_data_received(self, data):
+        """Servis yanıtını sıraya al; ayrıştırma ve ekleme arka plan görevinde yapılır"""
+        self.feed_pages.append(data)
+        self.start_feed_merge()
+        
+    def start_feed_merge(self):
+        """Sıradaki yanıtları tek görevde ayrıştırıp kataloğa ekle (görevler sırayla çalışır)"""
+        if self.feed_task is not None or not self.feed_pages:
+            return
+        payloads, self.feed_pages = self.feed_pages, []
+        
+        catalogue = self.earthquake_data
+        segments = None
+        if catalogue is not None and 'fault_distance_km' in catalogue.columns:
+            try:
+                segments = self.load_fault_segments()
+            except Exception as e:
+                if self.feed_fetcher is not None:
+                    self.feed_fetcher.cancel()
+                self.on_feed_failed(str(e))
+                return
+        row_start = self.catalogue_tail.row_count if self.catalogue_tail is not None else 0
+        
+        task = QgsTask.fromFunction(
+            "Olay servisi yanıtlarını işleme",
+            run_feed_merge_task,
+            payloads,
+            self.feed_format,
+            self.mw_conversions,
+            catalogue,
+            self.earthquake_xy_km,
+            self.earthquake_times,
+            self.earthquake_index,
+            self.projection_origin,
+            segments,
+            row_start,
+            on_finished=lambda exception, result=None: self.on_feed_merge_finished(task, exception, result)
+        )
+        self.feed_task = task
+        QgsApplication.taskManager().addTask(task)
+        
+    def on_feed_merge_finished(self, task, exception, result=None):
+        """Yanıt işleme görevi bittiğinde hazırlanan satırları kataloğa devret"""
+        if task is not self.feed_task:
+            # Çekme iptal edildi
+            return
+        self.feed_task = None
+        
+        if exception is not None:
+            if self.feed_fetcher is not None:
+                self.feed_fetcher.cancel()
+            self.on_feed_failed(str(exception))
+            return
+        if result is not None:
+            self.apply_feed_result(result)
+            
+        if self.feed_pages:
+            self.start_feed_merge()
+        elif self.feed_network_done:
+            self.complete_feed_fetch()
+        
+    def apply_feed_result(self, result):
+        """Görevde ayrıştırılan satırları ekle; katalog bu sırada değiştiyse ekleme yeniden yapılır"""
+        rows = result['rows']
+        self.feed_row_count += len(rows)
+        if rows.empty:
+            return
+            
+        if self.earthquake_data is None:
+            # Katalog yoksa ilk sayfa CSV yüklemesiyle aynı yapıları kurar
+            self.csv_file_path = None
+            self.catalogue_tail = None
+            self.earthquake_data = harmonize_catalogue(rows, self.mw_conversions).reset_index(drop=True)
+            self.initialize_earthquake_data()
+            self.apply_earthquake_filter()
+            return
+        if self.earthquake_data is not result['snapshot']:
+            # Görev sürerken katalog değişti (izleme, Mw katsayıları, yeni dosya): eşleştirme güncel katalogla yapılır
+            self.append_feed_rows(harmonize_catalogue(rows, self.mw_conversions))
+            return
+        merged = result['merged']
+        if merged is None:
+            return
+            
+        if self.catalogue_tail is not None:
+            # CSV izleme etiketleriyle çakışmaması için satır sayacı ileri alınır
+            self.catalogue_tail.row_count = max(self.catalogue_tail.row_count, int(merged['rows'].index.max()) + 1)
+        known_years = self.known_years()
+        self.apply_merged_rows(merged)
+        self.update_year_list_for(merged['rows'], known_years)
+        
+    def append_feed_rows(self, rows):
+        """Hazırlanmış servis satırlarını güncel katalogla eşleştirip ekle (eventId'ye göre tekilleştirilir)"""
+        rows = rows[~np.isin(rows['eventId'].values, self.earthquake_data['eventId'].values)]
+        if rows.empty:
+            return
+        start = int(self.earthquake_data.index.max()) + 1
+        if self.catalogue_tail is not None:
+            # CSV izleme etiketleriyle çakışmaması için satır sayacı ileri alınır
+            start = max(start, self.catalogue_tail.row_count)
+            self.catalogue_tail.row_count = start + len(rows)
+        rows.index = pd.RangeIndex(start, start + len(rows))
+        
+        known_years = self.known_years()
+        self.append_earthquake_rows(rows)
+        self.update_year_list_for(rows, known_years)
+        
+    def known_years(self):
+        return {self.yearComboBox.itemText(i) for i in range(self.yearComboBox.count())}
+        
+    def update_year_list_for(self, rows, known_years):
+        """Yeni yıllar geldiyse yıl listesi genişletilir (filtre yeniden uygulanır)"""
+        if {str(year) for year in rows['eventDate'].dt.year.unique()} - known_years:
+            self.update_year_list()
+        
+    def on_feed_progress(self, completed, total):
+        self.feedButton.setText(f"İptal ({completed}/{total})")
+        
+    def on_feed_finished(self, page_count):
+        """Tüm pencereler çekildiğinde çağrılır; sıradaki yanıtlar işlenince çekme tamamlanır"""
+        self.feed_network_done = True
+        if self.feed_task is None and not self.feed_pages:
+            self.complete_feed_fetch()
+        
+    def complete_feed_fetch(self):
+        self.finish_feed_fetch()
+        QgsMessageLog.logMessage(
+            f"Olay servisinden {self.feed_row_count} satır alındı (katalogda {0 if self.earthquake_data is None else len(self.earthquake_data)} deprem)",
+            "Deprem Analizi",
+            Qgis.Info
+        )
+        
+    def on_feed_failed(self, message):
+        """Servis isteği başarısız olduğunda çağrılır"""
+        self.finish_feed_fetch()
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Hata",
+            f"Olay servisinden veri alınırken hata oluştu: {message}",
+            QtWidgets.QMessageBox.Ok
+        )
+        
+    def finish_feed_fetch(self):
+        """Çekmeyi sonlandır; çalışan işleme görevi iptal edilir ve sıradaki yanıtlar atılır"""
+        if self.feed_task is not None:
+            self.feed_task.cancel()
+        self.feed_task = None
+        self.feed_pages = []
+        if self.feed_fetcher is not None:
+            self.feed_fetcher.deleteLater()
+        self.feed_fetcher = None
+        self.feedButton.setText("Servisten Al")
+        
+    def publish_performance(self, report):
+        """Ölçüm raporunu QGIS mesaj günlüğüne ve performans paneline yaz"""
+        if not report:
+            return
+        QgsMessageLog.logMessage(report, "Deprem Analizi", Qgis.Info)
+        self.performanceTextEdit.setPlainText(report)
+        
+        # Tek seferlik profil yakalama sonucu
+        if monitor.last_profile_report:
+            QgsMessageLog.logMessage(monitor.last_profile_report, "Deprem Analizi Profil", Qgis.Info)
+            self.performanceTextEdit.appendPlainText("\nProfil çıktısı 'Deprem Analizi Profil' günlüğüne yazıldı.")
+            monitor.last_profile_report = ""
+            self.profileCaptureCheckBox.setChecked(False)
+            
+    def on_profiling_toggled(self, checked):
+        """Aşama ölçümünü aç/kapat"""
+        monitor.enabled = checked
+        if not checked:
+            self.profileCaptureCheckBox.setChecked(False)
+            
+    def on_profile_capture_toggled(self, checked):
+        """Sonraki çalıştırma için profil yakalamayı işaretle"""
+        if checked and not self.profilingCheckBox.isChecked():
+            self.profilingCheckBox.setChecked(True)
+        monitor.capture_next_run = checked
+        
+    def build_catalogue_index(self):
+        """Katalog için yerel koordinatları, zamana göre sıralı diziyi ve mekansal indeksi oluştur"""
+        longitudes = self.earthquake_data['longitude'].values
+        latitudes = self.earthquake_data['latitude'].values
+        
+        self.projection_origin = catalogue_origin(longitudes, latitudes)
+        x_km, y_km = local_km_coordinates(longitudes, latitudes, self.projection_origin)
+        self.earthquake_xy_km = (x_km, y_km)
+        self.earthquake_times = self.earthquake_data['eventDate'].values.astype('datetime64[ns]').astype(np.int64)
+        self.earthquake_index = GridIndex(x_km, y_km, CATALOGUE_INDEX_CELL_KM)
+        
+    def catalogue_signature(self):
+        """Önbellek anahtarları için katalog kaynağının imzası (CSV dosyası veya olay servisi)"""
+        if self.csv_file_path:
+            return file_signature(self.csv_file_path)
+        return f"servis:{self.feedUrlEdit.text().strip()}"
+
+    def catalogue_store_key(self):
+        # Mw sütunu katsayılara bağlıdır; katsayılar değişince depo yeniden yazılır
+        return f"{file_signature(self.csv_file_path)}|{len(self.earthquake_data)}|{self.mw_conversion_key()}"
+
+    def ensure_catalogue_store(self):
+        """Temizlenmiş kataloğu bir kez indeksli GeoPackage'a yaz ve yolunu döndür"""
+        path = catalogue_store_path(self.csv_file_path)
+        key = self.catalogue_store_key()
+        if catalogue_store_is_current(path, key):
+            monitor.cache_hit('katalog.gpkg')
+        else:
+            monitor.cache_miss('katalog.gpkg')
+            with monitor.stage('katalog.gpkg_yazma'):
+                write_catalogue_store(path, self.earthquake_data, key)
+        self.stored_catalogue_key = key
+        return path
+
+    def append_to_catalogue_store(self, rows):
+        """Kataloğa eklenen satırları (izleme, olay servisi) depoya aynı FID'lerle ekle.
+
+        Depo bu katalog için yazılmamışsa dokunulmaz; gerektiğinde ensure_catalogue_store tamamını yazar.
+        """
+        if not self.csv_file_path or self.stored_catalogue_key is None:
+            return
+        path = catalogue_store_path(self.csv_file_path)
+        if not catalogue_store_is_current(path, self.stored_catalogue_key):
+            self.stored_catalogue_key = None
+            return
+        key = self.catalogue_store_key()
+        with monitor.stage('katalog.gpkg_ekleme'):
+            append_catalogue_store(path, rows, key)
+        self.stored_catalogue_key = key
+
+    def decluster_cache_key(self, method):
+        """Kümesizleştirme önbelleği için anahtar (dosya imzası, yöntem, satır sayısı)"""
+        return f"{self.catalogue_signature()}|{method}|{len(self.earthquake_data)}"
+        
+    def load_cached_declustering(self, *args):
+        """Seçili yöntem için önbellekte sonuç varsa kataloğa uygula"""
+        if self.earthquake_data is None or not self.csv_file_path:
+            return False
+            
+        method = self.declusterMethodComboBox.currentText()
+        cached = load_sidecar(self.csv_file_path, 'decluster', self.decluster_cache_key(method))
+        if cached is None:
+            # Önceki yöntemin sütunları geçersiz - filtreden kaldır
+            self.earthquake_data = self.earthquake_data.drop(
+                columns=['mainshock', 'aftershock', 'cluster_id'], errors='ignore'
+            )
+            self.mainshockOnlyCheckBox.setChecked(False)
+            self.mainshockOnlyCheckBox.setEnabled(False)
+            return False
+            
+        self.apply_decluster_result(cached)
+        return True
+        
+    def start_declustering(self):
+        """Kümesizleştirmeyi arka plan görevi olarak başlat"""
+        if self.earthquake_data is None or self.earthquake_index is None:
+            return
+        if self.decluster_task is not None:
+            return
+            
+        if self.load_cached_declustering():
+            return
+            
+        method = self.declusterMethodComboBox.currentText()
+        x_km, y_km = self.earthquake_xy_km
+        
+        self.decluster_task_key = self.decluster_cache_key(method)
+        self.decluster_task = QgsTask.fromFunction(
+            "Deprem kümesizleştirme",
+            run_declustering_task,
+            self.earthquake_times,
+            x_km,
+            y_km,
+            self.earthquake_data['magnitude'].values,
+            self.earthquake_index,
+            method,
+            on_finished=self.on_declustering_finished
+        )
+        self.declusterButton.setEnabled(False)
+        QgsApplication.taskManager().addTask(self.decluster_task)
+        
+    def on_declustering_finished(self, exception, result=None):
+        """Kümesizleştirme görevi bittiğinde çağrılır"""
+        self.decluster_task = None
+        self.declusterButton.setEnabled(self.earthquake_data is not None)
+        
+        if exception is not None:
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Hata",
+                f"Kümesizleştirme sırasında hata oluştu: {str(exception)}",
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+            
+        # Görev iptal edildiyse veya katalog bu sırada değiştiyse sonucu kullanma
+        if result is None or self.earthquake_data is None:
+            return
+        method = self.declusterMethodComboBox.currentText()
+        if self.decluster_task_key != self.decluster_cache_key(method):
+            return
+            
+        if self.csv_file_path:
+            save_sidecar(self.csv_file_path, 'decluster', self.decluster_task_key, **result)
+        self.apply_decluster_result(result)
+        
+        QtWidgets.QMessageBox.information(
+            self,
+            "Başarılı",
+            f"Kümesizleştirme tamamlandı. {int(result['mainshock'].sum())} ana şok, "
+            f"{int(result['aftershock'].sum())} artçı/öncü deprem bulundu.",
+            QtWidgets.QMessageBox.Ok
+        )
+        
+    def apply_decluster_result(self, result):
+        """Kümesizleştirme sütunlarını kataloğa ekle"""
+        self.earthquake_data = self.earthquake_data.assign(
+            mainshock=result['mainshock'],
+            aftershock=result['aftershock'],
+            cluster_id=result['cluster_id']
+        )
+        self.mainshockOnlyCheckBox.setEnabled(True)
+        
+        # Filtre sadece ana şokları gösteriyorsa yeni sütunlarla yeniden uygula
+        if self.mainshockOnlyCheckBox.isChecked():
+            self.apply_earthquake_filter()
+            
+    def on_mainshock_filter_changed(self, *args):
+        """Ana şok filtresi değiştiğinde çağrılır"""
+        if self.earthquake_data is not None:
+            self.apply_earthquake_filter()
+        
+    def fault_distance_cache_key(self):
+        """Faya uzaklık önbelleği için anahtar (katalog ve fay verisi imzaları, projeksiyon merkezi)"""
+        fault_file = self.fault_line_file_path.split('|')[0]
+        return (f"{self.catalogue_signature()}|{len(self.earthquake_data)}|"
+                f"{self.fault_line_file_path}|{file_signature(fault_file)}|{self.projection_origin}")
+
+    def load_fault_segments(self):
+        """Fay hatlarını katalogla aynı yerel km koordinatlarında segment dizilerine dönüştür"""
+        layer = QgsVectorLayer(self.fault_line_file_path, "temp", "ogr")
+        if not layer.isValid():
+            raise Exception("Fay hatları kaynağı açılamadı")
+        
+        transform = QgsCoordinateTransform(
+            layer.crs(),
+            QgsCoordinateReferenceSystem('EPSG:4326'),
+            QgsProject.instance()
+        )
+        
+        polylines = []
+        for feature in layer.getFeatures():
+            geom = feature.geometry()
+            if not geom or geom.isEmpty():
+                continue
+            geom.transform(transform)
+            parts = geom.asMultiPolyline() if geom.isMultipart() else [geom.asPolyline()]
+            for part in parts:
+                if len(part) < 2:
+                    continue
+                lonlat = np.array([(p.x(), p.y()) for p in part])
+                x_km, y_km = local_km_coordinates(lonlat[:, 0], lonlat[:, 1], self.projection_origin)
+                polylines.append((feature.id(), np.column_stack((x_km, y_km))))
+        return polyline_segments(polylines)
+
+    def start_fault_distance(self):
+        """Faya uzaklıkları önbellekten yükle ya da arka plan görevinde bir kez hesapla"""
+        if self.earthquake_data is None or self.earthquake_xy_km is None:
+            return
+        if not self.fault_line_file_path or self.fault_distance_task is not None:
+            return
+        
+        try:
+            key = self.fault_distance_cache_key()
+            cached = load_sidecar(self.csv_file_path, 'fay_mesafesi', key) if self.csv_file_path else None
+            if cached is not None:
+                monitor.cache_hit('fay.mesafe')
+                self.apply_fault_distance_result(cached)
+                return
+            monitor.cache_miss('fay.mesafe')
+            
+            with monitor.stage('fay.segmentler'):
+                segments = self.load_fault_segments()
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Hata",
+                f"Faya uzaklık hesabı başlatılamadı: {str(e)}",
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+        
+        x_km, y_km = self.earthquake_xy_km
+        self.fault_distance_task_key = key
+        self.fault_distance_task = QgsTask.fromFunction(
+            "Faya uzaklık hesabı",
+            run_fault_distance_task,
+            x_km,
+            y_km,
+            segments,
+            on_finished=self.on_fault_distance_finished
+        )
+        QgsApplication.taskManager().addTask(self.fault_distance_task)
+
+    def on_fault_distance_finished(self, exception, result=None):
+        """Faya uzaklık görevi bittiğinde çağrılır"""
+        self.fault_distance_task = None
+        
+        if exception is not None:
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Hata",
+                f"Faya uzaklık hesabı sırasında hata oluştu: {str(exception)}",
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+        
+        # Görev iptal edildiyse veya katalog/fay verisi bu sırada değiştiyse sonucu kullanma
+        if result is None or self.earthquake_data is None:
+            return
+        if self.fault_distance_task_key != self.fault_distance_cache_key():
+            self.start_fault_distance()
+            return
+        
+        if self.csv_file_path:
+            save_sidecar(self.csv_file_path, 'fay_mesafesi', self.fault_distance_task_key, **result)
+        self.apply_fault_distance_result(result)
+
+    def apply_fault_distance_result(self, result):
+        """Faya uzaklık sütunlarını kataloğa ekle"""
+        self.earthquake_data = self.earthquake_data.assign(
+            fault_distance_km=result['fault_distance_km'],
+            nearest_fault_id=result['nearest_fault_id']
+        )
+        self.faultDistanceSpinBox.setEnabled(True)
+        self.faultDistanceLabel.setEnabled(True)
+        
+        # Filtre faya uzaklık kullanıyorsa yeni sütunlarla yeniden uygula
+        if self.faultDistanceSpinBox.value() > 0:
+            self.apply_earthquake_filter()
+
+    def on_fault_distance_changed(self, value):
+        """Faya uzaklık filtresi değiştiğinde çağrılır"""
+        if self.earthquake_data is not None:
+            self.apply_earthquake_filter()
         
     def update_year_list(self):
         """Deprem verilerinden yıl listesini güncelle"""
@@ -653,9 +1778,13 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
             
         return filter_exp
         
-    def get_filtered_earthquake_data(self):
-        """Seçilen il, ilçe, yıl ve büyüklük aralığına göre deprem verilerini filtrele"""
-        if self.earthquake_data is None or self.earthquake_points is None:
+    def get_filtered_earthquake_data(self, appended=None):
+        """Seçilen il, ilçe, yıl ve büyüklük aralığına göre deprem verilerini filtrele.
+
+        appended verilirse ve filtre parametreleri önbellektekiyle aynıysa sadece bu yeni
+        satırlar filtrelenir ve önceki sonuca eklenir.
+        """
+        if self.earthquake_data is None or self.earthquake_index is None:
             return None
         
         if self.vector_layer is None:
@@ -686,43 +1815,66 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         min_magnitude = self.minMagnitudeSpinBox.value()
         max_magnitude = self.maxMagnitudeSpinBox.value()
         
+        # Derinlik filtresi parametrelerini al
+        min_depth = self.minDepthSpinBox.value()
+        max_depth = self.maxDepthSpinBox.value()
+        
+        # Filtrede kullanılan magnitüd sütunu (ham veya dönüştürülmüş Mw)
+        magnitude_column = self.magnitude_column()
+        
+        # Kümesizleştirme filtresi
+        mainshock_only = self.mainshockOnlyCheckBox.isChecked() and 'mainshock' in self.earthquake_data.columns
+        
+        # Faya uzaklık filtresi (0 = kapalı)
+        max_fault_distance = self.faultDistanceSpinBox.value()
+        if 'fault_distance_km' not in self.earthquake_data.columns:
+            max_fault_distance = 0
+        
+        # Bölge kaynağı (il/ilçe, çizim, katman seçimi veya daire)
+        region_source = self.current_region_source(filter_exp)
+        region_key = region_source.cache_key() if region_source is not None else None
+        
+        # Alt bölge dökümü (sadece çoklu seçim gibi etiketli kaynaklarda)
+        breakdown = self.breakdownCheckBox.isChecked() and bool(region_source and region_source.label_names)
+        
         # Cache kontrolü - Aynı parametrelerle tekrar hesaplama yapılmasını önler
-        cache_params = (il, ilce, buffer_distance_km, filter_exp, start_year, end_year, 
-                       min_magnitude, max_magnitude, settlement_distance)
-        if (hasattr(self, 'cached_result') and 
-            hasattr(self, 'cached_params') and 
-            self.cached_params == cache_params):
+        cache_params = (region_key, il, ilce, buffer_distance_km, filter_exp, start_year, end_year, 
+                       min_magnitude, max_magnitude, min_depth, max_depth, settlement_distance,
+                       mainshock_only, max_fault_distance, breakdown, magnitude_column,
+                       self.mw_conversion_key())
+        cache_valid = (hasattr(self, 'cached_result') and 
+                       hasattr(self, 'cached_params') and 
+                       self.cached_params == cache_params)
+        if cache_valid and appended is None:
+            monitor.cache_hit('filtre.onbellek')
             return self.cached_result
+        monitor.cache_miss('filtre.onbellek')
+        
+        # Artımlı filtre: yeni satırlarda eşleşme yoksa önceki sonuç aynen geçerlidir
+        previous_result = self.cached_result if cache_valid else None
+        if not cache_valid:
+            appended = None
             
-        if not filter_exp:
+        if region_source is None:
             return None
             
         try:
-            # Önce yıl ve büyüklük filtresini uygula (daha az veri üzerinde işlem yapmak için)
-            filtered_data = self.earthquake_data
-            
-            # Yıl filtresi - numpy ile hızlı filtreleme
-            if start_year and end_year:
-                years = filtered_data['eventDate'].dt.year.values
-                year_mask = (years >= int(start_year)) & (years <= int(end_year))
-                filtered_data = filtered_data[year_mask]
-            
-            # Büyüklük filtresi - numpy ile hızlı filtreleme
-            magnitude_mask = (filtered_data['magnitude'].values >= min_magnitude) & (filtered_data['magnitude'].values <= max_magnitude)
-            filtered_data = filtered_data[magnitude_mask]
+            with monitor.stage('filtre.oznitelik'):
+                catalogue = self.earthquake_data if appended is None else appended
+                mask = self.attribute_mask(catalogue, start_year, end_year, min_magnitude, max_magnitude,
+                                           min_depth, max_depth, mainshock_only, max_fault_distance,
+                                           magnitude_column)
+                
+                # Sonraki aşamalar satır konumları üzerinde çalışır
+                positions = np.flatnonzero(mask)
+            monitor.count('aday.oznitelik', len(positions))
             
-            if filtered_data.empty:
-                return None
+            if len(positions) == 0:
+                return previous_result
             
-            # Geometri işlemleri için optimize edilmiş kod
-            request = QgsFeatureRequest().setFilterExpression(filter_exp)
-            features = list(self.vector_layer.getFeatures(request))
-            if not features:
-                return None
-                
-            # Geometrileri tek seferde birleştir
-            geometries = [f.geometry() for f in features]
-            selected_geometry = QgsGeometry.unaryUnion(geometries)
+            with monitor.stage('filtre.birlesim'):
+                # Bölge geometrisi kaynak başına bir kez birleştirilip WGS84'te saklanır
+                selected_geometry = self.region_geometry(region_source)
             
             if not selected_geometry or selected_geometry.isEmpty():
                 return None
@@ -730,66 +1882,69 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
             # Koordinat dönüşümleri için transform nesnelerini bir kez oluştur
             wgs84 = QgsCoordinateReferenceSystem('EPSG:4326')
             utm_crs = QgsCoordinateReferenceSystem('EPSG:32636')
-            transform_to_wgs84 = QgsCoordinateTransform(self.vector_layer.crs(), wgs84, QgsProject.instance())
             transform_to_utm = QgsCoordinateTransform(wgs84, utm_crs, QgsProject.instance())
             transform_back_to_wgs84 = QgsCoordinateTransform(utm_crs, wgs84, QgsProject.instance())
 
+            # Tampon ve yerleşim kesişimi yoksa bölge, etiketli halkaların birleşimine eşittir
+            region_is_labelled_union = True
+
             try:
-                # Geometriyi WGS84'e dönüştür
-                selected_geometry.transform(transform_to_wgs84)
-
-                # Buffer işlemi
-                if buffer_distance_km > 0:
-                    selected_geometry.transform(transform_to_utm)
-                    selected_geometry = selected_geometry.buffer(buffer_distance_km * 1000, 5)
-                    selected_geometry.transform(transform_back_to_wgs84)
-
-                # Yerleşim noktalarına göre filtreleme
-                if self.settlement_layer and self.settlement_layer.isValid() and settlement_distance > 0:
-                    settlement_features = list(self.settlement_layer.getFeatures())
-                    if settlement_features:
-                        # Yerleşim noktalarını birleştir ve buffer uygula
-                        settlement_geometries = []
-                        for f in settlement_features:
-                            geom = f.geometry()
-                            if geom and not geom.isEmpty() and geom.isGeosValid():
-                                # Geometriyi WGS84'e dönüştür
-                                geom_wgs84 = QgsGeometry(geom)
-                                if self.settlement_layer.crs() != wgs84:
-                                    transform_to_wgs84_settlement = QgsCoordinateTransform(
-                                        self.settlement_layer.crs(), 
-                                        wgs84, 
-                                        QgsProject.instance()
-                                    )
-                                    geom_wgs84.transform(transform_to_wgs84_settlement)
-                                settlement_geometries.append(geom_wgs84)
+                with monitor.stage('filtre.tampon'):
+                    # Buffer işlemi
+                    if buffer_distance_km > 0:
+                        region_is_labelled_union = False
+                        selected_geometry.transform(transform_to_utm)
+                        selected_geometry = selected_geometry.buffer(buffer_distance_km * 1000, 5)
+                        selected_geometry.transform(transform_back_to_wgs84)
+
+                with monitor.stage('filtre.yerlesim'):
+                    # Yerleşim noktalarına göre filtreleme
+                    if self.settlement_layer and self.settlement_layer.isValid() and settlement_distance > 0:
+                        settlement_features = list(self.settlement_layer.getFeatures())
+                        if settlement_features:
+                            # Yerleşim noktalarını birleştir ve buffer uygula
+                            settlement_geometries = []
+                            for f in settlement_features:
+                                geom = f.geometry()
+                                if geom and not geom.isEmpty() and geom.isGeosValid():
+                                    # Geometriyi WGS84'e dönüştür
+                                    geom_wgs84 = QgsGeometry(geom)
+                                    if self.settlement_layer.crs() != wgs84:
+                                        transform_to_wgs84_settlement = QgsCoordinateTransform(
+                                            self.settlement_layer.crs(), 
+                                            wgs84, 
+                                            QgsProject.instance()
+                                        )
+                                        geom_wgs84.transform(transform_to_wgs84_settlement)
+                                    settlement_geometries.append(geom_wgs84)
                         
-                        if not settlement_geometries:
-                            return None
+                            if not settlement_geometries:
+                                return None
                             
-                        settlement_geometry = QgsGeometry.unaryUnion(settlement_geometries)
-                        if not settlement_geometry or settlement_geometry.isEmpty():
-                            return None
+                            settlement_geometry = QgsGeometry.unaryUnion(settlement_geometries)
+                            if not settlement_geometry or settlement_geometry.isEmpty():
+                                return None
+                            region_is_labelled_union = False
                         
-                        try:
-                            # UTM'e dönüştür ve buffer uygula
-                            settlement_geometry.transform(transform_to_utm)
-                            settlement_geometry = settlement_geometry.buffer(settlement_distance * 1000, 5)
-                            settlement_geometry.transform(transform_back_to_wgs84)
+                            try:
+                                # UTM'e dönüştür ve buffer uygula
+                                settlement_geometry.transform(transform_to_utm)
+                                settlement_geometry = settlement_geometry.buffer(settlement_distance * 1000, 5)
+                                settlement_geometry.transform(transform_back_to_wgs84)
                             
-                            # Seçili alan ile kesişimi al
-                            selected_geometry = selected_geometry.intersection(settlement_geometry)
+                                # Seçili alan ile kesişimi al
+                                selected_geometry = selected_geometry.intersection(settlement_geometry)
                             
-                            if not selected_geometry or selected_geometry.isEmpty():
+                                if not selected_geometry or selected_geometry.isEmpty():
+                                    return None
+                            except Exception as e:
+                                QtWidgets.QMessageBox.warning(
+                                    self,
+                                    "Uyarı",
+                                    "Yerleşim noktaları filtrelemesi sırasında hata oluştu. Lütfen farklı bir mesafe değeri deneyin.",
+                                    QtWidgets.QMessageBox.Ok
+                                )
                                 return None
-                        except Exception as e:
-                            QtWidgets.QMessageBox.warning(
-                                self,
-                                "Uyarı",
-                                "Yerleşim noktaları filtrelemesi sırasında hata oluştu. Lütfen farklı bir mesafe değeri deneyin.",
-                                QtWidgets.QMessageBox.Ok
-                            )
-                            return None
 
             except Exception as e:
                 QtWidgets.QMessageBox.warning(
@@ -800,53 +1955,97 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
                 )
                 return None
 
-            # Numpy ile vektörize edilmiş işlemler
-            bbox = selected_geometry.boundingBox()
-            points = np.column_stack((
-                filtered_data['longitude'].values,
-                filtered_data['latitude'].values
-            ))
-            
-            # Geçersiz koordinatları filtrele
-            valid_coords_mask = np.all(np.isfinite(points), axis=1)
-            points = points[valid_coords_mask]
-            if len(points) == 0:
-                return None
+            # Yoğunluk haritasının kırpılması için bölge geometrisini sakla
+            self.cached_region_geometry = QgsGeometry(selected_geometry)
+
+            with monitor.stage('filtre.bbox'):
+                # Numpy ile vektörize edilmiş işlemler
+                bbox = selected_geometry.boundingBox()
+                points = np.column_stack((
+                    catalogue['longitude'].values[positions],
+                    catalogue['latitude'].values[positions]
+                )).astype(np.float64)
+            
+                # Geçersiz koordinatları filtrele
+                valid_coords_mask = np.all(np.isfinite(points), axis=1)
+                points = points[valid_coords_mask]
+                if len(points) == 0:
+                    return previous_result
                 
-            filtered_data = filtered_data[valid_coords_mask]
-            
-            # Tek bir numpy maskesi ile hızlı filtreleme
-            bbox_mask = np.all([
-                points[:, 0] >= bbox.xMinimum(),
-                points[:, 0] <= bbox.xMaximum(),
-                points[:, 1] >= bbox.yMinimum(),
-                points[:, 1] <= bbox.yMaximum()
-            ], axis=0)
-            
-            if not np.any(bbox_mask):
-                return None
+                positions = positions[valid_coords_mask]
+            
+                # Tek bir numpy maskesi ile hızlı filtreleme
+                bbox_mask = np.all([
+                    points[:, 0] >= bbox.xMinimum(),
+                    points[:, 0] <= bbox.xMaximum(),
+                    points[:, 1] >= bbox.yMinimum(),
+                    points[:, 1] <= bbox.yMaximum()
+                ], axis=0)
+            
+                if not np.any(bbox_mask):
+                    return previous_result
                 
-            # Sadece bbox içindeki noktaları al
-            potential_points = points[bbox_mask]
-            potential_indices = filtered_data.index[bbox_mask]
+                # Sadece bbox içindeki noktaları al
+                potential_points = points[bbox_mask]
+                potential_positions = positions[bbox_mask]
             
-            if len(potential_points) == 0:
-                return None
+                if len(potential_points) == 0:
+                    return previous_result
+            monitor.count('aday.bbox', len(potential_points))
                 
-            # Geometri kontrolünü optimize et - toplu işlem
-            point_geometries = [QgsGeometry.fromPointXY(QgsPointXY(x, y)) for x, y in potential_points]
-            geometry_mask = np.array([selected_geometry.contains(point) for point in point_geometries])
+            labels = None
+            with monitor.stage('filtre.icerme'):
+                if breakdown and region_is_labelled_union:
+                    # Tek geçişte hem içerme hem ilçe etiketi: etiketi olan nokta bölgenin içindedir
+                    labels = point_labels(potential_points[:, 0], potential_points[:, 1], *region_source.label_rings())
+                    geometry_mask = labels >= 0
+                    labels = labels[geometry_mask]
+                elif selected_geometry.type() == QgsWkbTypes.PolygonGeometry:
+                    # Vektörize çift-tek kuralı - halkalar bir kez çıkarılır
+                    geometry_mask = points_in_rings(
+                        potential_points[:, 0], potential_points[:, 1], geometry_rings(selected_geometry)
+                    )
+                else:
+                    # Poligon dışı (karma) geometrilerde GEOS ile nokta nokta kontrol
+                    point_geometries = [QgsGeometry.fromPointXY(QgsPointXY(x, y)) for x, y in potential_points]
+                    geometry_mask = np.array([selected_geometry.contains(point) for point in point_geometries])
             
             # Numpy ile hızlı filtreleme
-            final_indices = potential_indices[geometry_mask]
-            if len(final_indices) == 0:
+            final_positions = potential_positions[geometry_mask]
+            monitor.count('sonuc', len(final_positions))
+            if len(final_positions) == 0 and appended is not None:
+                return previous_result
+            
+            if breakdown and labels is None:
+                # Tampon veya yerleşim kesişimi varsa etiketler sadece sonuç noktaları için hesaplanır
+                with monitor.stage('filtre.dokum'):
+                    final_points = potential_points[geometry_mask]
+                    labels = point_labels(final_points[:, 0], final_points[:, 1], *region_source.label_rings())
+            breakdown_labels = labels
+            if labels is not None and previous_result is not None:
+                # Artımlı filtrede önceki sonucun etiketleri bolge sütunundan geri elde edilir
+                previous_labels = pd.Categorical(previous_result['bolge'], categories=region_source.label_names).codes
+                breakdown_labels = np.concatenate((previous_labels.astype(np.int64), labels))
+            self.update_region_breakdown(region_source, breakdown_labels)
+            
+            if len(final_positions) == 0:
                 return None
                 
-            # Pandas ile verimli veri filtreleme
-            final_data = filtered_data.loc[final_indices].copy()
+            # Sonuç satırları tek seferde konumlardan alınır (indeks etiketleri korunur)
+            final_data = catalogue.take(final_positions)
+            if labels is not None:
+                # Tampon bölgesinde kalan (hiçbir ilçeye düşmeyen) olaylar ayrı etiketlenir
+                names = list(region_source.label_names) + ["Tampon bölge"]
+                final_data['bolge'] = pd.Categorical.from_codes(np.where(labels >= 0, labels, len(names) - 1), categories=names)
+            # Sonuç satırlarının tüm katalogdaki konumları (dışa aktarma parçaları bunlardan oluşturulur)
+            result_positions = final_positions + (len(self.earthquake_data) - len(catalogue))
+            if previous_result is not None:
+                final_data = pd.concat([previous_result, final_data])
+                result_positions = np.concatenate((self.cached_positions, result_positions))
             
             # Sonucu cache'le
             self.cached_result = final_data if not final_data.empty else None
+            self.cached_positions = result_positions
             self.cached_params = cache_params
             
             return self.cached_result
@@ -860,6 +2059,81 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
             )
             return None
 
+    def attribute_mask(self, catalogue, start_year, end_year, min_magnitude, max_magnitude,
+                       min_depth, max_depth, mainshock_only, max_fault_distance, magnitude_column='magnitude'):
+        """Öznitelik filtrelerini tek bir maskede birleştir; ara DataFrame kopyası oluşturulmaz"""
+        mask = np.ones(len(catalogue), dtype=bool)
+        
+        # Yıl filtresi - yıl sınırlarıyla doğrudan datetime64 karşılaştırması
+        if start_year and end_year:
+            dates = catalogue['eventDate'].values
+            mask &= dates >= np.datetime64(f"{int(start_year):04d}-01-01")
+            mask &= dates < np.datetime64(f"{int(end_year) + 1:04d}-01-01")
+        
+        # Büyüklük filtresi (ham veya yüklemede dönüştürülmüş Mw sütunu)
+        magnitudes = catalogue[magnitude_column].values
+        mask &= (magnitudes >= min_magnitude) & (magnitudes <= max_magnitude)
+        
+        # Derinlik filtresi
+        # Tam aralıkta filtre uygulanmaz (derinliği eksik veya negatif olan olaylar korunur)
+        if min_depth > self.minDepthSpinBox.minimum() or max_depth < self.maxDepthSpinBox.maximum():
+            depths = catalogue['depth'].values
+            mask &= (depths >= min_depth) & (depths <= max_depth)
+        
+        # Kümesizleştirilmiş katalog - sadece ana şoklar
+        if mainshock_only:
+            mask &= catalogue['mainshock'].values.astype(bool)
+        
+        # Faya uzaklık filtresi - önceden hesaplanmış sütun üzerinde
+        if max_fault_distance > 0:
+            mask &= catalogue['fault_distance_km'].values <= max_fault_distance
+        return mask
+
+    def current_attribute_mask(self, catalogue):
+        """Arayüzdeki yıl, büyüklük, derinlik, ana şok ve faya uzaklık filtrelerinin maskesi"""
+        max_fault_distance = self.faultDistanceSpinBox.value() if 'fault_distance_km' in catalogue.columns else 0
+        return self.attribute_mask(
+            catalogue, self.yearComboBox.currentText(), self.endYearComboBox.currentText(),
+            self.minMagnitudeSpinBox.value(), self.maxMagnitudeSpinBox.value(),
+            self.minDepthSpinBox.value(), self.maxDepthSpinBox.value(),
+            self.mainshockOnlyCheckBox.isChecked() and 'mainshock' in catalogue.columns,
+            max_fault_distance, self.magnitude_column()
+        )
+
+    def current_region_source(self, filter_exp=None):
+        """Etkin bölge kaynağını döndür; özel kaynak yoksa il/ilçe seçimi kullanılır"""
+        if self.region_source is not None:
+            return self.region_source
+        if filter_exp and self.vector_layer is not None:
+            return AdminRegionSource(self.vector_layer, filter_exp)
+        return None
+
+    def region_geometry(self, region_source):
+        """Kaynağın tamponsuz WGS84 geometrisinin kopyasını döndür (kaynak değişmedikçe yeniden birleştirilmez)"""
+        key = region_source.cache_key()
+        if self.cached_region_key != key or self.cached_region_base is None:
+            monitor.cache_miss('bolge.geometri')
+            geometry = region_source.geometry()
+            if geometry is None:
+                return None
+            self.cached_region_base = geometry
+            self.cached_region_key = key
+        else:
+            monitor.cache_hit('bolge.geometri')
+        return QgsGeometry(self.cached_region_base)
+
+    def set_region_source(self, region_source):
+        """İl/ilçe seçimi yerine özel bir bölge kaynağı kullan ve filtreyi yeniden uygula"""
+        self.region_source = region_source
+        self.regionSourceValueLabel.setText(region_source.description if region_source else "İl / İlçe seçimi")
+        self.regionSourceResetButton.setEnabled(region_source is not None)
+        if self.earthquake_data is not None:
+            self.apply_earthquake_filter()
+
+    def reset_region_source(self):
+        """İl/ilçe seçimine geri dön"""
+        self.set_region_source(None)
+
     def select_xlsx_file(self):
         """Nüfus verilerini içeren Excel dosyasını seç"""
         file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
@@ -875,43 +2149,18 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
             self.load_population_data(file_path)
 
     def load_population_data(self, file_path):
-        """Excel dosyasından nüfus verilerini yükle"""
+        """Excel dosyasından nüfus verilerini yükle (ayrıştırılmış tablo dosyanın yanında önbelleklenir)"""
         try:
-            # Excel dosyasını 9. satırdan başlayarak oku ve sütun isimlerini belirle
-            column_names = [
-                'İL KAYIT NO', 'İLÇE KAYIT NO', 'İL ADI', 'İLÇE ADI',
-                'GENEL TOPLAM_TOPLAM', 'GENEL TOPLAM_ERKEK', 'GENEL TOPLAM_KADIN',
-                'İL ve İLÇE MERKEZLERİ_TOPLAM', 'İL ve İLÇE MERKEZLERİ_ERKEK', 'İL ve İLÇE MERKEZLERİ_KADIN',
-                'BELDE ve KÖYLER_TOPLAM', 'BELDE ve KÖYLER_ERKEK', 'BELDE ve KÖYLER_KADIN'
-            ]
-            
-            df = pd.read_excel(
-                file_path,
-                sheet_name='İLÇE NÜFUSU',
-                skiprows=8,
-                names=column_names
-            )
-            
-            # Sütun isimlerini kontrol et
-            required_columns = [
-                'İL KAYIT NO', 'İLÇE KAYIT NO', 'İL ADI', 'İLÇE ADI',
-                'GENEL TOPLAM_TOPLAM', 'GENEL TOPLAM_ERKEK', 'GENEL TOPLAM_KADIN'
-            ]
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            
-            if missing_columns:
-                QtWidgets.QMessageBox.critical(
-                    self,
-                    "Hata",
-                    f"Excel dosyasında gerekli sütunlar eksik: {', '.join(missing_columns)}",
-                    QtWidgets.QMessageBox.Ok
-                )
-                return
-            
-            # NaN değerleri temizle
-            df = df.dropna(subset=['İL ADI', 'İLÇE ADI'])
+            with monitor.stage('nufus.yukleme'):
+                df, from_cache = load_population_table(file_path)
+            if from_cache:
+                monitor.cache_hit('nufus.tablo')
+            else:
+                monitor.cache_miss('nufus.tablo')
             
             self.population_data = df
+            # Birleştirme anahtarları tablo başına bir kez üretilir
+            self.population_keys = district_keys(df['İL ADI'], df['İLÇE ADI'])
             
             QtWidgets.QMessageBox.information(
                 self,
@@ -922,6 +2171,7 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
             
         except Exception as e:
             self.population_data = None
+            self.population_keys = None
             QtWidgets.QMessageBox.critical(
                 self,
                 "Hata",
@@ -929,6 +2179,324 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
                 QtWidgets.QMessageBox.Ok
             )
 
+    def district_name_lookup(self):
+        """Normalize il|ilçe anahtarından (il, ilçe, [fid, ...]) sözlüğü; katman ve sütunlar değişmedikçe saklanır"""
+        il_column = self.ilColumnComboBox.currentText()
+        ilce_column = self.ilceColumnComboBox.currentText()
+        key = (self.vector_layer.id(), il_column, ilce_column)
+        if self.cached_district_lookup_key == key:
+            monitor.cache_hit('nufus.ilce_sozlugu')
+            return self.cached_district_lookup
+        monitor.cache_miss('nufus.ilce_sozlugu')
+        
+        request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes([il_column, ilce_column], self.vector_layer.fields())
+        self.cached_district_lookup = district_lookup(
+            (f.id(), f[il_column], f[ilce_column]) for f in features_ignoring_subset(self.vector_layer, request)
+        )
+        self.cached_district_lookup_key = key
+        return self.cached_district_lookup
+
+    def district_groups(self, lookup):
+        """Aynı il/ilçe anahtarını taşıyan parçaları tek ilçe olarak grupla.
+
+        Dönüş: sıralı anahtarlar, (il, ilçe) adları ve ilçe no sırasında bölge kaynağı
+        """
+        district_keys = sorted(lookup)
+        names = [lookup[key][:2] for key in district_keys]
+        districts = DistrictSelectionRegionSource(
+            self.vector_layer, [(f"{il} / {ilce}", lookup[key][2]) for key, (il, ilce) in zip(district_keys, names)]
+        )
+        return district_keys, names, districts
+
+    def district_event_labels(self, region_source):
+        """Tüm katalog için her depremin içinde bulunduğu ilçe no (-1: hiçbiri); katalog ve ilçeler değişmedikçe saklanır"""
+        key = (len(self.earthquake_data), region_source.cache_key())
+        if self.cached_district_labels_key == key:
+            monitor.cache_hit('etkilenim.etiket')
+            return self.cached_district_labels
+        monitor.cache_miss('etkilenim.etiket')
+        rings, ring_labels = region_source.label_rings()
+        with monitor.stage('etkilenim.etiket'):
+            labels = point_labels(
+                self.earthquake_data['longitude'].values, self.earthquake_data['latitude'].values, rings, ring_labels
+            )
+        self.cached_district_labels_key = key
+        self.cached_district_labels = labels
+        return labels
+
+    def compute_population_exposure(self):
+        """Filtrelenmiş depremlerden tüm ilçeler için nüfus etkilenimi katmanı oluştur"""
+        if not self.ensure_valid_layer():
+            return
+        if self.population_data is None:
+            QtWidgets.QMessageBox.warning(self, "Uyarı", "Lütfen önce nüfus Excel dosyasını seçiniz.")
+            return
+        if self.earthquake_data is None or self.earthquake_xy_km is None:
+            QtWidgets.QMessageBox.warning(self, "Uyarı", "Lütfen önce deprem verilerini yükleyiniz.")
+            return
+        
+        min_magnitude = self.exposureMagnitudeSpinBox.value()
+        strong_magnitude = self.strongMagnitudeSpinBox.value()
+        radius_km = self.exposureRadiusSpinBox.value()
+        
+        try:
+            with monitor.stage('etkilenim.ilce'):
+                lookup = self.district_name_lookup()
+                if not lookup:
+                    return
+                district_keys, names, districts = self.district_groups(lookup)
+            
+            with monitor.stage('etkilenim.birlestirme'):
+                # Normalize ad anahtarları üzerinden hash birleştirme
+                population, matched = join_population(
+                    district_keys, self.population_keys, self.population_data[POPULATION_COLUMN].values
+                )
+                report = unmatched_names(
+                    lookup, self.population_keys,
+                    self.population_data['İL ADI'].values, self.population_data['İLÇE ADI'].values
+                )
+                report_path = write_unmatched_report(self.xlsx_file_path, report) if len(report) else None
+            
+            # Arayüzdeki öznitelik filtreleri (yıl, büyüklük, derinlik...) uygulanır; bölge seçimi uygulanmaz
+            mask = self.current_attribute_mask(self.earthquake_data)
+            labels = self.district_event_labels(districts)[mask]
+            magnitudes = self.earthquake_data[self.magnitude_column()].values[mask]
+            
+            with monitor.stage('etkilenim.yakinlik'):
+                # İlçe sınırları yerel km segmentlerine çevrilir
+                rings, ring_labels = districts.label_rings()
+                polylines = []
+                for ring, label in zip(rings, ring_labels):
+                    x, y = local_km_coordinates(ring[:, 0], ring[:, 1], self.projection_origin)
+                    polylines.append((label, np.column_stack((x, y))))
+                segments = polyline_segments(polylines)
+                
+                strong = magnitudes >= strong_magnitude
+                x_km = self.earthquake_xy_km[0][mask][strong]
+                y_km = self.earthquake_xy_km[1][mask][strong]
+                strong_near = districts_near_points(x_km, y_km, segments, radius_km, len(names))
+            
+            metrics = exposure_metrics(labels, magnitudes, population, min_magnitude, strong_magnitude, strong_near)
+            
+            with monitor.stage('etkilenim.katman'):
+                layer = QgsVectorLayer(
+                    "MultiPolygon?crs=epsg:4326&field=il:string&field=ilce:string&field=nufus:double"
+                    "&field=deprem_sayisi:integer&field=deprem_100k:double&field=guclu_deprem:integer"
+                    "&field=etkilenen_nufus:double",
+                    "Nüfus Etkilenimi", "memory"
+                )
+                parts = districts.parts()
+                features = []
+                for i, (il, ilce) in enumerate(names):
+                    geometries = [parts[fid] for fid in districts.fid_groups[i] if fid in parts]
+                    if not geometries:
+                        continue
+                    feature = QgsFeature()
+                    feature.setGeometry(QgsGeometry.unaryUnion(geometries))
+                    feature.setAttributes([
+                        str(il), str(ilce),
+                        None if np.isnan(population[i]) else float(population[i]),
+                        int(metrics['deprem_sayisi'][i]),
+                        None if np.isnan(metrics['deprem_100k'][i]) else float(metrics['deprem_100k'][i]),
+                        int(metrics['guclu_deprem'][i]),
+                        float(metrics['etkilenen_nufus'][i])
+                    ])
+                    features.append(feature)
+                layer.dataProvider().addFeatures(features)
+                layer.updateExtents()
+                self.style_exposure_layer(layer, metrics['deprem_100k'])
+                QgsProject.instance().addMapLayer(layer)
+            
+            unmatched = [f"{il} / {ilce}" for (il, ilce), ok in zip(names, matched) if not ok]
+            unmatched_rows = int((report['kaynak'] == 'nufus_tablosu').sum())
+            message = (
+                f"{len(names)} ilçe için etkilenim hesaplandı.\n"
+                f"M≥{strong_magnitude:.1f} depremlerin {radius_km:.0f} km yakınındaki nüfus: "
+                f"{int(metrics['etkilenen_nufus'].sum()):,}".replace(",", ".")
+            )
+            if unmatched:
+                message += f"\n\nNüfus tablosunda eşleşmeyen {len(unmatched)} ilçe: " + ", ".join(unmatched[:10])
+                if len(unmatched) > 10:
+                    message += ", ..."
+            if unmatched_rows:
+                message += f"\nNüfus tablosunda sınır katmanıyla eşleşmeyen {unmatched_rows} satır var."
+            if report_path:
+                message += f"\nEşleşmeyen adlar raporu: {report_path}"
+            QtWidgets.QMessageBox.information(self, "Nüfus Etkilenimi", message)
+        
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Hata",
+                f"Nüfus etkilenimi hesaplanırken hata oluştu: {str(e)}",
+                QtWidgets.QMessageBox.Ok
+            )
+
+    def compute_energy_accumulation(self):
+        """Filtrelenmiş depremlerin enerji ve moment toplamlarını ilçe x yıl tablosu ve yıllık grafik serisi olarak ekle"""
+        if not self.ensure_valid_layer():
+            return
+        if self.earthquake_data is None:
+            QtWidgets.QMessageBox.warning(self, "Uyarı", "Lütfen önce deprem verilerini yükleyiniz.")
+            return
+        
+        try:
+            lookup = self.district_name_lookup()
+            if not lookup:
+                return
+            _, names, districts = self.district_groups(lookup)
+            
+            # Arayüzdeki öznitelik filtreleri uygulanır; ilçe etiketleri tüm katalog için önbellekten gelir
+            mask = self.current_attribute_mask(self.earthquake_data)
+            labels = self.district_event_labels(districts)[mask]
+            
+            with monitor.stage('enerji.toplam'):
+                # Dönüştürülmüş Mw sütunu yüklemede hesaplanmıştır
+                column = HARMONIZED_COLUMN if self.energyMwCheckBox.isChecked() else 'magnitude'
+                magnitudes = self.earthquake_data[column].values[mask]
+                years = event_years(self.earthquake_data['eventDate'].values[mask])
+                first_year, sums = district_year_sums(labels, years, magnitudes, len(names))
+                table = district_year_table(first_year, sums)
+                series = yearly_series(first_year, sums)
+            
+            if len(table) == 0:
+                QtWidgets.QMessageBox.information(self, "Enerji ve Moment", "Filtrelere uyan ve bir ilçe içinde kalan deprem yok.")
+                return
+            
+            with monitor.stage('enerji.katman'):
+                # İlçe x yıl öznitelik tablosu
+                district_layer = QgsVectorLayer(
+                    "None?field=il:string&field=ilce:string&field=yil:integer&field=deprem_sayisi:integer"
+                    "&field=enerji_j:double&field=moment_nm:double&field=kumulatif_moment:double&field=benioff:double",
+                    "Enerji ve Moment (İlçe/Yıl)", "memory"
+                )
+                features = []
+                for row in table.itertuples(index=False):
+                    il, ilce = names[row.ilce_no]
+                    feature = QgsFeature(district_layer.fields())
+                    feature.setAttributes([
+                        str(il), str(ilce), int(row.yil), int(row.deprem_sayisi), float(row.enerji_j),
+                        float(row.moment_nm), float(row.kumulatif_moment), float(row.benioff)
+                    ])
+                    features.append(feature)
+                district_layer.dataProvider().addFeatures(features)
+                
+                # Yıllık toplam seri (grafik veri kümesi; boş yıllar dahil)
+                series_layer = QgsVectorLayer(
+                    "None?field=yil:integer&field=deprem_sayisi:integer&field=enerji_j:double"
+                    "&field=moment_nm:double&field=kumulatif_moment:double&field=benioff:double",
+                    "Enerji ve Moment (Yıllık)", "memory"
+                )
+                features = []
+                for row in series.itertuples(index=False):
+                    feature = QgsFeature(series_layer.fields())
+                    feature.setAttributes([
+                        int(row.yil), int(row.deprem_sayisi), float(row.enerji_j),
+                        float(row.moment_nm), float(row.kumulatif_moment), float(row.benioff)
+                    ])
+                    features.append(feature)
+                series_layer.dataProvider().addFeatures(features)
+                QgsProject.instance().addMapLayers([district_layer, series_layer])
+            
+            total_moment = float(series['moment_nm'].sum())
+            equivalent_mw = (np.log10(total_moment) - 9.1) / 1.5 if total_moment > 0 else float('nan')
+            QtWidgets.QMessageBox.information(
+                self, "Enerji ve Moment",
+                f"{int(series['deprem_sayisi'].sum())} deprem, {table['ilce_no'].nunique()} ilçe, "
+                f"{len(series)} yıl için toplamlar hesaplandı.\n"
+                f"Toplam moment: {total_moment:.3e} N·m (eşdeğer Mw {equivalent_mw:.2f})"
+            )
+        
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Hata",
+                f"Enerji ve moment hesaplanırken hata oluştu: {str(e)}",
+                QtWidgets.QMessageBox.Ok
+            )
+
+    def export_filtered_events(self):
+        """Filtrelenmiş depremleri seçilen biçimde arka plan görevinde dışa aktar"""
+        if self.export_task is not None:
+            return
+        earthquake_data = self.get_filtered_earthquake_data()
+        if earthquake_data is None or earthquake_data.empty:
+            QtWidgets.QMessageBox.warning(self, "Uyarı", "Dışa aktarılacak deprem yok. Lütfen filtreleri kontrol edin.")
+            return
+        # Parçalar sıkıştırılmış katalogdan sonuç konumlarıyla oluşturulur; sadece döküm sütunu sonuçtan alınır
+        positions = self.cached_positions
+        extra = {'bolge': earthquake_data['bolge'].values} if 'bolge' in earthquake_data.columns else None
+        
+        name = self.exportFormatComboBox.currentText()
+        fmt, _ = EXPORT_FORMATS[name]
+        file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self,
+            "Filtrelenmiş Depremleri Dışa Aktar",
+            os.path.dirname(self.csv_file_path) if self.csv_file_path else "",
+            name
+        )
+        if not file_path:
+            return
+        
+        monitor.count('disa_aktarma.olay', len(positions))
+        self.export_task = QgsTask.fromFunction(
+            "Deprem dışa aktarma",
+            run_export_task,
+            export_path(file_path, fmt),
+            fmt,
+            self.earthquake_data,
+            positions,
+            extra,
+            on_finished=self.on_export_finished
+        )
+        self.exportButton.setEnabled(False)
+        QgsApplication.taskManager().addTask(self.export_task)
+
+    def on_export_finished(self, exception, result=None):
+        """Dışa aktarma görevi bittiğinde çağrılır"""
+        self.export_task = None
+        self.exportButton.setEnabled(True)
+        
+        if exception is not None:
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Hata",
+                f"Depremler dışa aktarılırken hata oluştu: {str(exception)}",
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+        
+        # Görev iptal edildiyse yarım dosya bırakılmaz
+        if result is None:
+            return
+        if self.iface:
+            self.iface.messageBar().pushMessage(
+                "Dışa Aktarma",
+                f"Filtrelenmiş depremler yazıldı: {result}",
+                level=Qgis.Info,
+                duration=5
+            )
+
+    def style_exposure_layer(self, layer, rates):
+        """100 bin kişi başına deprem sayısına göre eş sayılı (quantile) sınıflarla renklendir"""
+        valid = rates[~np.isnan(rates)]
+        if len(valid) == 0:
+            return
+        colors = [QColor(255, 255, 204), QColor(254, 217, 118), QColor(253, 141, 60), QColor(227, 26, 28), QColor(128, 0, 38)]
+        breaks = np.unique(np.quantile(valid, np.linspace(0.0, 1.0, len(colors) + 1)))
+        ranges = []
+        for k in range(len(breaks) - 1):
+            symbol = QgsFillSymbol.createSimple({'outline_color': '64,64,64,200', 'outline_width': '0.2'})
+            symbol.setColor(colors[min(k, len(colors) - 1)])
+            ranges.append(QgsRendererRange(float(breaks[k]), float(breaks[k + 1]), symbol,
+                                           f"{breaks[k]:.1f} - {breaks[k + 1]:.1f}"))
+        if not ranges:
+            return
+        renderer = QgsGraduatedSymbolRenderer('deprem_100k', ranges)
+        renderer.setMode(QgsGraduatedSymbolRenderer.Custom)
+        layer.setRenderer(renderer)
+
     def validate_and_accept(self):
         """İl seçimini kontrol et ve onayla"""
         if not self.file_path:
@@ -998,8 +2566,8 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         ilce = self.ilceComboBox.currentText()
         
         # İl ve ilçe adlarını İngilizce formata çevir ve buffer ismini oluştur
-        il_eng = self.normalize_text(il).lower() if il else ""
-        ilce_eng = self.normalize_text(ilce).lower() if ilce else ""
+        il_eng = name_key(il) if il else ""
+        ilce_eng = name_key(ilce) if ilce else ""
         buffer_name = f"{il_eng}_{ilce_eng}_buffer" if ilce else f"{il_eng}_buffer"
 
         # Memory layer'ı yeni isimle oluştur
@@ -1075,6 +2643,7 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
 
     def apply_earthquake_filter(self):
         """Deprem verilerini filtrele ve göster"""
+        monitor.begin_run()
         try:
             # Cache'i temizle
             if hasattr(self, 'cached_result'):
@@ -1082,17 +2651,14 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
             if hasattr(self, 'cached_params'):
                 delattr(self, 'cached_params')
             
-            # Önce mevcut deprem katmanlarını temizle
-            for layer in QgsProject.instance().mapLayersByName("Depremler"):
-                QgsProject.instance().removeMapLayer(layer.id())
-            
+            # Mevcut deprem katmanı korunur; eklenti sadece değişen olayları günceller
             # Yeni filtrelenmiş verileri al
             filtered_data = self.get_filtered_earthquake_data()
             
             # UI'nin yanıt vermesini sağla
             QtWidgets.QApplication.processEvents()
             
-            # Filtrelenmiş verileri sinyal ile gönder
+            # Filtrelenmiş verileri sinyal ile gönder (katman oluşturma ölçüme dahil)
             self.earthquakeDataFiltered.emit(filtered_data)
             
             return filtered_data
@@ -1104,6 +2670,8 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
                 QtWidgets.QMessageBox.Ok
             )
             return None
+        finally:
+            self.publish_performance(monitor.end_run())
 
     def on_ilce_changed(self, selected_ilce):
         """İlçe değiştiğinde çağrılır"""
@@ -1135,6 +2703,33 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         if self.earthquake_data is not None:
             self.apply_earthquake_filter()
 
+    def on_display_mode_changed(self, *args):
+        """Nokta / yoğunluk / ölçeğe bağlı görünüm değiştiğinde çağrılır"""
+        self.densityBandwidthSpinBox.setEnabled(self.densityCheckBox.isChecked())
+        self.densityBandwidthLabel.setEnabled(self.densityCheckBox.isChecked())
+        pga_enabled = self.pgaCheckBox.isChecked()
+        for widget in (self.pgaModelComboBox, self.pgaCutoffSpinBox, self.pgaCellSpinBox,
+                       self.pgaPercentileSpinBox, self.pgaWorkersSpinBox):
+            widget.setEnabled(pga_enabled)
+        
+        # Filtre parametreleri değişmediği için cache'den hızlıca yeniden çizilir
+        if self.earthquake_data is not None:
+            self.earthquakeDataFiltered.emit(self.get_filtered_earthquake_data())
+
+    def on_pga_params_changed(self, *args):
+        """PGA parametreleri değiştiğinde yüzey açıksa yeniden çiz"""
+        if self.pgaCheckBox.isChecked() and self.earthquake_data is not None:
+            self.earthquakeDataFiltered.emit(self.get_filtered_earthquake_data())
+
+    def pga_parameters(self):
+        """Yer hareketi yüzeyi parametreleri (model, kesme km, hücre km, yüzdelik)"""
+        return (
+            self.pgaModelComboBox.currentText(),
+            self.pgaCutoffSpinBox.value(),
+            self.pgaCellSpinBox.value(),
+            self.pgaPercentileSpinBox.value(),
+        )
+
     def create_earthquake_layer(self, earthquake_data):
         """Bu fonksiyon artık kullanılmıyor - Plugin sınıfına taşındı"""
         pass
@@ -1145,6 +2740,7 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
 
     def disable_filter_fields(self):
         """Filtre alanlarını devre dışı bırak"""
+        self.exportGroup.setEnabled(False)
         self.bufferSpinBox.setEnabled(False)
         self.bufferLabel.setEnabled(False)
         self.yearComboBox.setEnabled(False)
@@ -1154,6 +2750,19 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         self.maxMagnitudeSpinBox.setEnabled(False)
         self.magnitudeRangeLabel.setEnabled(False)
         self.magnitudeSeparatorLabel.setEnabled(False)
+        self.magnitudeScaleComboBox.setEnabled(False)
+        self.minDepthSpinBox.setEnabled(False)
+        self.maxDepthSpinBox.setEnabled(False)
+        self.depthRangeLabel.setEnabled(False)
+        self.depthSeparatorLabel.setEnabled(False)
+        self.declusterMethodComboBox.setEnabled(False)
+        self.declusterButton.setEnabled(False)
+        self.declusterLabel.setEnabled(False)
+        self.mainshockOnlyCheckBox.setEnabled(False)
+        self.faultDistanceSpinBox.setEnabled(False)
+        self.faultDistanceLabel.setEnabled(False)
+        self.watchCheckBox.setChecked(False)
+        self.watchCheckBox.setEnabled(False)
 
     def on_magnitude_changed(self, value):
         """Büyüklük aralığı değiştiğinde çağrılır"""
@@ -1168,7 +2777,24 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
                 self.minMagnitudeSpinBox.setValue(max_mag)
         
         # Deprem verilerini filtrele
-        self.apply_earthquake_filter()
+        if self.earthquake_data is not None:
+            self.apply_earthquake_filter()
+
+    def on_depth_changed(self, value):
+        """Derinlik aralığı değiştiğinde çağrılır"""
+        min_depth = self.minDepthSpinBox.value()
+        max_depth = self.maxDepthSpinBox.value()
+        
+        # Minimum derinlik maksimumdan büyükse, diğer ucu eşitle
+        if min_depth > max_depth:
+            if self.sender() == self.minDepthSpinBox:
+                self.maxDepthSpinBox.setValue(min_depth)
+            else:
+                self.minDepthSpinBox.setValue(max_depth)
+        
+        # Deprem verilerini filtrele
+        if self.earthquake_data is not None:
+            self.apply_earthquake_filter()
 
     def select_fault_line_file(self):
         """Diri fay hatları shapefile'ını seç"""
@@ -1180,10 +2806,12 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         )
         
         if file_path and os.path.exists(file_path):
+            self.fault_line_file_path = file_path
             self.fault_line_layer = self.load_fault_line_layer(file_path)
             if self.fault_line_layer:
                 self.faultLineFileEdit.setText(file_path)
                 self.update_fault_lines()
+                self.start_fault_distance()
 
     def load_fault_line_layer(self, file_path):
         """Diri fay hatları layer'ını yükle"""
@@ -1266,6 +2894,7 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
             if self.iface and self.iface.mapCanvas():
                 self.iface.mapCanvas().refresh()
 
+    @monitor.timed('faylar.guncelleme')
     def update_fault_lines(self):
         """Seçili il, ilçe ve buffer mesafesine göre fay hatlarını güncelle"""
         try:
@@ -1298,8 +2927,8 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
             ilce = self.ilceComboBox.currentText()
             
             # Layer ismi için il ve ilçe adlarını düzenle
-            il_eng = self.normalize_text(il).lower() if il else ""
-            ilce_eng = self.normalize_text(ilce).lower() if ilce else ""
+            il_eng = name_key(il) if il else ""
+            ilce_eng = name_key(ilce) if ilce else ""
             layer_name = f"{il_eng}_{ilce_eng}_diri_faylar" if ilce else f"{il_eng}_diri_faylar"
 
             # Seçili alanın geometrisini al - optimize edilmiş şekilde
@@ -1430,6 +3059,13 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
             if not source_layer.isValid():
                 raise Exception("Kaynak shapefile yüklenemedi")
 
+            # Depodaki katman zaten hedef koordinat sisteminde ve R-tree indeksli
+            if source_layer.crs() == self.target_crs and source_layer.dataProvider().storageType() == 'GPKG':
+                source_layer.setName("yerlesim_noktalari")
+                self.settlement_layer = source_layer
+                self.setup_settlement_fields(source_layer)
+                return
+
             # Memory layer oluştur
             uri = f"Point?crs={self.target_crs.authid()}"
             memory_layer = QgsVectorLayer(uri, "yerlesim_noktalari", "memory")
@@ -1477,36 +3113,7 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
             memory_layer.dataProvider().createSpatialIndex()
             
             self.settlement_layer = memory_layer
-            
-            # Sütunları ComboBox'lara ekle
-            fields = memory_layer.fields()
-            field_names = [field.name() for field in fields]
-            
-            self.settlementIlColumnComboBox.clear()
-            self.settlementIlceColumnComboBox.clear()
-            self.settlementIlColumnComboBox.addItems(field_names)
-            self.settlementIlceColumnComboBox.addItems(field_names)
-            
-            # Varsayılan sütunları seç
-            il_index = self.settlementIlColumnComboBox.findText("Il_Adi")
-            ilce_index = self.settlementIlceColumnComboBox.findText("Ilce_Adi")
-            if il_index >= 0:
-                self.settlementIlColumnComboBox.setCurrentIndex(il_index)
-            if ilce_index >= 0:
-                self.settlementIlceColumnComboBox.setCurrentIndex(ilce_index)
-            
-            # Alanları aktif hale getir
-            self.settlementIlColumnComboBox.setEnabled(True)
-            self.settlementIlceColumnComboBox.setEnabled(True)
-            self.settlementIlLabel.setEnabled(True)
-            self.settlementIlceLabel.setEnabled(True)
-            
-            # Yerleşim noktası mesafesi spinbox'ını aktif hale getir
-            # Sadece deprem verileri de yüklüyse aktif olacak
-            self.update_settlement_distance_spinbox()
-            
-            # İlk filtrelemeyi uygula
-            self.update_settlement_filter()
+            self.setup_settlement_fields(memory_layer)
             
             # Geçici layer'ı temizle
             del source_layer
@@ -1522,6 +3129,39 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
             self.update_settlement_distance_spinbox()
             return None
 
+    def setup_settlement_fields(self, layer):
+        """Yerleşim katmanı sütunlarını listele ve ilgili alanları aktif hale getir"""
+        # Sütunları ComboBox'lara ekle
+        fields = layer.fields()
+        field_names = [field.name() for field in fields]
+        
+        self.settlementIlColumnComboBox.clear()
+        self.settlementIlceColumnComboBox.clear()
+        self.settlementIlColumnComboBox.addItems(field_names)
+        self.settlementIlceColumnComboBox.addItems(field_names)
+        
+        # Varsayılan sütunları seç
+        il_index = self.settlementIlColumnComboBox.findText("Il_Adi")
+        ilce_index = self.settlementIlceColumnComboBox.findText("Ilce_Adi")
+        if il_index >= 0:
+            self.settlementIlColumnComboBox.setCurrentIndex(il_index)
+        if ilce_index >= 0:
+            self.settlementIlceColumnComboBox.setCurrentIndex(ilce_index)
+        
+        # Alanları aktif hale getir
+        self.settlementIlColumnComboBox.setEnabled(True)
+        self.settlementIlceColumnComboBox.setEnabled(True)
+        self.settlementIlLabel.setEnabled(True)
+        self.settlementIlceLabel.setEnabled(True)
+        
+        # Yerleşim noktası mesafesi spinbox'ını aktif hale getir
+        # Sadece deprem verileri de yüklüyse aktif olacak
+        self.update_settlement_distance_spinbox()
+        
+        # İlk filtrelemeyi uygula
+        self.update_settlement_filter()
+
+    @monitor.timed('yerlesim.guncelleme')
     def update_settlement_filter(self):
         """Seçili il ve ilçeye göre yerleşim noktalarını filtrele"""
         if not self.settlement_layer or not self.vector_layer:
@@ -1531,8 +3171,8 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
         ilce = self.ilceComboBox.currentText()
         
         # Layer ismini güncelle
-        il_eng = self.normalize_text(il).lower() if il else ""
-        ilce_eng = self.normalize_text(ilce).lower() if ilce else ""
+        il_eng = name_key(il) if il else ""
+        ilce_eng = name_key(ilce) if ilce else ""
         if il and ilce:
             layer_name = f"{il_eng}_{ilce_eng}_yerlesim_noktalari"
         elif il:
@@ -1689,5 +3329,182 @@ class EarthquakeAnalysisDialog(QtWidgets.QDialog, FORM_CLASS):
                         self.settlement_layer.isValid())
         
         self.settlementDistanceSpinBox.setEnabled(should_enable)
+        self.settlementExposureButton.setEnabled(should_enable and self.settlement_exposure_task is None)
         if not should_enable:
-            self.settlementDistanceSpinBox.setValue(0)
\ No newline at end of file
+            self.settlementDistanceSpinBox.setValue(0)
+
+    def start_settlement_exposure(self):
+        """Her yerleşim noktası için yakındaki depremleri arka plan görevinde say"""
+        if self.settlement_exposure_task is not None:
+            return
+        if self.earthquake_data is None or self.earthquake_xy_km is None:
+            return
+        if not self.settlement_layer or not self.settlement_layer.isValid():
+            return
+        
+        try:
+            with monitor.stage('yerlesim.etkilenim.hazirlik'):
+                # Yerleşimler katalogla aynı yerel km koordinatlarına çevrilir (alt küme filtresi dikkate alınmaz)
+                transform = QgsCoordinateTransform(
+                    self.settlement_layer.crs(), QgsCoordinateReferenceSystem('EPSG:4326'), QgsProject.instance()
+                )
+                request = QgsFeatureRequest().setSubsetOfAttributes([])
+                fids, lonlat = [], []
+                for feature in features_ignoring_subset(self.settlement_layer, request):
+                    if not feature.hasGeometry():
+                        continue
+                    point = transform.transform(feature.geometry().asPoint())
+                    fids.append(feature.id())
+                    lonlat.append((point.x(), point.y()))
+                if not fids:
+                    return
+                lonlat = np.array(lonlat, dtype=np.float64)
+                qx, qy = local_km_coordinates(lonlat[:, 0], lonlat[:, 1], self.projection_origin)
+                
+                # Arayüzdeki öznitelik filtreleri ve eşik magnitüdü uygulanır
+                magnitudes = self.earthquake_data[self.magnitude_column()].values
+                mask = self.current_attribute_mask(self.earthquake_data)
+                mask &= magnitudes >= self.settlementMagnitudeSpinBox.value()
+                ex = self.earthquake_xy_km[0][mask]
+                ey = self.earthquake_xy_km[1][mask]
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Hata",
+                f"Yerleşim etkilenimi hesabı başlatılamadı: {str(e)}",
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+        
+        monitor.count('yerlesim.etkilenim.nokta', len(fids))
+        monitor.count('yerlesim.etkilenim.deprem', len(ex))
+        self.settlement_exposure_fids = (self.settlement_layer.id(), np.array(fids, dtype=np.int64))
+        self.settlement_exposure_task = QgsTask.fromFunction(
+            "Yerleşim etkilenimi",
+            run_settlement_exposure_task,
+            qx,
+            qy,
+            ex,
+            ey,
+            magnitudes[mask],
+            self.settlementRadiusSpinBox.value(),
+            on_finished=self.on_settlement_exposure_finished
+        )
+        self.settlementExposureButton.setEnabled(False)
+        QgsApplication.taskManager().addTask(self.settlement_exposure_task)
+
+    def on_settlement_exposure_finished(self, exception, result=None):
+        """Yerleşim etkilenimi görevi bittiğinde çağrılır"""
+        self.settlement_exposure_task = None
+        self.update_settlement_distance_spinbox()
+        
+        if exception is not None:
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Hata",
+                f"Yerleşim etkilenimi hesabı sırasında hata oluştu: {str(exception)}",
+                QtWidgets.QMessageBox.Ok
+            )
+            return
+        
+        # Görev iptal edildiyse veya yerleşim katmanı bu sırada değiştiyse sonucu kullanma
+        if result is None or not self.settlement_layer or not self.settlement_layer.isValid():
+            return
+        layer_id, fids = self.settlement_exposure_fids
+        if layer_id != self.settlement_layer.id():
+            return
+        
+        try:
+            with monitor.stage('yerlesim.etkilenim.yazma'):
+                self.apply_settlement_exposure(fids, result)
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Hata",
+                f"Yerleşim etkilenimi yazılırken hata oluştu: {str(e)}",
+                QtWidgets.QMessageBox.Ok
+            )
+
+    def apply_settlement_exposure(self, fids, result):
+        """Deprem sayısı ve en büyük magnitüdü yerleşim bellek katmanının özniteliklerine yaz.
+
+        Proje deposundaki (GeoPackage) katman yeniden kullanılıyorsa önce bellek katmanına kopyalanır;
+        depo değişmez ve katmanda açık düzenleme oturumu kalmaz.
+        """
+        layer = self.settlement_layer
+        if layer.dataProvider().name() != 'memory':
+            layer, fid_map = self.copy_settlement_layer_to_memory(layer)
+            fids = np.array([fid_map[int(fid)] for fid in fids], dtype=np.int64)
+        
+        new_fields = [
+            QgsField(name, field_type)
+            for name, field_type in (('deprem_sayisi', QVariant.Int), ('en_buyuk_m', QVariant.Double))
+            if layer.fields().indexOf(name) < 0
+        ]
+        if new_fields:
+            layer.dataProvider().addAttributes(new_fields)
+            layer.updateFields()
+        
+        count_index = layer.fields().indexOf('deprem_sayisi')
+        magnitude_index = layer.fields().indexOf('en_buyuk_m')
+        changes = {
+            int(fid): {
+                count_index: int(count),
+                magnitude_index: None if np.isnan(magnitude) else float(magnitude)
+            }
+            for fid, count, magnitude in zip(fids, result['counts'], result['max_magnitude'])
+        }
+        layer.dataProvider().changeAttributeValues(changes)
+        layer.triggerRepaint()
+        
+        if self.iface:
+            exposed = int(np.count_nonzero(result['counts']))
+            self.iface.messageBar().pushMessage(
+                "Yerleşim Etkilenimi",
+                f"{len(fids)} yerleşimden {exposed} tanesinin yakınında deprem var "
+                f"(deprem_sayisi, en_buyuk_m alanları güncellendi).",
+                level=Qgis.Info,
+                duration=5
+            )
+
+    def copy_settlement_layer_to_memory(self, layer):
+        """Yerleşim katmanını tüm nesneleriyle bellek katmanına kopyala ve haritada onunla değiştir.
+
+        Alt küme filtresi ve görünüm korunur. (bellek katmanı, kaynak fid -> yeni fid) döndürür.
+        """
+        memory_layer = QgsVectorLayer(f"Point?crs={layer.crs().authid()}", layer.name(), "memory")
+        if not memory_layer.isValid():
+            raise Exception("Memory layer oluşturulamadı")
+        provider = memory_layer.dataProvider()
+        provider.addAttributes(layer.fields())
+        memory_layer.updateFields()
+        
+        source_fids, features = [], []
+        for feature in features_ignoring_subset(layer, QgsFeatureRequest()):
+            new_feature = QgsFeature(memory_layer.fields())
+            new_feature.setAttributes(feature.attributes())
+            new_feature.setGeometry(feature.geometry())
+            source_fids.append(feature.id())
+            features.append(new_feature)
+        ok, added = provider.addFeatures(features)
+        if not ok:
+            raise Exception("Yerleşim noktaları bellek katmanına kopyalanamadı")
+        memory_layer.updateExtents()
+        provider.createSpatialIndex()
+        fid_map = {source_fid: feature.id() for source_fid, feature in zip(source_fids, added)}
+        
+        memory_layer.setRenderer(layer.renderer().clone())
+        memory_layer.setScaleBasedVisibility(layer.hasScaleBasedVisibility())
+        memory_layer.setSubsetString(layer.subsetString())
+        
+        # Depo katmanı haritadan kaldırılır; bellek katmanı aynı konuma eklenir
+        root = QgsProject.instance().layerTreeRoot()
+        node = root.findLayer(layer.id())
+        self.settlement_layer = memory_layer
+        if node is not None:
+            parent = node.parent()
+            position = parent.children().index(node)
+            QgsProject.instance().addMapLayer(memory_layer, False)
+            parent.insertLayer(position, memory_layer)
+            QgsProject.instance().removeMapLayer(layer.id())
+        return memory_layer, fid_map
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+from qgis.PyQt.QtCore import Qt, pyqtSignal
+from qgis.PyQt.QtGui import QColor
+from qgis.core import QgsWkbTypes
+from qgis.gui import QgsMapTool, QgsRubberBand
+
+
+class ProfileMapTool(QgsMapTool):
+    """Haritada iki tıklamayla derinlik kesiti hattı çizen araç (sağ tık iptal eder)"""
+    profileDrawn = pyqtSignal(object, object)  # Başlangıç ve bitiş noktası (tuval koordinat sisteminde)
+
+    def __init__(self, canvas):
+        super(ProfileMapTool, self).__init__(canvas)
+        self.start_point = None
+        self.rubber_band = QgsRubberBand(canvas, QgsWkbTypes.LineGeometry)
+        self.rubber_band.setColor(QColor(0, 90, 180, 200))
+        self.rubber_band.setWidth(2)
+
+    def canvasPressEvent(self, event):
+        if event.button() == Qt.RightButton:
+            self.reset()
+            return
+
+        point = self.toMapCoordinates(event.pos())
+        if self.start_point is None:
+            # İlk tıklama: hattın başlangıcı
+            self.start_point = point
+            self.rubber_band.reset(QgsWkbTypes.LineGeometry)
+            self.rubber_band.addPoint(point)
+            self.rubber_band.addPoint(point)
+        else:
+            # İkinci tıklama: hat tamamlandı, çizim haritada kalır
+            start = self.start_point
+            self.start_point = None
+            self.rubber_band.movePoint(point)
+            self.profileDrawn.emit(start, point)
+
+    def canvasMoveEvent(self, event):
+        if self.start_point is not None:
+            self.rubber_band.movePoint(self.toMapCoordinates(event.pos()))
+
+    def reset(self):
+        """Çizimi temizle"""
+        self.start_point = None
+        self.rubber_band.reset(QgsWkbTypes.LineGeometry)
+
+    def deactivate(self):
+        self.reset()
+        super(ProfileMapTool, self).deactivate()
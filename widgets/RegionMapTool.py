@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import math
+
+from qgis.PyQt.QtCore import Qt, pyqtSignal
+from qgis.PyQt.QtGui import QColor
+from qgis.core import QgsGeometry, QgsPointXY, QgsRectangle, QgsWkbTypes
+from qgis.gui import QgsMapTool, QgsRubberBand
+
+
+class RegionMapTool(QgsMapTool):
+    """Haritada çokgen, dikdörtgen veya daire bölge çizen araç.
+
+    Çokgen: sol tık köşe ekler, sağ tık bitirir. Dikdörtgen ve daire: iki tıklama
+    (köşe-köşe / merkez-çevre). Tamamlanınca regionDrawn(mod, noktalar) yayılır.
+    """
+    regionDrawn = pyqtSignal(str, object)
+
+    POLYGON = 'polygon'
+    RECTANGLE = 'rectangle'
+    CIRCLE = 'circle'
+
+    def __init__(self, canvas, mode):
+        super(RegionMapTool, self).__init__(canvas)
+        self.mode = mode
+        self.points = []
+        self.rubber_band = QgsRubberBand(canvas, QgsWkbTypes.PolygonGeometry)
+        self.rubber_band.setColor(QColor(0, 90, 180, 200))
+        self.rubber_band.setFillColor(QColor(0, 90, 180, 40))
+        self.rubber_band.setWidth(2)
+
+    def preview_geometry(self, points):
+        """Çizim sırasındaki önizleme geometrisi"""
+        if self.mode == self.RECTANGLE:
+            return QgsGeometry.fromRect(QgsRectangle(points[0], points[-1]))
+        if self.mode == self.CIRCLE:
+            center, edge = points[0], points[-1]
+            radius = math.hypot(edge.x() - center.x(), edge.y() - center.y())
+            return QgsGeometry.fromPointXY(center).buffer(radius, 32)
+        return QgsGeometry.fromPolygonXY([points])
+
+    def canvasPressEvent(self, event):
+        point = self.toMapCoordinates(event.pos())
+
+        if event.button() == Qt.RightButton:
+            # Çokgen için sağ tık çizimi bitirir, diğer modlarda iptal eder
+            if self.mode == self.POLYGON and len(self.points) >= 3:
+                points = list(self.points)
+                self.points = []
+                self.regionDrawn.emit(self.mode, points)
+            else:
+                self.reset()
+            return
+
+        self.points.append(QgsPointXY(point))
+        if self.mode != self.POLYGON and len(self.points) == 2:
+            points = list(self.points)
+            self.points = []
+            self.rubber_band.setToGeometry(self.preview_geometry(points), None)
+            self.regionDrawn.emit(self.mode, points)
+
+    def canvasMoveEvent(self, event):
+        if not self.points:
+            return
+        points = self.points + [QgsPointXY(self.toMapCoordinates(event.pos()))]
+        if self.mode == self.POLYGON and len(points) < 3:
+            return
+        self.rubber_band.setToGeometry(self.preview_geometry(points), None)
+
+    def reset(self):
+        """Çizimi temizle"""
+        self.points = []
+        self.rubber_band.reset(QgsWkbTypes.PolygonGeometry)
+
+    def deactivate(self):
+        self.reset()
+        super(RegionMapTool, self).deactivate()